@@ -34,6 +34,20 @@ class Settings(BaseSettings):
     postgres_port: int = 5432
     database_url: str | None = None
 
+    # Pool de connexions (dimensionné pour les fan-out asyncio.gather des stats)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    # Ping (aller-retour supplémentaire) à chaque emprunt d'une connexion ;
+    # désactivable si db_pool_recycle est inférieur au délai d'inactivité
+    # après lequel le serveur ou un proxy coupe les connexions.
+    db_pool_pre_ping: bool = True
+    db_query_cache_size: int = 1200
+    # Requêtes préparées conservées par connexion asyncpg (0 derrière PgBouncer
+    # en mode transaction, qui ne partage pas les statements entre connexions)
+    db_prepared_statement_cache_size: int = 500
+
     # JWT
     jwt_secret_key: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
@@ -63,8 +77,17 @@ class Settings(BaseSettings):
 
     @property
     def database_url_async(self) -> str:
-        """Retourne l'URL de connexion PostgreSQL pour asyncpg."""
+        """Retourne l'URL de connexion PostgreSQL pour asyncpg.
+
+        Une ``DATABASE_URL`` sans pilote explicite (``postgresql://``,
+        ``postgres://``) ou avec un pilote synchrone (``+psycopg2``) est
+        réécrite en ``postgresql+asyncpg://`` : le moteur async ne doit pas
+        retomber sur un pilote bloquant.
+        """
         if self.database_url:
+            scheme, sep, rest = self.database_url.partition("://")
+            if sep and scheme.split("+")[0] in ("postgres", "postgresql"):
+                return f"postgresql+asyncpg://{rest}"
             return self.database_url
         return (
             f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
@@ -0,0 +1,64 @@
+"""
+Cache applicatif
+================
+
+Cache mémoire à durée de vie (TTL) pour les lectures fréquentes et tolérantes
+à un léger retard (listes publiques, statistiques).
+
+Le cache est local au processus : chaque worker uvicorn possède le sien et
+une invalidation ne concerne que le worker qui a effectué l'écriture. Les
+autres workers se resynchronisent au plus tard à l'expiration du TTL.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """Cache clé → valeur avec expiration par entrée et éviction LRU."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Retourne la valeur en cache, ou None si absente ou expirée."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Enregistre une valeur pour ``ttl`` secondes."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Supprime toutes les entrées des espaces de noms donnés."""
+        prefixes = tuple(f"{namespace}:" for namespace in namespaces)
+        for key in [key for key in self._entries if key.startswith(prefixes)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Vide entièrement le cache."""
+        self._entries.clear()
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """Construit une clé ``<namespace>:<md5 des paramètres>``."""
+    payload = json.dumps(parts, default=str, sort_keys=True)
+    return f"{namespace}:{hashlib.md5(payload.encode()).hexdigest()}"
+
+
+# Instance partagée par les services
+cache = TTLCache()
@@ -55,6 +55,7 @@ async def paginate(
     pagination: PaginationParams,
     model_class: type,
     schema_class: type | None = None,
+    as_mappings: bool = False,
 ) -> dict:
     """
     Pagine une requête SQLAlchemy.
@@ -65,6 +66,9 @@ async def paginate(
         pagination: Paramètres de pagination.
         model_class: Classe du modèle pour le tri.
         schema_class: Classe Pydantic optionnelle pour la conversion des items.
+        as_mappings: Pour une requête Core (colonnes), renvoie les lignes
+            brutes (``RowMapping``) sans hydratation ORM ni validation
+            Pydantic — à servir via ``RowJSONResponse``.
 
     Returns:
         Dictionnaire avec items, total, page, limit, pages.
@@ -88,13 +92,16 @@ async def paginate(
 
     # Exécuter la requête
     result = await db.execute(query)
-    items = result.scalars().all()
-
-    # Convertir en schémas Pydantic si spécifié
-    if schema_class is not None:
-        items = [schema_class.model_validate(item) for item in items]
+    if as_mappings:
+        items = list(result.mappings().all())
     else:
-        items = list(items)
+        items = result.scalars().all()
+
+        # Convertir en schémas Pydantic si spécifié
+        if schema_class is not None:
+            items = [schema_class.model_validate(item) for item in items]
+        else:
+            items = list(items)
 
     # Calculer le nombre de pages
     pages = ceil(total / pagination.limit) if pagination.limit > 0 else 0
@@ -0,0 +1,41 @@
+"""
+Réponses HTTP
+=============
+
+Classes de réponse partagées pour les endpoints à fort volume.
+"""
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Sérialise les types qu'orjson ne gère pas nativement."""
+    # RowMapping (result.mappings()) n'est pas un dict : conversion à la volée
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+
+class RowJSONResponse(JSONResponse):
+    """
+    Réponse JSON sérialisée par orjson.
+
+    Accepte directement des lignes SQLAlchemy (``RowMapping``) : elles sont
+    écrites côté C par orjson sans passer par des dicts intermédiaires ni par
+    la validation Pydantic du ``response_model``, qui ne sert plus alors qu'à
+    documenter le schéma dans l'OpenAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
@@ -13,12 +13,28 @@ from sqlalchemy.orm import DeclarativeBase
 from app.config import settings
 
 # Création du moteur async
+# Le pool (pool_size + max_overflow) doit couvrir les requêtes lancées en
+# parallèle par une même requête HTTP (asyncio.gather) multipliées par le
+# nombre de requêtes concurrentes, sinon les coroutines attendent une connexion.
+# pool_pre_ping coûte un aller-retour par emprunt : pool_recycle renouvelle
+# déjà les connexions avant les coupures d'inactivité, le ping est réglable.
+# query_cache_size borne le cache de compilation SQLAlchemy : il doit contenir
+# toutes les variantes de requêtes des services (filtres optionnels inclus).
+# prepared_statement_cache_size (argument DBAPI du dialecte asyncpg) garde les
+# statements préparés côté serveur par connexion : une requête déjà compilée
+# par SQLAlchemy n'est alors ni re-parsée ni re-planifiée par PostgreSQL.
 engine = create_async_engine(
     settings.database_url_async,
     echo=settings.app_debug,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=settings.db_query_cache_size,
+    connect_args={
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    },
 )
 
 # Factory de sessions async
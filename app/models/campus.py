@@ -7,9 +7,20 @@ Modèles SQLAlchemy pour la gestion des campus.
 
 from datetime import date
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
 from app.models.base import TimestampMixin, UUIDMixin
@@ -69,12 +80,35 @@ class Campus(Base, UUIDMixin, TimestampMixin):
         lazy="selectin",
     )
 
+    @staticmethod
+    def normalize_code(code: str | None) -> str | None:
+        """Forme canonique d'un code campus (majuscules)."""
+        return code.upper() if code else code
+
+    @validates("code")
+    def _validate_code(self, key: str, code: str | None) -> str | None:
+        """Normalise le code à chaque affectation ORM."""
+        return self.normalize_code(code)
+
     @property
     def country_name_fr(self) -> str | None:
         """Nom du pays en français (résolu depuis la relation)."""
         return self.country_rel.name_fr if self.country_rel else None
 
 
+# Unicité du code insensible à la casse ; sert aussi get_campus_by_code,
+# qui compare sur upper(code) (migration 043).
+Index("uq_campuses_code_upper", func.upper(Campus.code), unique=True)
+
+# Un seul siège principal (migration 044)
+Index(
+    "uq_campuses_single_headquarters",
+    Campus.is_headquarters,
+    unique=True,
+    postgresql_where=Campus.is_headquarters,
+)
+
+
 class CampusPartner(Base):
     """Table de liaison campus-partenaires."""
 
@@ -92,6 +126,16 @@ class CampusTeam(Base, UUIDMixin):
     """Membre de l'équipe d'un campus."""
 
     __tablename__ = "campus_team"
+    __table_args__ = (
+        # Un utilisateur n'est actif qu'une fois par équipe (migration 041)
+        Index(
+            "uq_campus_team_active_user",
+            "campus_id",
+            "user_external_id",
+            unique=True,
+            postgresql_where=text("active"),
+        ),
+    )
 
     campus_id: Mapped[str] = mapped_column(
         ForeignKey("campuses.id", ondelete="CASCADE"), nullable=False
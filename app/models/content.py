@@ -20,7 +20,7 @@ from sqlalchemy import (
     Text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.database import Base
 from app.models.base import PublicationStatus, TimestampMixin, UUIDMixin
@@ -139,6 +139,10 @@ class Event(Base, UUIDMixin, TimestampMixin):
         default=PublicationStatus.DRAFT,
     )
 
+    # Nombre d'inscriptions non annulées, renseigné par les listes
+    # (``with_expression``) ; None si la requête ne le calcule pas.
+    registrations_count: Mapped[int | None] = query_expression()
+
     # Relations
     registrations: Mapped[list["EventRegistration"]] = relationship(
         "EventRegistration",
@@ -259,6 +263,10 @@ class News(Base, UUIDMixin, TimestampMixin):
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     visible_from: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
+    # Tags sérialisés en JSON par PostgreSQL, renseignés par les listes
+    # publiques (``with_expression``) ; None si la requête ne les calcule pas.
+    tags_json: Mapped[list[dict] | None] = query_expression()
+
     # Relations
     tags: Mapped[list["Tag"]] = relationship(
         "Tag", secondary="news_tags", back_populates="news_items"
@@ -5,18 +5,21 @@ Router Admin - Candidatures
 Endpoints CRUD pour la gestion des candidatures.
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from app.core.dependencies import CurrentUser, DbSession, PermissionChecker
 from app.core.exceptions import NotFoundException
 from app.core.pagination import PaginationParams, paginate
+from app.core.responses import RowJSONResponse
 from app.models.application import Application, SubmittedApplicationStatus
 from app.schemas.application import (
     ApplicationCreate,
+    ApplicationDashboard,
     ApplicationDegreeCreate,
     ApplicationDegreeRead,
     ApplicationDegreeUpdate,
@@ -52,19 +55,45 @@ async def list_applications(
     call_id: str | None = Query(None, description="Filtrer par appel"),
     status: SubmittedApplicationStatus | None = Query(None, description="Filtrer par statut"),
     program_id: str | None = Query(None, description="Filtrer par programme"),
+    after_submitted_at: datetime | None = Query(
+        None, description="Curseur : date de soumission de la dernière candidature reçue"
+    ),
+    after_id: str | None = Query(
+        None, description="Curseur : ID de la dernière candidature reçue"
+    ),
     _: bool = Depends(PermissionChecker("applications.view")),
 ) -> dict:
-    """Liste les candidatures avec pagination et filtres."""
+    """
+    Liste les candidatures avec pagination et filtres.
+
+    Pour un défilement profond, passer le curseur (after_submitted_at,
+    after_id) de la dernière ligne reçue plutôt qu'un numéro de page élevé.
+    """
     service = ApplicationService(db)
+    after = (after_submitted_at, after_id) if after_submitted_at and after_id else None
+    if after:
+        # Le curseur remplace l'OFFSET
+        pagination.page = 1
     query = await service.get_applications(
         search=search,
         call_id=call_id,
         status=status,
         program_id=program_id,
+        after=after,
     )
     return await paginate(db, query, pagination, Application, ApplicationRead)
 
 
+@router.get("/statistics/dashboard", response_model=ApplicationDashboard)
+async def get_dashboard(
+    current_user: CurrentUser,
+    call_id: str | None = Query(None, description="Filtrer les statistiques par appel"),
+    _: bool = Depends(PermissionChecker("applications.view")),
+) -> dict:
+    """Statistiques des candidatures et appels en cours (requêtes parallèles)."""
+    return await ApplicationService.dashboard_bundle(call_id)
+
+
 @router.get("/statistics", response_model=ApplicationStatistics)
 async def get_statistics(
     db: DbSession,
@@ -78,7 +107,11 @@ async def get_statistics(
     return ApplicationStatistics(**stats)
 
 
-@router.get("/statistics/extended", response_model=ExtendedApplicationStatistics)
+@router.get(
+    "/statistics/extended",
+    response_model=ExtendedApplicationStatistics,
+    response_class=RowJSONResponse,
+)
 async def get_extended_statistics(
     db: DbSession,
     current_user: CurrentUser,
@@ -87,7 +120,7 @@ async def get_extended_statistics(
     date_to: date | None = Query(None, description="Date de fin (YYYY-MM-DD)"),
     granularity: str = Query("month", description="Granularité: day, week, month"),
     _: bool = Depends(PermissionChecker("applications.view")),
-) -> ExtendedApplicationStatistics:
+) -> RowJSONResponse:
     """Récupère les statistiques étendues des candidatures."""
     from datetime import datetime
 
@@ -102,7 +135,38 @@ async def get_extended_statistics(
         date_to=date_to_dt,
         granularity=granularity,
     )
-    return ExtendedApplicationStatistics(**stats)
+    return RowJSONResponse(stats)
+
+
+@router.get("/statistics/by-call/export", response_class=StreamingResponse)
+async def export_statistics_by_call(
+    db: DbSession,
+    current_user: CurrentUser,
+    call_id: str | None = Query(None, description="Filtrer par appel"),
+    date_from: date | None = Query(None, description="Date de début (YYYY-MM-DD)"),
+    date_to: date | None = Query(None, description="Date de fin (YYYY-MM-DD)"),
+    _: bool = Depends(PermissionChecker("applications.view")),
+) -> StreamingResponse:
+    """Exporte en CSV les statistiques des candidatures par appel."""
+    from datetime import datetime
+
+    # Convertir les dates en datetime pour le service
+    date_from_dt = datetime.combine(date_from, datetime.min.time()) if date_from else None
+    date_to_dt = datetime.combine(date_to, datetime.max.time()) if date_to else None
+
+    export_service = ApplicationExportService(db)
+    csv_buffer, filename = await export_service.build_stats_by_call_csv(
+        call_id=call_id,
+        date_from=date_from_dt,
+        date_to=date_to_dt,
+    )
+    return StreamingResponse(
+        csv_buffer,
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        # Fermer le fichier temporaire (éventuellement sur disque) après envoi
+        background=BackgroundTask(csv_buffer.close),
+    )
 
 
 @router.get("/export", response_class=StreamingResponse)
@@ -13,6 +13,8 @@ from app.core.pagination import PaginationParams, paginate
 from app.models.campus import Campus
 from app.schemas.campus import (
     CampusCreate,
+    CampusMediaLibraryBulkCreate,
+    CampusMediaLibraryBulkResult,
     CampusMediaLibraryCreate,
     CampusPartnerCreate,
     CampusPartnerRead,
@@ -168,9 +170,8 @@ async def get_campus_team(
     """Récupère l'équipe d'un campus."""
     service = CampusService(db)
 
-    # Vérifier que le campus existe
-    campus = await service.get_campus_by_id(campus_id)
-    if not campus:
+    # Vérifier que le campus existe (EXISTS, sans charger l'équipe)
+    if not await service.campus_exists(campus_id):
         raise NotFoundException("Campus non trouvé")
 
     query = await service.get_campus_team(campus_id=campus_id, active=active)
@@ -189,11 +190,7 @@ async def add_campus_team_member(
     """Ajoute un membre à l'équipe d'un campus."""
     service = CampusService(db)
 
-    # Vérifier que le campus existe
-    campus = await service.get_campus_by_id(campus_id)
-    if not campus:
-        raise NotFoundException("Campus non trouvé")
-
+    # create_team_member vérifie lui-même l'existence du campus
     team_member = await service.create_team_member(
         campus_id=campus_id,
         user_external_id=team_data.user_external_id,
@@ -218,9 +215,8 @@ async def update_campus_team_member(
     """Met à jour un membre de l'équipe d'un campus."""
     service = CampusService(db)
 
-    # Vérifier que le campus existe
-    campus = await service.get_campus_by_id(campus_id)
-    if not campus:
+    # Vérifier que le campus existe (EXISTS, sans charger l'équipe)
+    if not await service.campus_exists(campus_id):
         raise NotFoundException("Campus non trouvé")
 
     update_dict = team_data.model_dump(exclude_unset=True)
@@ -238,9 +234,8 @@ async def delete_campus_team_member(
     """Supprime un membre de l'équipe d'un campus."""
     service = CampusService(db)
 
-    # Vérifier que le campus existe
-    campus = await service.get_campus_by_id(campus_id)
-    if not campus:
+    # Vérifier que le campus existe (EXISTS, sans charger l'équipe)
+    if not await service.campus_exists(campus_id):
         raise NotFoundException("Campus non trouvé")
 
     await service.delete_team_member(member_id)
@@ -342,6 +337,22 @@ async def add_album_to_campus(
     return MessageResponse(message="Album ajouté à la médiathèque avec succès")
 
 
+@router.post("/{campus_id}/media-library/bulk", response_model=CampusMediaLibraryBulkResult)
+async def add_albums_to_campus(
+    campus_id: str,
+    albums_data: CampusMediaLibraryBulkCreate,
+    db: DbSession,
+    current_user: CurrentUser,
+    _: bool = Depends(PermissionChecker("campuses.edit")),
+) -> CampusMediaLibraryBulkResult:
+    """Ajoute plusieurs albums à la médiathèque d'un campus en une requête."""
+    service = CampusService(db)
+    added, duplicates = await service.add_albums_to_campus(
+        campus_id, albums_data.album_external_ids
+    )
+    return CampusMediaLibraryBulkResult(added=added, duplicates=duplicates)
+
+
 @router.delete("/{campus_id}/media-library/{album_id}", response_model=MessageResponse)
 async def remove_album_from_campus(
     campus_id: str,
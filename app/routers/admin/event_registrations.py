@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, Query, status
 
 from app.core.dependencies import CurrentUser, DbSession, PermissionChecker
 from app.core.exceptions import NotFoundException
+from app.core.responses import RowJSONResponse
 from app.models.content import RegistrationStatus
 from app.schemas.common import MessageResponse
 from app.schemas.content import (
@@ -22,17 +23,21 @@ from app.services.content_service import ContentService
 router = APIRouter(prefix="/event-registrations", tags=["Event Registrations"])
 
 
-@router.get("", response_model=list[EventRegistrationRead])
+@router.get(
+    "",
+    response_model=list[EventRegistrationRead],
+    response_class=RowJSONResponse,
+)
 async def list_event_registrations(
     db: DbSession,
     current_user: CurrentUser,
     event_id: str | None = Query(None, description="ID de l'événement (optionnel)"),
     status: RegistrationStatus | None = Query(None, description="Filtrer par statut"),
     _: bool = Depends(PermissionChecker("events.view")),
-) -> list:
+) -> RowJSONResponse:
     """Liste les inscriptions, optionnellement filtrées par événement."""
     service = ContentService(db)
-    return await service.get_event_registrations(event_id, status)
+    return RowJSONResponse(await service.get_event_registrations(event_id, status))
 
 
 @router.get("/{registration_id}", response_model=EventRegistrationRead)
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, Query, status
 from app.core.dependencies import CurrentUser, DbSession, PermissionChecker
 from app.core.exceptions import NotFoundException
 from app.core.pagination import PaginationParams, paginate
+from app.core.responses import RowJSONResponse
 from app.models.base import PublicationStatus
 from app.models.content import Event, EventType
 from app.schemas.common import IdResponse, MessageResponse
@@ -95,16 +96,20 @@ async def reorder_event_albums(
     return {"albums": albums}
 
 
-@router.get("/statistics", response_model=EventStatistics)
+@router.get(
+    "/statistics",
+    response_model=EventStatistics,
+    response_class=RowJSONResponse,
+)
 async def get_events_statistics(
     db: DbSession,
     current_user: CurrentUser,
     months: int = Query(12, ge=1, le=24, description="Nombre de mois pour la timeline"),
     _: bool = Depends(PermissionChecker("events.view")),
-) -> EventStatistics:
+) -> RowJSONResponse:
     """Récupère les statistiques des événements."""
     service = ContentService(db)
-    return await service.get_events_statistics(months=months)
+    return RowJSONResponse(await service.get_events_statistics(months=months))
 
 
 @router.get("", response_model=dict)
@@ -118,10 +123,23 @@ async def list_events(
     from_date: datetime | None = Query(None, description="Date de début"),
     to_date: datetime | None = Query(None, description="Date de fin"),
     campus_id: str | None = Query(None, description="Filtrer par campus"),
+    after_start_date: datetime | None = Query(
+        None, description="Curseur : date de début du dernier événement reçu"
+    ),
+    after_id: str | None = Query(None, description="Curseur : ID du dernier événement reçu"),
     _: bool = Depends(PermissionChecker("events.view")),
 ) -> dict:
-    """Liste les événements avec pagination et filtres."""
+    """
+    Liste les événements avec pagination et filtres.
+
+    Pour un défilement profond, passer le curseur (after_start_date, after_id)
+    de la dernière ligne reçue plutôt qu'un numéro de page élevé.
+    """
     service = ContentService(db)
+    after = (after_start_date, after_id) if after_start_date and after_id else None
+    if after:
+        # Le curseur remplace l'OFFSET
+        pagination.page = 1
     query = await service.get_events(
         search=search,
         status=status,
@@ -129,6 +147,7 @@ async def list_events(
         from_date=from_date,
         to_date=to_date,
         campus_id=campus_id,
+        after=after,
     )
     return await paginate(db, query, pagination, Event, schema_class=EventRead)
 
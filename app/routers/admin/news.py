@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, Query, status
 from app.core.dependencies import CurrentUser, DbSession, PermissionChecker
 from app.core.exceptions import NotFoundException
 from app.core.pagination import PaginationParams, paginate
+from app.core.responses import RowJSONResponse
 from app.models.base import PublicationStatus
 from app.models.content import News, NewsHighlightStatus
 from app.schemas.common import IdResponse, MessageResponse
@@ -96,16 +97,20 @@ async def reorder_news_albums(
     return {"albums": albums}
 
 
-@router.get("/statistics", response_model=NewsStatistics)
+@router.get(
+    "/statistics",
+    response_model=NewsStatistics,
+    response_class=RowJSONResponse,
+)
 async def get_news_statistics(
     db: DbSession,
     current_user: CurrentUser,
     months: int = Query(6, ge=1, le=24, description="Nombre de mois pour la timeline"),
     _: bool = Depends(PermissionChecker("news.view")),
-) -> NewsStatistics:
+) -> RowJSONResponse:
     """Récupère les statistiques des actualités."""
     service = ContentService(db)
-    return await service.get_news_statistics(months=months)
+    return RowJSONResponse(await service.get_news_statistics(months=months))
 
 
 @router.get("", response_model=dict)
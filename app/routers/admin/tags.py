@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, Query, status
 from app.core.dependencies import CurrentUser, DbSession, PermissionChecker
 from app.core.exceptions import NotFoundException
 from app.core.pagination import PaginationParams, paginate
+from app.core.responses import RowJSONResponse
 from app.models.content import Tag
 from app.schemas.common import IdResponse, MessageResponse
 from app.schemas.content import (
@@ -25,18 +26,20 @@ from app.services.content_service import ContentService
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=dict, response_class=RowJSONResponse)
 async def list_tags(
     db: DbSession,
     current_user: CurrentUser,
     pagination: PaginationParams = Depends(),
     search: str | None = Query(None, description="Recherche sur nom ou slug"),
     _: bool = Depends(PermissionChecker("news.view")),
-) -> dict:
+) -> RowJSONResponse:
     """Liste les tags avec pagination et filtres."""
     service = ContentService(db)
     query = await service.get_tags(search=search)
-    return await paginate(db, query, pagination, Tag, TagRead)
+    return RowJSONResponse(
+        await paginate(db, query, pagination, Tag, as_mappings=True)
+    )
 
 
 # Route STATIQUE déclarée avant la route dynamique /{tag_id}.
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, Query
 
 from app.core.dependencies import DbSession
 from app.core.exceptions import NotFoundException
-from app.core.pagination import PaginationParams, paginate
+from app.core.pagination import PaginationParams
 from app.models.application import ApplicationCall, CallStatus, CallType
 from app.models.base import PublicationStatus
 from app.schemas.application import (
@@ -37,68 +37,60 @@ async def list_calls(
 ) -> dict:
     """Liste les appels à candidature publiés avec pagination et filtres."""
     service = ApplicationService(db)
-    query = await service.get_published_calls(
+    return await service.paginate_published_calls(
+        pagination,
         search=search,
         call_type=call_type,
         call_status=call_status,
         program_id=program_id,
         campus_id=campus_external_id,
     )
-    return await paginate(db, query, pagination, ApplicationCall, ApplicationCallPublic)
 
 
 @router.get("/ongoing", response_model=list[ApplicationCallPublic])
 async def list_ongoing_calls(
     db: DbSession,
     call_type: CallType | None = Query(None, description="Filtrer par type"),
-) -> list[ApplicationCall]:
+) -> list[ApplicationCallPublic]:
     """Liste les appels à candidature en cours."""
     service = ApplicationService(db)
-    query = await service.get_published_calls(
+    return await service.list_published_calls(
         call_type=call_type,
         call_status=CallStatus.ONGOING,
     )
-    result = await db.execute(query)
-    return list(result.scalars().all())
 
 
 @router.get("/upcoming", response_model=list[ApplicationCallPublic])
 async def list_upcoming_calls(
     db: DbSession,
     call_type: CallType | None = Query(None, description="Filtrer par type"),
-) -> list[ApplicationCall]:
+) -> list[ApplicationCallPublic]:
     """Liste les appels à candidature à venir."""
     service = ApplicationService(db)
-    query = await service.get_published_calls(
+    return await service.list_published_calls(
         call_type=call_type,
         call_status=CallStatus.UPCOMING,
     )
-    result = await db.execute(query)
-    return list(result.scalars().all())
 
 
 @router.get("/by-type/{call_type}", response_model=list[ApplicationCallPublic])
 async def list_calls_by_type(
     call_type: CallType,
     db: DbSession,
-) -> list[ApplicationCall]:
+) -> list[ApplicationCallPublic]:
     """Liste les appels à candidature publiés d'un type donné."""
     service = ApplicationService(db)
-    query = await service.get_published_calls(call_type=call_type)
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return await service.list_published_calls(call_type=call_type)
 
 
 @router.get("/by-project/{project_id}", response_model=list[ApplicationCallPublic])
 async def list_calls_by_project(
     project_id: str,
     db: DbSession,
-) -> list[ApplicationCall]:
+) -> list[ApplicationCallPublic]:
     """Liste les appels à candidature publiés associés à un projet."""
     service = ApplicationService(db)
-    query = await service.get_published_calls(project_id=project_id)
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return await service.list_published_calls(project_id=project_id)
 
 
 @router.get("/{slug}", response_model=ApplicationCallPublicWithDetails)
@@ -173,6 +165,7 @@ async def get_call_news(
     query = await content_service.get_news(
         status=PublicationStatus.PUBLISHED,
         call_id=call.id,
+        tags_as_json=True,
     )
     result = await db.execute(query)
     news_list = list(result.scalars().all())
@@ -39,9 +39,22 @@ async def list_events(
     to_date: datetime | None = Query(None, description="Date de fin"),
     campus_id: str | None = Query(None, description="Filtrer par campus"),
     upcoming: bool = Query(False, description="Seulement les événements à venir"),
+    after_start_date: datetime | None = Query(
+        None, description="Curseur : date de début du dernier événement reçu"
+    ),
+    after_id: str | None = Query(None, description="Curseur : ID du dernier événement reçu"),
 ) -> dict:
-    """Liste les événements publiés."""
+    """
+    Liste les événements publiés.
+
+    Pour un défilement profond, passer le curseur (after_start_date, after_id)
+    de la dernière ligne reçue plutôt qu'un numéro de page élevé.
+    """
     service = ContentService(db)
+    after = (after_start_date, after_id) if after_start_date and after_id else None
+    if after:
+        # Le curseur remplace l'OFFSET
+        pagination.page = 1
 
     # Si upcoming, filtrer à partir de maintenant
     if upcoming:
@@ -52,6 +65,7 @@ async def list_events(
         from_date=from_date,
         to_date=to_date,
         campus_id=campus_id,
+        after=after,
     )
     return await paginate(db, query, pagination, Event, schema_class=EventPublic)
 
@@ -77,19 +91,12 @@ async def register_to_event(
 ):
     """S'inscrit à un événement."""
     service = ContentService(db)
-
-    # Vérifier que l'événement existe et est publié
-    event = await service.get_event_by_id(event_id)
-    if not event or event.status != PublicationStatus.PUBLISHED:
-        raise NotFoundException("Événement non trouvé")
-
-    if not event.registration_required:
-        from app.core.exceptions import ValidationException
-        raise ValidationException("Cet événement n'accepte pas les inscriptions")
-
+    # Publication et ouverture aux inscriptions vérifiées par le service, sur
+    # la ligne verrouillée de l'événement
     return await service.register_to_event(
         event_id=event_id,
         email=registration_data.email,
+        public=True,
         last_name=registration_data.last_name,
         first_name=registration_data.first_name,
         phone=registration_data.phone,
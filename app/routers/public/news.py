@@ -5,6 +5,7 @@ Router Public - Actualités
 Endpoints publics pour les actualités.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from math import ceil
 
@@ -14,6 +15,7 @@ from sqlalchemy import func, or_, select
 from app.core.dependencies import DbSession
 from app.core.exceptions import NotFoundException
 from app.core.pagination import PaginationParams
+from app.database import async_session_maker
 from app.models.base import PublicationStatus
 from app.models.content import News
 from app.schemas.content import NewsPublicEnriched, NewsWithTags
@@ -44,10 +46,31 @@ async def list_news(
     project_id: str | None = Query(None, description="Filtrer par projet"),
     event_id: str | None = Query(None, description="Filtrer par événement"),
     call_id: str | None = Query(None, description="Filtrer par appel"),
+    after_published_at: datetime | None = Query(
+        None, description="Curseur : date de publication de la dernière actualité reçue"
+    ),
+    after_created_at: datetime | None = Query(
+        None, description="Curseur : date de création de la dernière actualité reçue"
+    ),
+    after_id: str | None = Query(None, description="Curseur : ID de la dernière actualité reçue"),
 ) -> dict:
-    """Liste les actualités publiées avec les noms des entités associées résolus."""
+    """
+    Liste les actualités publiées avec les noms des entités associées résolus.
+
+    Pour un défilement profond, passer le curseur (after_published_at,
+    after_created_at, after_id) de la dernière ligne reçue plutôt qu'un numéro
+    de page élevé.
+    """
     now = datetime.now(timezone.utc)
     service = ContentService(db)
+    after = (
+        (after_published_at, after_created_at, after_id)
+        if after_created_at and after_id
+        else None
+    )
+    if after:
+        # Le curseur remplace l'OFFSET
+        pagination.page = 1
     query = await service.get_news(
         status=PublicationStatus.PUBLISHED,
         tag_id=tag_id,
@@ -57,6 +80,8 @@ async def list_news(
         project_id=project_id,
         event_id=event_id,
         call_id=call_id,
+        tags_as_json=True,
+        after=after,
     )
 
     # Filtrer les actualités pas encore visibles
@@ -87,19 +112,23 @@ async def list_news(
     if call_id:
         count_query = count_query.where(News.call_external_id == call_id)
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
     # Appliquer la pagination
-    offset = (pagination.page - 1) * pagination.limit
-    query = query.offset(offset).limit(pagination.limit)
-
-    # Exécuter la requête
-    result = await db.execute(query)
-    news_list = result.scalars().all()
-
-    # Enrichir avec les noms des entités associées
-    enriched_items = await service.enrich_news_with_names(list(news_list))
+    query = query.offset(pagination.offset).limit(pagination.limit)
+
+    async def count_total() -> int:
+        # Session dédiée (une AsyncSession ne supporte pas deux requêtes
+        # simultanées) : le comptage occupe sa propre connexion du pool.
+        async with async_session_maker() as session:
+            return (await session.execute(count_query)).scalar() or 0
+
+    async def load_page() -> list[dict]:
+        result = await db.execute(query)
+        # Enrichir avec les noms des entités associées
+        return await service.enrich_news_with_names(list(result.scalars().all()))
+
+    # Comptage et page (+ résolution des noms) sont indépendants : exécutés en
+    # parallèle, la durée est max(comptage, page) au lieu de leur somme.
+    total, enriched_items = await asyncio.gather(count_total(), load_page())
 
     # Valider avec le schéma Pydantic
     items = [NewsPublicEnriched.model_validate(item) for item in enriched_items]
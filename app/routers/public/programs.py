@@ -65,6 +65,7 @@ async def get_program_news(
     query = await content_service.get_news(
         status=PublicationStatus.PUBLISHED,
         program_id=program.id,
+        tags_as_json=True,
     )
     result = await db.execute(query)
     news_list = list(result.scalars().all())
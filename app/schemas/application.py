@@ -713,6 +713,13 @@ class ApplicationStatistics(BaseModel):
     incomplete: int = 0
 
 
+class ApplicationDashboard(BaseModel):
+    """Vue d'ensemble : statistiques et appels en cours."""
+
+    statistics: ApplicationStatistics
+    ongoing_calls: list[ApplicationCallPublic]
+
+
 # =============================================================================
 # STATISTIQUES ÉTENDUES
 # =============================================================================
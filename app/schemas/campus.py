@@ -105,6 +105,21 @@ class CampusMediaLibraryCreate(BaseModel):
     album_external_id: str = Field(..., description="ID de l'album")
 
 
+class CampusMediaLibraryBulkCreate(BaseModel):
+    """Schéma pour l'ajout en masse d'albums à la médiathèque."""
+
+    album_external_ids: list[str] = Field(
+        ..., min_length=1, description="IDs des albums"
+    )
+
+
+class CampusMediaLibraryBulkResult(BaseModel):
+    """Résultat d'un ajout en masse d'albums."""
+
+    added: list[str]
+    duplicates: list[str]
+
+
 class CampusMediaLibraryRead(BaseModel):
     """Schéma pour la lecture d'une entrée médiathèque."""
 
@@ -275,6 +275,7 @@ class EventRead(EventBase):
     organizer_external_id: str | None
     album_external_id: str | None
     status: PublicationStatus
+    registrations_count: int | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -7,14 +7,17 @@ regroupe l'ensemble des documents soumis (CV, diplômes, pièces justificatives)
 ainsi qu'un fichier Excel récapitulant ses informations.
 """
 
+import codecs
 import csv
 import io
 import os
 import re
+import tempfile
 import unicodedata
 import zipfile
 from datetime import date, datetime
 from decimal import Decimal
+from typing import BinaryIO
 
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Font, PatternFill
@@ -78,6 +81,9 @@ EXPERIENCE_DURATION_LABELS: dict[ExperienceDuration, str] = {
     ExperienceDuration.MORE_THAN_10_YEARS: "Plus de 10 ans",
 }
 
+# Au-delà, le CSV produit par COPY est déversé sur disque plutôt qu'en mémoire.
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 _SECTION_FILL = PatternFill(start_color="1E3A8A", end_color="1E3A8A", fill_type="solid")
 
 
@@ -150,7 +156,11 @@ class ApplicationExportService:
             status=status,
             program_id=program_id,
         )
-        query = query.options(selectinload(Application.call))
+        query = query.options(
+            selectinload(Application.call).raiseload("*"),
+            selectinload(Application.degrees),
+            selectinload(Application.documents),
+        )
         result = await self.db.execute(query)
         applications = list(result.scalars().unique().all())
 
@@ -206,7 +216,10 @@ class ApplicationExportService:
             status=status,
             program_id=program_id,
         )
-        query = query.options(selectinload(Application.call))
+        query = query.options(
+            selectinload(Application.call).raiseload("*"),
+            selectinload(Application.documents),
+        )
         result = await self.db.execute(query)
         applications = list(result.scalars().unique().all())
 
@@ -305,6 +318,54 @@ class ApplicationExportService:
         filename = f"candidatures_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         return csv_buffer, filename
 
+    async def build_stats_by_call_csv(
+        self,
+        *,
+        call_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> tuple[BinaryIO, str]:
+        """Construit le CSV des statistiques par appel.
+
+        Les lignes ne sont pas décodées en objets Python : la requête est
+        exécutée via ``COPY (...) TO STDOUT`` sur la connexion asyncpg, et
+        PostgreSQL produit directement le CSV (mémoire bornée par un fichier
+        temporaire).
+
+        Args:
+            call_id, date_from, date_to: Mêmes filtres que les statistiques.
+
+        Returns:
+            Tuple (buffer CSV positionné au début, nom de fichier suggéré).
+        """
+        query = self.application_service.get_stats_by_call_query(
+            call_id=call_id,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        connection = await self.db.connection()
+        sql = str(
+            query.compile(
+                dialect=connection.dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        raw_connection = await connection.get_raw_connection()
+
+        csv_buffer = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        # BOM UTF-8 pour une ouverture correcte des accents dans Excel.
+        csv_buffer.write(codecs.BOM_UTF8)
+        await raw_connection.driver_connection.copy_from_query(
+            sql,
+            output=csv_buffer,
+            format="csv",
+            header=True,
+            delimiter=";",
+        )
+        csv_buffer.seek(0)
+        filename = f"statistiques_appels_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        return csv_buffer, filename
+
     def _unique_folder_name(
         self, application: Application, used_folders: set[str]
     ) -> str:
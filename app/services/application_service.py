@@ -5,14 +5,42 @@ Service Application
 Logique métier pour la gestion des appels à candidature et candidatures.
 """
 
-from datetime import datetime
-from uuid import uuid4
-
-from sqlalchemy import case, delete, func, or_, select, update
+import asyncio
+import secrets
+import string
+from datetime import date, datetime, timezone
+
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Date,
+    Float,
+    Numeric,
+    Select,
+    Subquery,
+    Text,
+    case,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, raiseload, selectinload
 
+from app.core.cache import cache, make_key
 from app.core.exceptions import ConflictException, NotFoundException
+from app.core.pagination import PaginationParams, paginate
+from app.database import async_session_maker
 from app.models.application import (
     Application,
     ApplicationCall,
@@ -28,6 +56,7 @@ from app.models.application import (
 )
 from app.models.base import PublicationStatus
 from app.schemas.application import (
+    ApplicationCallPublic,
     ApplicationCallTranslateRequest,
     ApplicationCallTranslateResponse,
     CallCoverageTranslateRequest,
@@ -39,6 +68,7 @@ from app.schemas.application import (
     CallScheduleTranslateRequest,
     CallScheduleTranslateResponse,
 )
+from app.services.row_writes import delete_by_id, update_returning
 from app.services.translation_service import (
     SUPPORTED_TARGETS,
     _lang_attr,
@@ -63,9 +93,67 @@ _COVERAGE_TRANSLATABLE = [("item", "text"), ("description", "text")]
 _REQUIRED_DOCUMENT_TRANSLATABLE = [("document_name", "text"), ("description", "text")]
 _SCHEDULE_TRANSLATABLE = [("step", "text"), ("description", "text")]
 
+# Granularités de la timeline → unité date_trunc / generate_series
+_TIMELINE_TRUNC = {"day": "day", "week": "week", "month": "month"}
+
+# En dessous de 3 caractères, pg_trgm n'extrait aucun trigramme exploitable :
+# on bascule sur une recherche par préfixe (servie par text_pattern_ops).
+_TRGM_MIN_LENGTH = 3
+
+# Tentatives d'insertion d'une candidature en cas de collision du numéro de
+# référence (contrainte UNIQUE) avant d'abandonner.
+_REFERENCE_MAX_ATTEMPTS = 3
+
+# Cache des lectures publiques / statistiques (espaces de noms, TTL en secondes).
+# Invalidé à chaque écriture sur les appels (resp. candidatures).
+_PUBLISHED_CALLS_CACHE = "published_calls"
+_PUBLISHED_CALLS_TTL = 300  # plafonné à la prochaine deadline (cf. _published_calls_ttl)
+_APP_STATS_CACHE = "app_stats"
+_APP_STATS_TTL = 60
+
+# Partie aléatoire du numéro de référence (APP-<année>-XXXXXXXX)
+_REF_ALPHABET = string.ascii_uppercase + string.digits
+_REF_LENGTH = 8
+
+# Socles immuables des requêtes de liste (Select est génératif : chaque
+# .where() renvoie une copie). Construits une seule fois au chargement du
+# module ; le cache de compilation du moteur (query_cache_size) réutilise
+# ensuite le SQL compilé pour chaque combinaison de filtres, les valeurs
+# (dont le motif ILIKE) n'étant que des paramètres liés.
+# Les listes ne sérialisent que des colonnes (ApplicationCallRead/Public,
+# ApplicationRead) : aucune relation n'est chargée, raiseload("*") empêche
+# en plus le chargement implicite de ApplicationCall.applications (selectin).
+# Les appelants qui ont besoin de relations les ajoutent via .options().
+_CALL_LIST_QUERY = select(ApplicationCall).options(raiseload("*"))
+# Tri par statut : ongoing → upcoming → closed, puis par deadline
+_CALL_LIST_ORDER = (
+    case(
+        (ApplicationCall.status == CallStatus.ONGOING, 0),
+        (ApplicationCall.status == CallStatus.UPCOMING, 1),
+        (ApplicationCall.status == CallStatus.CLOSED, 2),
+        else_=3,
+    ),
+    ApplicationCall.deadline.asc(),
+)
+_APPLICATION_LIST_QUERY = select(Application).options(raiseload("*"))
+
+
+def _search_pattern(search: str) -> str:
+    """Motif ILIKE de recherche : sous-chaîne, ou préfixe pour les termes courts."""
+    if len(search) < _TRGM_MIN_LENGTH:
+        return f"{search}%"
+    return f"%{search}%"
+
 
 class ApplicationService:
-    """Service pour la gestion des appels à candidature et candidatures."""
+    """
+    Service pour la gestion des appels à candidature et candidatures.
+
+    Suppose une session par requête HTTP (dépendance ``get_db``) : chaque
+    méthode d'écriture termine son unité de travail par un ``commit`` et ne
+    conserve aucune transaction ouverte au-delà de l'appel, ce qui rend la
+    connexion au pool dès la fin de la requête.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -131,6 +219,19 @@ class ApplicationService:
             **await self._translate_request(data, _SCHEDULE_TRANSLATABLE)
         )
 
+    # =========================================================================
+    # UTILITAIRES D'ÉCRITURE
+    # =========================================================================
+
+    async def _get_by_id(self, model, pk: str):
+        """
+        Récupère une ligne par clé primaire, sans ses relations.
+
+        Passe par ``Session.get`` : aucune requête si l'objet est déjà dans
+        la session (identity map), une seule sinon.
+        """
+        return await self.db.get(model, pk, options=[lazyload("*")])
+
     # =========================================================================
     # APPLICATION CALLS
     # =========================================================================
@@ -142,19 +243,20 @@ class ApplicationService:
         Returns:
             Nombre d'appels mis à jour.
         """
-        now = datetime.utcnow()
+        # Horloge de la base : cohérente avec deadline (TIMESTAMPTZ)
         stmt = (
             update(ApplicationCall)
             .where(
                 ApplicationCall.status == CallStatus.ONGOING,
                 ApplicationCall.deadline.isnot(None),
-                ApplicationCall.deadline < now,
+                ApplicationCall.deadline < func.now(),
             )
             .values(status=CallStatus.CLOSED)
         )
         result = await self.db.execute(stmt)
         if result.rowcount > 0:
             await self.db.commit()
+            cache.invalidate(_PUBLISHED_CALLS_CACHE)
         return result.rowcount
 
     async def get_calls(
@@ -181,25 +283,17 @@ class ApplicationService:
 
         Returns:
             Requête SQLAlchemy Select.
+
+        Note:
+            Les filtres d'égalité sont ajoutés avant la recherche ILIKE, dans
+            un ordre fixe (même convention que ``get_applications``) : une
+            combinaison de filtres donne toujours le même texte SQL,
+            réutilisable par le cache de requêtes compilées.
         """
         # Fermer automatiquement les appels expirés avant de lister
         await self.auto_close_expired_calls()
 
-        query = select(ApplicationCall).options(
-            selectinload(ApplicationCall.eligibility_criteria),
-            selectinload(ApplicationCall.coverage),
-            selectinload(ApplicationCall.required_documents),
-            selectinload(ApplicationCall.schedule),
-        )
-
-        if search:
-            search_filter = f"%{search}%"
-            query = query.where(
-                or_(
-                    ApplicationCall.title.ilike(search_filter),
-                    ApplicationCall.description_html.ilike(search_filter),
-                )
-            )
+        query = _CALL_LIST_QUERY
 
         if call_type:
             query = query.where(ApplicationCall.type == call_type)
@@ -219,15 +313,16 @@ class ApplicationService:
         if project_id:
             query = query.where(ApplicationCall.project_external_id == project_id)
 
-        # Tri par statut : ongoing → upcoming → closed, puis par deadline
-        status_order = case(
-            (ApplicationCall.status == CallStatus.ONGOING, 0),
-            (ApplicationCall.status == CallStatus.UPCOMING, 1),
-            (ApplicationCall.status == CallStatus.CLOSED, 2),
-            else_=3,
-        )
-        query = query.order_by(status_order, ApplicationCall.deadline.asc())
-        return query
+        if search:
+            search_filter = _search_pattern(search)
+            query = query.where(
+                or_(
+                    ApplicationCall.title.ilike(search_filter),
+                    ApplicationCall.description_html.ilike(search_filter),
+                )
+            )
+
+        return query.order_by(*_CALL_LIST_ORDER)
 
     async def get_published_calls(
         self,
@@ -262,8 +357,71 @@ class ApplicationService:
             project_id=project_id,
         )
 
+    async def _published_calls_ttl(self) -> float:
+        """
+        Durée de vie d'une entrée du cache des appels publiés.
+
+        Plafonnée à l'échéance de la prochaine deadline d'un appel 'ongoing' :
+        l'entrée expire dès qu'un appel listé ouvert doit être fermé, et le
+        recalcul suivant passe par ``auto_close_expired_calls``.
+        """
+        result = await self.db.execute(
+            select(
+                func.extract("epoch", func.min(ApplicationCall.deadline) - func.now())
+            ).where(
+                ApplicationCall.status == CallStatus.ONGOING,
+                ApplicationCall.deadline.isnot(None),
+            )
+        )
+        seconds = result.scalar()
+        if seconds is None:
+            return _PUBLISHED_CALLS_TTL
+        return max(1.0, min(float(seconds), _PUBLISHED_CALLS_TTL))
+
+    async def list_published_calls(self, **filters) -> list[ApplicationCallPublic]:
+        """
+        Liste les appels publiés (sans pagination), avec mise en cache.
+
+        Args:
+            **filters: Mêmes filtres que ``get_published_calls``.
+        """
+        key = make_key(_PUBLISHED_CALLS_CACHE, filters)
+        calls = cache.get(key)
+        if calls is None:
+            result = await self.db.execute(await self.get_published_calls(**filters))
+            calls = [ApplicationCallPublic.model_validate(call) for call in result.scalars()]
+            cache.set(key, calls, await self._published_calls_ttl())
+        return calls
+
+    async def paginate_published_calls(
+        self, pagination: PaginationParams, **filters
+    ) -> dict:
+        """
+        Page d'appels publiés, avec mise en cache.
+
+        Args:
+            pagination: Paramètres de pagination (inclus dans la clé de cache).
+            **filters: Mêmes filtres que ``get_published_calls``.
+        """
+        key = make_key(
+            _PUBLISHED_CALLS_CACHE,
+            filters,
+            pagination.page,
+            pagination.limit,
+            pagination.sort_by,
+            pagination.sort_order,
+        )
+        page = cache.get(key)
+        if page is None:
+            query = await self.get_published_calls(**filters)
+            page = await paginate(
+                self.db, query, pagination, ApplicationCall, ApplicationCallPublic
+            )
+            cache.set(key, page, await self._published_calls_ttl())
+        return page
+
     async def get_call_by_id(self, call_id: str) -> ApplicationCall | None:
-        """Récupère un appel par son ID."""
+        """Récupère un appel par son ID, avec ses sous-éléments."""
         query = (
             select(ApplicationCall)
             .options(
@@ -271,6 +429,7 @@ class ApplicationService:
                 selectinload(ApplicationCall.coverage),
                 selectinload(ApplicationCall.required_documents),
                 selectinload(ApplicationCall.schedule),
+                raiseload("*"),
             )
             .where(ApplicationCall.id == call_id)
         )
@@ -278,7 +437,7 @@ class ApplicationService:
         return result.scalar_one_or_none()
 
     async def get_call_by_slug(self, slug: str) -> ApplicationCall | None:
-        """Récupère un appel par son slug."""
+        """Récupère un appel par son slug, avec ses sous-éléments."""
         query = (
             select(ApplicationCall)
             .options(
@@ -286,63 +445,76 @@ class ApplicationService:
                 selectinload(ApplicationCall.coverage),
                 selectinload(ApplicationCall.required_documents),
                 selectinload(ApplicationCall.schedule),
+                raiseload("*"),
             )
             .where(ApplicationCall.slug == slug)
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def _get_call(self, call_id: str) -> ApplicationCall | None:
+        """
+        Récupère un appel sans ses relations (chemins d'écriture).
+
+        Suffit pour vérifier l'existence ou modifier une colonne.
+        """
+        return await self._get_by_id(ApplicationCall, call_id)
+
+    async def _slug_exists(self, slug: str, exclude_id: str | None = None) -> bool:
+        """Indique si un autre appel utilise déjà ce slug (SELECT EXISTS)."""
+        condition = ApplicationCall.slug == slug
+        if exclude_id:
+            condition = condition & (ApplicationCall.id != exclude_id)
+        result = await self.db.execute(select(exists().where(condition)))
+        return bool(result.scalar())
+
     async def create_call(self, data: dict) -> ApplicationCall:
         """Crée un nouvel appel à candidature."""
         # Vérifier l'unicité du slug
-        existing = await self.get_call_by_slug(data.get("slug", ""))
-        if existing:
+        if await self._slug_exists(data.get("slug", "")):
             raise ConflictException("Un appel avec ce slug existe déjà")
 
-        call = ApplicationCall(id=str(uuid4()), **data)
+        call = ApplicationCall(**data)
         # Remplissage auto des traductions EN/AR vides (non bloquant).
         await autofill_translations(call, _CALL_TRANSLATABLE)
         self.db.add(call)
         await self.db.commit()
+        cache.invalidate(_PUBLISHED_CALLS_CACHE)
         await self.db.refresh(call)
-        return await self.get_call_by_id(call.id)
+        return call
 
     async def update_call(self, call_id: str, data: dict) -> ApplicationCall:
         """Met à jour un appel à candidature."""
-        call = await self.get_call_by_id(call_id)
-        if not call:
-            raise NotFoundException("Appel non trouvé")
-
         # Vérifier l'unicité du slug si modifié
-        if "slug" in data and data["slug"] != call.slug:
-            existing = await self.get_call_by_slug(data["slug"])
-            if existing:
-                raise ConflictException("Un appel avec ce slug existe déjà")
+        if "slug" in data and await self._slug_exists(data["slug"], exclude_id=call_id):
+            raise ConflictException("Un appel avec ce slug existe déjà")
 
-        for key, value in data.items():
-            if hasattr(call, key):
-                setattr(call, key, value)
+        call = await update_returning(self.db, ApplicationCall, call_id, data)
+        if not call:
+            raise NotFoundException("Appel non trouvé")
 
         # Remplissage auto des traductions EN/AR encore vides (non bloquant).
         await autofill_translations(call, _CALL_TRANSLATABLE)
+        if call in self.db.dirty:
+            # Traductions complétées : updated_at est recalculé au flush
+            await self.db.flush()
+            await self.db.refresh(call, ["updated_at"])
 
         await self.db.commit()
-        await self.db.refresh(call)
-        return await self.get_call_by_id(call.id)
+        cache.invalidate(_PUBLISHED_CALLS_CACHE)
+        return call
 
     async def delete_call(self, call_id: str) -> bool:
         """Supprime un appel à candidature."""
-        call = await self.get_call_by_id(call_id)
-        if not call:
+        if not await delete_by_id(self.db, ApplicationCall, call_id):
             raise NotFoundException("Appel non trouvé")
-
-        await self.db.delete(call)
         await self.db.commit()
+        cache.invalidate(_PUBLISHED_CALLS_CACHE)
         return True
 
     async def toggle_call_publication(self, call_id: str) -> ApplicationCall:
         """Bascule le statut de publication d'un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
@@ -353,19 +525,22 @@ class ApplicationService:
         )
         call.publication_status = new_status
         await self.db.commit()
-        await self.db.refresh(call)
-        return await self.get_call_by_id(call.id)
+        cache.invalidate(_PUBLISHED_CALLS_CACHE)
+        # Seul updated_at (onupdate) est expiré par le flush
+        await self.db.refresh(call, ["updated_at"])
+        return call
 
     async def update_call_status(self, call_id: str, status: CallStatus) -> ApplicationCall:
         """Met à jour le statut d'un appel (ongoing, closed, upcoming)."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
         call.status = status
         await self.db.commit()
-        await self.db.refresh(call)
-        return await self.get_call_by_id(call.id)
+        cache.invalidate(_PUBLISHED_CALLS_CACHE)
+        await self.db.refresh(call, ["updated_at"])
+        return call
 
     # =========================================================================
     # ELIGIBILITY CRITERIA
@@ -373,20 +548,15 @@ class ApplicationService:
 
     async def get_criteria_by_id(self, criterion_id: str) -> CallEligibilityCriteria | None:
         """Récupère un critère par son ID."""
-        query = select(CallEligibilityCriteria).where(
-            CallEligibilityCriteria.id == criterion_id
-        )
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(CallEligibilityCriteria, criterion_id)
 
     async def create_criterion(self, call_id: str, data: dict) -> CallEligibilityCriteria:
         """Ajoute un critère d'éligibilité à un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
         criterion = CallEligibilityCriteria(
-            id=str(uuid4()),
             call_id=call_id,
             **data,
         )
@@ -398,27 +568,21 @@ class ApplicationService:
 
     async def update_criterion(self, criterion_id: str, data: dict) -> CallEligibilityCriteria:
         """Met à jour un critère d'éligibilité."""
-        criterion = await self.get_criteria_by_id(criterion_id)
+        criterion = await update_returning(
+            self.db, CallEligibilityCriteria, criterion_id, data
+        )
         if not criterion:
             raise NotFoundException("Critère non trouvé")
 
-        for key, value in data.items():
-            if hasattr(criterion, key):
-                setattr(criterion, key, value)
-
         await autofill_translations(criterion, _CRITERION_TRANSLATABLE)
 
         await self.db.commit()
-        await self.db.refresh(criterion)
         return criterion
 
     async def delete_criterion(self, criterion_id: str) -> bool:
         """Supprime un critère d'éligibilité."""
-        criterion = await self.get_criteria_by_id(criterion_id)
-        if not criterion:
+        if not await delete_by_id(self.db, CallEligibilityCriteria, criterion_id):
             raise NotFoundException("Critère non trouvé")
-
-        await self.db.delete(criterion)
         await self.db.commit()
         return True
 
@@ -428,18 +592,15 @@ class ApplicationService:
 
     async def get_coverage_by_id(self, coverage_id: str) -> CallCoverage | None:
         """Récupère une prise en charge par son ID."""
-        query = select(CallCoverage).where(CallCoverage.id == coverage_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(CallCoverage, coverage_id)
 
     async def create_coverage(self, call_id: str, data: dict) -> CallCoverage:
         """Ajoute une prise en charge à un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
         coverage = CallCoverage(
-            id=str(uuid4()),
             call_id=call_id,
             **data,
         )
@@ -451,27 +612,19 @@ class ApplicationService:
 
     async def update_coverage(self, coverage_id: str, data: dict) -> CallCoverage:
         """Met à jour une prise en charge."""
-        coverage = await self.get_coverage_by_id(coverage_id)
+        coverage = await update_returning(self.db, CallCoverage, coverage_id, data)
         if not coverage:
             raise NotFoundException("Prise en charge non trouvée")
 
-        for key, value in data.items():
-            if hasattr(coverage, key):
-                setattr(coverage, key, value)
-
         await autofill_translations(coverage, _COVERAGE_TRANSLATABLE)
 
         await self.db.commit()
-        await self.db.refresh(coverage)
         return coverage
 
     async def delete_coverage(self, coverage_id: str) -> bool:
         """Supprime une prise en charge."""
-        coverage = await self.get_coverage_by_id(coverage_id)
-        if not coverage:
+        if not await delete_by_id(self.db, CallCoverage, coverage_id):
             raise NotFoundException("Prise en charge non trouvée")
-
-        await self.db.delete(coverage)
         await self.db.commit()
         return True
 
@@ -481,18 +634,15 @@ class ApplicationService:
 
     async def get_required_document_by_id(self, document_id: str) -> CallRequiredDocument | None:
         """Récupère un document requis par son ID."""
-        query = select(CallRequiredDocument).where(CallRequiredDocument.id == document_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(CallRequiredDocument, document_id)
 
     async def create_required_document(self, call_id: str, data: dict) -> CallRequiredDocument:
         """Ajoute un document requis à un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
         document = CallRequiredDocument(
-            id=str(uuid4()),
             call_id=call_id,
             **data,
         )
@@ -504,27 +654,21 @@ class ApplicationService:
 
     async def update_required_document(self, document_id: str, data: dict) -> CallRequiredDocument:
         """Met à jour un document requis."""
-        document = await self.get_required_document_by_id(document_id)
+        document = await update_returning(
+            self.db, CallRequiredDocument, document_id, data
+        )
         if not document:
             raise NotFoundException("Document requis non trouvé")
 
-        for key, value in data.items():
-            if hasattr(document, key):
-                setattr(document, key, value)
-
         await autofill_translations(document, _REQUIRED_DOCUMENT_TRANSLATABLE)
 
         await self.db.commit()
-        await self.db.refresh(document)
         return document
 
     async def delete_required_document(self, document_id: str) -> bool:
         """Supprime un document requis."""
-        document = await self.get_required_document_by_id(document_id)
-        if not document:
+        if not await delete_by_id(self.db, CallRequiredDocument, document_id):
             raise NotFoundException("Document requis non trouvé")
-
-        await self.db.delete(document)
         await self.db.commit()
         return True
 
@@ -534,18 +678,15 @@ class ApplicationService:
 
     async def get_schedule_by_id(self, schedule_id: str) -> CallSchedule | None:
         """Récupère une étape du calendrier par son ID."""
-        query = select(CallSchedule).where(CallSchedule.id == schedule_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(CallSchedule, schedule_id)
 
     async def create_schedule(self, call_id: str, data: dict) -> CallSchedule:
         """Ajoute une étape au calendrier d'un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
         schedule = CallSchedule(
-            id=str(uuid4()),
             call_id=call_id,
             **data,
         )
@@ -557,27 +698,19 @@ class ApplicationService:
 
     async def update_schedule(self, schedule_id: str, data: dict) -> CallSchedule:
         """Met à jour une étape du calendrier."""
-        schedule = await self.get_schedule_by_id(schedule_id)
+        schedule = await update_returning(self.db, CallSchedule, schedule_id, data)
         if not schedule:
             raise NotFoundException("Étape non trouvée")
 
-        for key, value in data.items():
-            if hasattr(schedule, key):
-                setattr(schedule, key, value)
-
         await autofill_translations(schedule, _SCHEDULE_TRANSLATABLE)
 
         await self.db.commit()
-        await self.db.refresh(schedule)
         return schedule
 
     async def delete_schedule(self, schedule_id: str) -> bool:
         """Supprime une étape du calendrier."""
-        schedule = await self.get_schedule_by_id(schedule_id)
-        if not schedule:
+        if not await delete_by_id(self.db, CallSchedule, schedule_id):
             raise NotFoundException("Étape non trouvée")
-
-        await self.db.delete(schedule)
         await self.db.commit()
         return True
 
@@ -587,12 +720,8 @@ class ApplicationService:
 
     def _generate_reference_number(self) -> str:
         """Génère un numéro de référence unique pour une candidature."""
-        import random
-        import string
-        from datetime import datetime
-
-        year = datetime.now().year
-        random_part = "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+        year = datetime.now(timezone.utc).year
+        random_part = "".join(secrets.choice(_REF_ALPHABET) for _ in range(_REF_LENGTH))
         return f"APP-{year}-{random_part}"
 
     async def get_applications(
@@ -601,6 +730,7 @@ class ApplicationService:
         call_id: str | None = None,
         status: SubmittedApplicationStatus | None = None,
         program_id: str | None = None,
+        after: tuple[datetime, str] | None = None,
     ) -> select:
         """
         Construit une requête pour lister les candidatures.
@@ -610,25 +740,17 @@ class ApplicationService:
             call_id: Filtrer par appel.
             status: Filtrer par statut.
             program_id: Filtrer par programme.
+            after: Curseur keyset (submitted_at, id) de la dernière candidature
+                reçue : seules les candidatures suivantes sont renvoyées, par
+                recherche dans l'index au lieu d'un OFFSET.
 
         Returns:
             Requête SQLAlchemy Select.
-        """
-        query = select(Application).options(
-            selectinload(Application.degrees),
-            selectinload(Application.documents),
-        )
 
-        if search:
-            search_filter = f"%{search}%"
-            query = query.where(
-                or_(
-                    Application.reference_number.ilike(search_filter),
-                    Application.last_name.ilike(search_filter),
-                    Application.first_name.ilike(search_filter),
-                    Application.email.ilike(search_filter),
-                )
-            )
+        Note:
+            Même ordre que ``get_calls`` : égalités d'abord, ILIKE en dernier.
+        """
+        query = _APPLICATION_LIST_QUERY
 
         if call_id == "spontaneous":
             query = query.where(Application.call_id.is_(None))
@@ -641,16 +763,31 @@ class ApplicationService:
         if program_id:
             query = query.where(Application.program_external_id == program_id)
 
-        query = query.order_by(Application.submitted_at.desc())
-        return query
+        if search:
+            search_filter = _search_pattern(search)
+            query = query.where(
+                or_(
+                    Application.reference_number.ilike(search_filter),
+                    Application.last_name.ilike(search_filter),
+                    Application.first_name.ilike(search_filter),
+                    Application.email.ilike(search_filter),
+                )
+            )
+
+        if after:
+            query = query.where(tuple_(Application.submitted_at, Application.id) < after)
+
+        # id départage les soumissions simultanées : ordre total, stable d'une page à l'autre
+        return query.order_by(Application.submitted_at.desc(), Application.id.desc())
 
     async def get_application_by_id(self, application_id: str) -> Application | None:
-        """Récupère une candidature par son ID."""
+        """Récupère une candidature par son ID, avec diplômes et documents."""
         query = (
             select(Application)
             .options(
                 selectinload(Application.degrees),
                 selectinload(Application.documents),
+                raiseload("*"),
             )
             .where(Application.id == application_id)
         )
@@ -664,65 +801,73 @@ class ApplicationService:
             .options(
                 selectinload(Application.degrees),
                 selectinload(Application.documents),
+                raiseload("*"),
             )
             .where(Application.reference_number == reference)
         )
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def _get_application(self, application_id: str) -> Application | None:
+        """Récupère une candidature sans ses relations (chemins d'écriture)."""
+        return await self._get_by_id(Application, application_id)
+
     async def create_application(self, data: dict) -> Application:
         """Crée une nouvelle candidature."""
         # Extraire les données imbriquées
         degrees_data = data.pop("degrees", [])
         documents_data = data.pop("documents", [])
 
-        # Générer un numéro de référence unique
-        reference = self._generate_reference_number()
-        while await self.get_application_by_reference(reference):
-            reference = self._generate_reference_number()
-
-        application = Application(
-            id=str(uuid4()),
-            reference_number=reference,
-            **data,
-        )
-        self.db.add(application)
-        await self.db.flush()
-
-        # Ajouter les diplômes
-        for degree_data in degrees_data:
-            degree = ApplicationDegree(
-                id=str(uuid4()),
-                application_id=application.id,
-                **degree_data,
+        # Numéro de référence : l'unicité est garantie par la contrainte UNIQUE.
+        # En cas de collision, ON CONFLICT DO NOTHING ne renvoie aucune ligne
+        # et on retente avec un nouveau numéro (sans SELECT préalable).
+        application = None
+        for _ in range(_REFERENCE_MAX_ATTEMPTS):
+            stmt = (
+                pg_insert(Application)
+                .values(reference_number=self._generate_reference_number(), **data)
+                .on_conflict_do_nothing(index_elements=[Application.reference_number])
+                .returning(Application)
+                .options(lazyload("*"))
+            )
+            result = await self.db.execute(stmt)
+            application = result.scalar_one_or_none()
+            if application:
+                break
+        if not application:
+            raise ConflictException("Impossible de générer un numéro de référence unique")
+
+        # Ajouter les diplômes et documents : un INSERT multi-lignes par table
+        if degrees_data:
+            await self.db.execute(
+                insert(ApplicationDegree),
+                [
+                    {"application_id": application.id, **degree_data}
+                    for degree_data in degrees_data
+                ],
             )
-            self.db.add(degree)
-
-        # Ajouter les documents
-        for doc_data in documents_data:
-            doc = ApplicationDocument(
-                id=str(uuid4()),
-                application_id=application.id,
-                **doc_data,
+        if documents_data:
+            await self.db.execute(
+                insert(ApplicationDocument),
+                [
+                    {"application_id": application.id, **doc_data}
+                    for doc_data in documents_data
+                ],
             )
-            self.db.add(doc)
 
         await self.db.commit()
-        return await self.get_application_by_id(application.id)
+        cache.invalidate(_APP_STATS_CACHE)
+        return application
 
     async def update_application(self, application_id: str, data: dict) -> Application:
         """Met à jour une candidature."""
-        application = await self.get_application_by_id(application_id)
+        application = await update_returning(self.db, Application, application_id, data)
         if not application:
             raise NotFoundException("Candidature non trouvée")
 
-        for key, value in data.items():
-            if hasattr(application, key):
-                setattr(application, key, value)
-
         await self.db.commit()
-        await self.db.refresh(application)
-        return await self.get_application_by_id(application.id)
+        cache.invalidate(_APP_STATS_CACHE)
+        return application
 
     async def update_application_status(
         self,
@@ -733,31 +878,32 @@ class ApplicationService:
         reviewer_id: str | None = None,
     ) -> Application:
         """Met à jour le statut d'une candidature."""
-        application = await self.get_application_by_id(application_id)
-        if not application:
-            raise NotFoundException("Candidature non trouvée")
-
-        application.status = status
+        values: dict = {"status": status}
         if review_notes is not None:
-            application.review_notes = review_notes
+            values["review_notes"] = review_notes
         if review_score is not None:
-            application.review_score = review_score
+            values["review_score"] = review_score
         if reviewer_id:
-            application.reviewer_external_id = reviewer_id
-            application.reviewed_at = datetime.utcnow()
+            values["reviewer_external_id"] = reviewer_id
+            # Horodatage par l'horloge de la base (renvoyé par RETURNING)
+            values["reviewed_at"] = func.now()
+
+        application = await update_returning(
+            self.db, Application, application_id, values
+        )
+        if not application:
+            raise NotFoundException("Candidature non trouvée")
 
         await self.db.commit()
-        await self.db.refresh(application)
-        return await self.get_application_by_id(application.id)
+        cache.invalidate(_APP_STATS_CACHE)
+        return application
 
     async def delete_application(self, application_id: str) -> bool:
         """Supprime une candidature."""
-        application = await self.get_application_by_id(application_id)
-        if not application:
+        if not await delete_by_id(self.db, Application, application_id):
             raise NotFoundException("Candidature non trouvée")
-
-        await self.db.delete(application)
         await self.db.commit()
+        cache.invalidate(_APP_STATS_CACHE)
         return True
 
     # =========================================================================
@@ -766,18 +912,15 @@ class ApplicationService:
 
     async def get_degree_by_id(self, degree_id: str) -> ApplicationDegree | None:
         """Récupère un diplôme par son ID."""
-        query = select(ApplicationDegree).where(ApplicationDegree.id == degree_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(ApplicationDegree, degree_id)
 
     async def add_degree(self, application_id: str, data: dict) -> ApplicationDegree:
         """Ajoute un diplôme à une candidature."""
-        application = await self.get_application_by_id(application_id)
+        application = await self._get_application(application_id)
         if not application:
             raise NotFoundException("Candidature non trouvée")
 
         degree = ApplicationDegree(
-            id=str(uuid4()),
             application_id=application_id,
             **data,
         )
@@ -788,25 +931,17 @@ class ApplicationService:
 
     async def update_degree(self, degree_id: str, data: dict) -> ApplicationDegree:
         """Met à jour un diplôme."""
-        degree = await self.get_degree_by_id(degree_id)
+        degree = await update_returning(self.db, ApplicationDegree, degree_id, data)
         if not degree:
             raise NotFoundException("Diplôme non trouvé")
 
-        for key, value in data.items():
-            if hasattr(degree, key):
-                setattr(degree, key, value)
-
         await self.db.commit()
-        await self.db.refresh(degree)
         return degree
 
     async def delete_degree(self, degree_id: str) -> bool:
         """Supprime un diplôme."""
-        degree = await self.get_degree_by_id(degree_id)
-        if not degree:
+        if not await delete_by_id(self.db, ApplicationDegree, degree_id):
             raise NotFoundException("Diplôme non trouvé")
-
-        await self.db.delete(degree)
         await self.db.commit()
         return True
 
@@ -816,18 +951,15 @@ class ApplicationService:
 
     async def get_document_by_id(self, document_id: str) -> ApplicationDocument | None:
         """Récupère un document par son ID."""
-        query = select(ApplicationDocument).where(ApplicationDocument.id == document_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        return await self._get_by_id(ApplicationDocument, document_id)
 
     async def add_document(self, application_id: str, data: dict) -> ApplicationDocument:
         """Ajoute un document à une candidature."""
-        application = await self.get_application_by_id(application_id)
+        application = await self._get_application(application_id)
         if not application:
             raise NotFoundException("Candidature non trouvée")
 
         document = ApplicationDocument(
-            id=str(uuid4()),
             application_id=application_id,
             **data,
         )
@@ -838,16 +970,13 @@ class ApplicationService:
 
     async def update_document(self, document_id: str, data: dict) -> ApplicationDocument:
         """Met à jour un document."""
-        document = await self.get_document_by_id(document_id)
+        document = await update_returning(
+            self.db, ApplicationDocument, document_id, data
+        )
         if not document:
             raise NotFoundException("Document non trouvé")
 
-        for key, value in data.items():
-            if hasattr(document, key):
-                setattr(document, key, value)
-
         await self.db.commit()
-        await self.db.refresh(document)
         return document
 
     async def validate_document(
@@ -857,23 +986,22 @@ class ApplicationService:
         comment: str | None = None,
     ) -> ApplicationDocument:
         """Valide ou invalide un document."""
-        document = await self.get_document_by_id(document_id)
+        document = await update_returning(
+            self.db,
+            ApplicationDocument,
+            document_id,
+            {"is_valid": is_valid, "validation_comment": comment},
+        )
         if not document:
             raise NotFoundException("Document non trouvé")
 
-        document.is_valid = is_valid
-        document.validation_comment = comment
         await self.db.commit()
-        await self.db.refresh(document)
         return document
 
     async def delete_document(self, document_id: str) -> bool:
         """Supprime un document."""
-        document = await self.get_document_by_id(document_id)
-        if not document:
+        if not await delete_by_id(self.db, ApplicationDocument, document_id):
             raise NotFoundException("Document non trouvé")
-
-        await self.db.delete(document)
         await self.db.commit()
         return True
 
@@ -882,31 +1010,77 @@ class ApplicationService:
     # =========================================================================
 
     async def get_application_statistics(self, call_id: str | None = None) -> dict:
-        """Récupère les statistiques des candidatures."""
-        base_query = select(func.count(Application.id))
+        """Récupère les statistiques des candidatures (un seul GROUP BY status)."""
+        key = make_key(_APP_STATS_CACHE, call_id)
+        stats = cache.get(key)
+        if stats is not None:
+            return stats
+
+        query = self._apply_filters(
+            select(Application.status, func.count()).group_by(Application.status),
+            call_id,
+            None,
+            None,
+        )
+        result = await self.db.execute(query)
 
-        if call_id == "spontaneous":
-            base_query = base_query.where(Application.call_id.is_(None))
-        elif call_id:
-            base_query = base_query.where(Application.call_id == call_id)
+        # Statuts absents initialisés à 0
+        counts = {status.value: 0 for status in SubmittedApplicationStatus}
+        for status, count in result.all():
+            counts[status.value] = count
 
-        # Total
-        total_result = await self.db.execute(base_query)
-        total = total_result.scalar() or 0
+        stats = {"total": sum(counts.values()), **counts}
+        cache.set(key, stats, _APP_STATS_TTL)
+        return stats
 
-        # Par statut
-        stats = {"total": total}
-        for status in SubmittedApplicationStatus:
-            query = base_query.where(Application.status == status)
-            result = await self.db.execute(query)
-            stats[status.value] = result.scalar() or 0
+    @staticmethod
+    async def dashboard_bundle(call_id: str | None = None) -> dict:
+        """
+        Statistiques des candidatures et appels en cours, chargés en parallèle.
 
-        return stats
+        Les deux lectures sont indépendantes : chacune ouvre sa propre session
+        (donc sa propre connexion du pool) et elles s'exécutent simultanément
+        via ``asyncio.gather``. Durée ≈ max(t1, t2) au lieu de t1 + t2.
+
+        Args:
+            call_id: Filtre des statistiques (ID d'appel ou "spontaneous").
+        """
+
+        async def statistics() -> dict:
+            async with async_session_maker() as session:
+                return await ApplicationService(session).get_application_statistics(call_id)
+
+        async def ongoing_calls() -> list[ApplicationCallPublic]:
+            async with async_session_maker() as session:
+                return await ApplicationService(session).list_published_calls(
+                    call_status=CallStatus.ONGOING
+                )
+
+        stats, calls = await asyncio.gather(statistics(), ongoing_calls())
+        return {"statistics": stats, "ongoing_calls": calls}
 
     # =========================================================================
     # EXTENDED STATISTICS
     # =========================================================================
 
+    @staticmethod
+    def _apply_filters(
+        query: Select,
+        call_id: str | None,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ) -> Select:
+        """Applique les filtres communs (appel, période) aux requêtes de stats."""
+        if call_id == "spontaneous":
+            query = query.where(Application.call_id.is_(None))
+        elif call_id:
+            query = query.where(Application.call_id == call_id)
+        if date_from:
+            query = query.where(Application.submitted_at >= date_from)
+        if date_to:
+            query = query.where(Application.submitted_at <= date_to)
+        return query
+
     async def get_extended_statistics(
         self,
         call_id: str | None = None,
@@ -914,265 +1088,216 @@ class ApplicationService:
         date_to: datetime | None = None,
         granularity: str = "month",
     ) -> dict:
-        """Récupère les statistiques étendues des candidatures."""
-        from datetime import date
-
-        # 1. Stats de base par statut avec filtres de date
-        base_stats = await self._get_status_counts(call_id, date_from, date_to)
-
-        # 2. KPIs calculés
-        total = base_stats["total"]
-        pending = base_stats.get("submitted", 0) + base_stats.get("under_review", 0)
-        decided = (
-            base_stats.get("accepted", 0)
-            + base_stats.get("rejected", 0)
-            + base_stats.get("waitlisted", 0)
-        )
-        acceptance_rate = (
-            round((base_stats.get("accepted", 0) / decided * 100), 1) if decided > 0 else 0
+        """Récupère les statistiques étendues des candidatures.
+
+        Tout le tableau de bord est produit par une seule requête : un CTE
+        ``filtered`` (candidatures filtrées, lu une seule fois) alimente les
+        agrégats, assemblés en un unique objet JSONB par PostgreSQL.
+        """
+        trunc_format = _TIMELINE_TRUNC.get(granularity, "month")
+        filtered = self._filtered_applications(call_id, date_from, date_to)
+
+        status_counts = (
+            select(
+                cast(filtered.c.status, Text).label("status"),
+                func.count().label("count"),
+            )
+            .group_by(filtered.c.status)
+            .subquery("status_counts")
         )
-        incomplete = base_stats.get("incomplete", 0)
-        completion_rate = (
-            round(((total - incomplete) / total * 100), 1) if total > 0 else 0
+        timeline = self._timeline_query(filtered, trunc_format, date_from, date_to).subquery(
+            "timeline"
         )
+        by_program = self._stats_by_program_query(filtered).subquery("by_program")
+        by_call = self._stats_by_call_query(filtered).subquery("by_call")
 
-        # 3. Timeline
-        timeline = await self._get_timeline_stats(call_id, date_from, date_to, granularity)
+        query = select(
+            func.jsonb_build_object(
+                "status_counts",
+                select(
+                    func.jsonb_object_agg(status_counts.c.status, status_counts.c.count)
+                ).scalar_subquery(),
+                "timeline",
+                self._jsonb_rows(timeline, timeline.c.period_date),
+                "by_program",
+                self._jsonb_rows(by_program, by_program.c.total.desc()),
+                "by_call",
+                self._jsonb_rows(by_call, by_call.c.total.desc()),
+                type_=JSONB,
+            )
+        )
+        payload = (await self.db.execute(query)).scalar_one()
 
-        # 4. Par programme (via ApplicationCall.title comme proxy)
-        by_program = await self._get_stats_by_program(call_id, date_from, date_to)
+        # KPIs calculés à partir des comptages par statut
+        base_stats = payload["status_counts"] or {}
+        by_status = {
+            status.value: base_stats.get(status.value, 0)
+            for status in SubmittedApplicationStatus
+        }
+        total = sum(by_status.values())
+        pending = by_status["submitted"] + by_status["under_review"]
+        decided = by_status["accepted"] + by_status["rejected"] + by_status["waitlisted"]
+        acceptance_rate = round(by_status["accepted"] / decided * 100, 1) if decided > 0 else 0
+        completion_rate = (
+            round((total - by_status["incomplete"]) / total * 100, 1) if total > 0 else 0
+        )
 
-        # 5. Par appel
-        by_call = await self._get_stats_by_call(date_from, date_to)
+        # Période renvoyée en DATE ISO, formatée ici (contrat "YYYY-MM[-DD]")
+        period_format = "%Y-%m" if trunc_format == "month" else "%Y-%m-%d"
 
         return {
             "total": total,
             "pending": pending,
             "acceptance_rate": acceptance_rate,
             "completion_rate": completion_rate,
-            "by_status": {
-                "submitted": base_stats.get("submitted", 0),
-                "under_review": base_stats.get("under_review", 0),
-                "accepted": base_stats.get("accepted", 0),
-                "rejected": base_stats.get("rejected", 0),
-                "waitlisted": base_stats.get("waitlisted", 0),
-                "incomplete": base_stats.get("incomplete", 0),
-            },
-            "timeline": timeline,
-            "by_program": by_program,
-            "by_call": by_call,
+            "by_status": by_status,
+            "timeline": [
+                {
+                    "period": date.fromisoformat(row["period_date"]).strftime(period_format),
+                    "count": row["count"],
+                }
+                for row in payload["timeline"]
+            ],
+            "by_program": payload["by_program"],
+            "by_call": payload["by_call"],
         }
 
-    async def _get_status_counts(
+    def get_stats_by_call_query(
         self,
-        call_id: str | None,
-        date_from: datetime | None,
-        date_to: datetime | None,
-    ) -> dict:
-        """Comptages par statut avec filtres de date."""
-        base_query = select(func.count(Application.id))
-
-        if call_id == "spontaneous":
-            base_query = base_query.where(Application.call_id.is_(None))
-        elif call_id:
-            base_query = base_query.where(Application.call_id == call_id)
-        if date_from:
-            base_query = base_query.where(Application.submitted_at >= date_from)
-        if date_to:
-            base_query = base_query.where(Application.submitted_at <= date_to)
-
-        # Total
-        total_result = await self.db.execute(base_query)
-        total = total_result.scalar() or 0
+        call_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> Select:
+        """
+        Construit la requête des statistiques par appel (exports).
 
-        # Par statut
-        stats = {"total": total}
-        for status in SubmittedApplicationStatus:
-            query = base_query.where(Application.status == status)
-            result = await self.db.execute(query)
-            stats[status.value] = result.scalar() or 0
+        Même requête que la section ``by_call`` des statistiques étendues.
 
-        return stats
+        Returns:
+            Requête SQLAlchemy Select.
+        """
+        filtered = self._filtered_applications(call_id, date_from, date_to)
+        query = self._stats_by_call_query(filtered)
+        return query.order_by(query.selected_columns.total.desc())
 
-    async def _get_timeline_stats(
-        self,
+    @classmethod
+    def _filtered_applications(
+        cls,
         call_id: str | None,
         date_from: datetime | None,
         date_to: datetime | None,
-        granularity: str,
-    ) -> list[dict]:
-        """Évolution temporelle des candidatures."""
-        from sqlalchemy import text
-
-        # Déterminer le format de troncature selon la granularité
-        trunc_format = {
-            "day": "day",
-            "week": "week",
-            "month": "month",
-        }.get(granularity, "month")
-
-        # Expression date_trunc réutilisable
-        date_trunc_expr = func.date_trunc(trunc_format, Application.submitted_at)
-
-        # Requête avec GROUP BY date_trunc
-        query = select(
-            func.to_char(
-                date_trunc_expr,
-                "YYYY-MM" if trunc_format == "month" else "YYYY-MM-DD",
-            ).label("period"),
-            func.count(Application.id).label("count"),
+    ) -> CTE:
+        """CTE des candidatures filtrées, base commune des statistiques."""
+        return cls._apply_filters(
+            select(Application.status, Application.submitted_at, Application.call_id),
+            call_id,
+            date_from,
+            date_to,
+        ).cte("filtered")
+
+    @staticmethod
+    def _jsonb_rows(subquery: Subquery, *order_by) -> ColumnElement:
+        """Agrège les lignes d'une sous-requête en tableau JSONB ordonné."""
+        return select(
+            func.coalesce(
+                func.jsonb_agg(
+                    aggregate_order_by(func.to_jsonb(subquery.table_valued()), *order_by)
+                ),
+                func.jsonb_build_array(),
+            )
+        ).scalar_subquery()
+
+    @staticmethod
+    def _timeline_query(
+        filtered: CTE,
+        trunc_format: str,
+        date_from: datetime | None,
+        date_to: datetime | None,
+    ) -> Select:
+        """Évolution temporelle des candidatures.
+
+        Les périodes sans candidature sont renvoyées avec un compteur à 0 :
+        la série est densifiée côté PostgreSQL via ``generate_series``.
+        """
+        date_trunc_expr = func.date_trunc(trunc_format, filtered.c.submitted_at)
+        counts = (
+            select(date_trunc_expr.label("period"), func.count().label("count"))
+            .group_by(date_trunc_expr)
+            .cte("counts")
         )
 
-        if call_id == "spontaneous":
-            query = query.where(Application.call_id.is_(None))
-        elif call_id:
-            query = query.where(Application.call_id == call_id)
+        # Bornes de la série : filtres de date si fournis, sinon min/max observés
         if date_from:
-            query = query.where(Application.submitted_at >= date_from)
+            start = func.date_trunc(
+                trunc_format, literal(date_from, Application.submitted_at.type)
+            )
+        else:
+            start = select(func.min(counts.c.period)).scalar_subquery()
         if date_to:
-            query = query.where(Application.submitted_at <= date_to)
-
-        # GROUP BY et ORDER BY avec la même expression
-        query = query.group_by(date_trunc_expr).order_by(date_trunc_expr)
+            stop = func.date_trunc(
+                trunc_format, literal(date_to, Application.submitted_at.type)
+            )
+        else:
+            stop = select(func.max(counts.c.period)).scalar_subquery()
 
-        result = await self.db.execute(query)
-        rows = result.all()
+        # Série dense de périodes, LEFT JOIN sur les comptages
+        series = (
+            func.generate_series(
+                start, stop, literal_column(f"interval '1 {trunc_format}'")
+            )
+            .table_valued("d")
+            .render_derived(name="gs")
+        )
+        return select(
+            cast(series.c.d, Date).label("period_date"),
+            func.coalesce(counts.c.count, 0).label("count"),
+        ).select_from(series.outerjoin(counts, counts.c.period == series.c.d))
 
-        return [{"period": row.period, "count": row.count} for row in rows if row.period]
+    @staticmethod
+    def _stats_by_program_query(filtered: CTE) -> Select:
+        """Statistiques groupées par programme (via ApplicationCall.title).
 
-    async def _get_stats_by_program(
-        self,
-        call_id: str | None,
-        date_from: datetime | None,
-        date_to: datetime | None,
-    ) -> list[dict]:
-        """Statistiques groupées par programme (via ApplicationCall.title)."""
-        # Requête avec JOIN sur ApplicationCall
-        query = (
+        Le taux d'acceptation est calculé en SQL.
+        """
+        accepted = func.count().filter(
+            filtered.c.status == SubmittedApplicationStatus.ACCEPTED
+        )
+        return (
             select(
                 ApplicationCall.id.label("program_id"),
                 ApplicationCall.title.label("program_title"),
-                func.count(Application.id).label("total"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.ACCEPTED, 1),
-                        else_=0,
-                    )
-                ).label("accepted"),
+                func.count().label("total"),
+                accepted.label("accepted"),
+                cast(
+                    func.round(cast(accepted, Numeric) * 100 / func.count(), 1),
+                    Float,
+                ).label("acceptance_rate"),
             )
-            .select_from(Application)
-            .join(ApplicationCall, Application.call_id == ApplicationCall.id)
+            .select_from(filtered)
+            .join(ApplicationCall, filtered.c.call_id == ApplicationCall.id)
+            .group_by(ApplicationCall.id, ApplicationCall.title)
         )
 
-        if call_id == "spontaneous":
-            query = query.where(Application.call_id.is_(None))
-        elif call_id:
-            query = query.where(Application.call_id == call_id)
-        if date_from:
-            query = query.where(Application.submitted_at >= date_from)
-        if date_to:
-            query = query.where(Application.submitted_at <= date_to)
-
-        query = query.group_by(ApplicationCall.id, ApplicationCall.title).order_by(
-            func.count(Application.id).desc()
-        )
-
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        return [
-            {
-                "program_id": row.program_id,
-                "program_title": row.program_title,
-                "total": row.total,
-                "accepted": row.accepted or 0,
-                "acceptance_rate": (
-                    round((row.accepted or 0) / row.total * 100, 1) if row.total > 0 else 0
-                ),
-            }
-            for row in rows
-        ]
-
-    async def _get_stats_by_call(
-        self,
-        date_from: datetime | None,
-        date_to: datetime | None,
-    ) -> list[dict]:
-        """Statistiques détaillées par appel."""
-        # Sous-requêtes pour compter chaque statut avec case()
-        query = (
+    @staticmethod
+    def _stats_by_call_query(filtered: CTE) -> Select:
+        """Statistiques détaillées par appel (un ``COUNT(*) FILTER`` par statut)."""
+        return (
             select(
                 ApplicationCall.id.label("call_id"),
                 ApplicationCall.title.label("call_title"),
-                func.count(Application.id).label("total"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.SUBMITTED, 1),
-                        else_=0,
-                    )
-                ).label("submitted"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.UNDER_REVIEW, 1),
-                        else_=0,
-                    )
-                ).label("under_review"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.ACCEPTED, 1),
-                        else_=0,
-                    )
-                ).label("accepted"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.REJECTED, 1),
-                        else_=0,
-                    )
-                ).label("rejected"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.WAITLISTED, 1),
-                        else_=0,
-                    )
-                ).label("waitlisted"),
-                func.sum(
-                    case(
-                        (Application.status == SubmittedApplicationStatus.INCOMPLETE, 1),
-                        else_=0,
-                    )
-                ).label("incomplete"),
+                func.count().label("total"),
+                *(
+                    func.count()
+                    .filter(filtered.c.status == status)
+                    .label(status.value)
+                    for status in SubmittedApplicationStatus
+                ),
             )
-            .select_from(Application)
-            .join(ApplicationCall, Application.call_id == ApplicationCall.id)
-        )
-
-        if date_from:
-            query = query.where(Application.submitted_at >= date_from)
-        if date_to:
-            query = query.where(Application.submitted_at <= date_to)
-
-        query = query.group_by(ApplicationCall.id, ApplicationCall.title).order_by(
-            func.count(Application.id).desc()
+            .select_from(filtered)
+            .join(ApplicationCall, filtered.c.call_id == ApplicationCall.id)
+            .group_by(ApplicationCall.id, ApplicationCall.title)
         )
 
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        return [
-            {
-                "call_id": row.call_id,
-                "call_title": row.call_title,
-                "total": row.total,
-                "submitted": row.submitted or 0,
-                "under_review": row.under_review or 0,
-                "accepted": row.accepted or 0,
-                "rejected": row.rejected or 0,
-                "waitlisted": row.waitlisted or 0,
-                "incomplete": row.incomplete or 0,
-            }
-            for row in rows
-        ]
-
     # =========================================================================
     # APPLICATION CALL MEDIA LIBRARY
     # =========================================================================
@@ -1188,7 +1313,7 @@ class ApplicationService:
 
     async def add_album_to_call(self, call_id: str, album_external_id: str) -> None:
         """Associe un album à un appel."""
-        call = await self.get_call_by_id(call_id)
+        call = await self._get_call(call_id)
         if not call:
             raise NotFoundException("Appel non trouvé")
 
@@ -7,11 +7,12 @@ Logique métier pour la gestion des campus.
 
 from datetime import date
 from types import SimpleNamespace
-from uuid import uuid4
 
-from sqlalchemy import delete, or_, select, update
+from sqlalchemy import Date, case, delete, exists, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.campus import (
@@ -21,6 +22,7 @@ from app.models.campus import (
     CampusTeam,
 )
 from app.schemas.campus import CampusTranslateRequest, CampusTranslateResponse
+from app.services.row_writes import delete_by_id, update_returning
 from app.services.translation_service import (
     SUPPORTED_TARGETS,
     _lang_attr,
@@ -37,6 +39,43 @@ _CAMPUS_TRANSLATABLE = [
     ("description_md", "text"),
 ]
 
+# Socles immuables des requêtes de liste, construits une seule fois au
+# chargement du module (Select est génératif : chaque .where() renvoie une
+# copie). Les filtres ne sont que des paramètres liés, ce qui permet au cache
+# de compilation du moteur de réutiliser le SQL de chaque combinaison.
+_CAMPUS_LIST_QUERY = (
+    select(Campus)
+    .options(selectinload(Campus.team_members))
+    .order_by(Campus.is_headquarters.desc(), Campus.name)
+)
+_TEAM_LIST_QUERY = select(CampusTeam).order_by(
+    CampusTeam.display_order, CampusTeam.position
+)
+
+
+# Contraintes d'unicité de campuses → message de conflit
+_CAMPUS_UNIQUE_CONSTRAINTS = {
+    "uq_campuses_single_headquarters": "Un siège principal existe déjà",
+    "uq_campuses_code_upper": "Un campus avec ce code existe déjà",
+    "campuses_code_key": "Un campus avec ce code existe déjà",
+}
+
+
+def _campus_conflict(exc: IntegrityError) -> ConflictException | None:
+    """Traduit une violation d'unicité sur campuses en ConflictException."""
+    message = str(exc.orig)
+    for constraint, detail in _CAMPUS_UNIQUE_CONSTRAINTS.items():
+        if constraint in message:
+            return ConflictException(detail)
+    return None
+
+
+def _team_member_conflict(exc: IntegrityError) -> ConflictException | None:
+    """Traduit une violation de uq_campus_team_active_user en ConflictException."""
+    if "uq_campus_team_active_user" in str(exc.orig):
+        return ConflictException("Cet utilisateur est déjà dans l'équipe du campus")
+    return None
+
 
 class CampusService:
     """Service pour la gestion des campus."""
@@ -106,9 +145,11 @@ class CampusService:
         Returns:
             Requête SQLAlchemy Select.
         """
-        query = select(Campus).options(selectinload(Campus.team_members))
+        query = _CAMPUS_LIST_QUERY
 
         if search:
+            # Servi par les index GIN trigrammes (migration 042) : garder ILIKE
+            # sur les colonnes nues, sans lower() qui désactiverait l'index.
             search_filter = f"%{search}%"
             query = query.where(
                 or_(
@@ -128,25 +169,60 @@ class CampusService:
         if is_headquarters is not None:
             query = query.where(Campus.is_headquarters == is_headquarters)
 
-        query = query.order_by(Campus.is_headquarters.desc(), Campus.name)
         return query
 
     async def get_campus_by_id(self, campus_id: str) -> Campus | None:
-        """Récupère un campus par son ID."""
+        """Récupère un campus par son ID, avec son équipe."""
+        # Session.get : aucune requête si le campus est déjà dans la session
+        return await self.db.get(
+            Campus, campus_id, options=[selectinload(Campus.team_members)]
+        )
+
+    async def _get_campus_bare(self, campus_id: str) -> Campus | None:
+        """
+        Récupère la ligne d'un campus, sans son équipe, pour les écritures.
+
+        Passe par la carte d'identité de la session : un campus déjà chargé
+        (par la garde du routeur ou un appel précédent du service) est
+        renvoyé sans nouvelle requête SQL.
+        """
+        return await self.db.get(Campus, campus_id, options=[lazyload("*")])
+
+    async def campus_exists(self, campus_id: str) -> bool:
+        """Vérifie l'existence d'un campus sans le charger."""
         result = await self.db.execute(
-            select(Campus)
-            .options(selectinload(Campus.team_members))
-            .where(Campus.id == campus_id)
+            select(exists().where(Campus.id == campus_id))
         )
-        return result.scalar_one_or_none()
+        return result.scalar()
 
     async def get_campus_by_code(self, code: str) -> Campus | None:
-        """Récupère un campus par son code."""
+        """Récupère un campus par son code (insensible à la casse)."""
         result = await self.db.execute(
-            select(Campus).where(Campus.code == code.upper())
+            select(Campus).where(
+                func.upper(Campus.code) == Campus.normalize_code(code)
+            )
         )
         return result.scalar_one_or_none()
 
+    async def _check_code_available(
+        self, code: str, exclude_id: str | None = None
+    ) -> None:
+        """
+        Vérifie que le code (déjà normalisé) n'est pas pris par un autre campus.
+
+        Fait avant les traductions automatiques pour ne pas les lancer en
+        vain ; l'index unique uq_campuses_code_upper reste la garantie finale.
+
+        Raises:
+            ConflictException: Si le code existe déjà.
+        """
+        condition = func.upper(Campus.code) == code
+        if exclude_id:
+            condition = condition & (Campus.id != exclude_id)
+        result = await self.db.execute(select(exists().where(condition)))
+        if result.scalar():
+            raise ConflictException(f"Un campus avec le code '{code}' existe déjà")
+
     async def create_campus(
         self,
         code: str,
@@ -165,23 +241,14 @@ class CampusService:
             Campus créé.
 
         Raises:
-            ConflictException: Si le code existe déjà.
+            ConflictException: Si le code existe déjà ou si un siège existe déjà.
         """
-        code = code.upper()
-        existing = await self.get_campus_by_code(code)
-        if existing:
-            raise ConflictException(f"Un campus avec le code '{code}' existe déjà")
-
-        # Si c'est le siège, s'assurer qu'il n'y en a pas déjà un
-        if kwargs.get("is_headquarters"):
-            result = await self.db.execute(
-                select(Campus).where(Campus.is_headquarters == True)
-            )
-            if result.scalar_one_or_none():
-                raise ConflictException("Un siège principal existe déjà")
+        # Normalisé ici pour le contrôle préalable ; @validates("code") le
+        # réapplique de toute façon à l'instance.
+        code = Campus.normalize_code(code)
+        await self._check_code_available(code)
 
         campus = Campus(
-            id=str(uuid4()),
             code=code,
             name=name,
             **kwargs,
@@ -189,7 +256,15 @@ class CampusService:
         # Remplissage auto des traductions EN/AR vides (non bloquant).
         await autofill_translations(campus, _CAMPUS_TRANSLATABLE)
         self.db.add(campus)
-        await self.db.flush()
+        # Seul flush conservé : l'INSERT est émis ici pour remonter une
+        # violation de contrainte au service plutôt qu'au commit de get_db.
+        try:
+            await self.db.flush()
+        except IntegrityError as exc:
+            conflict = _campus_conflict(exc)
+            if conflict is None:
+                raise
+            raise conflict from exc
         return campus
 
     async def update_campus(self, campus_id: str, **kwargs) -> Campus:
@@ -207,39 +282,30 @@ class CampusService:
             NotFoundException: Si le campus n'existe pas.
             ConflictException: Si le nouveau code existe déjà ou si on tente d'ajouter un second siège.
         """
-        campus = await self.get_campus_by_id(campus_id)
+        campus = await self._get_campus_bare(campus_id)
         if not campus:
             raise NotFoundException("Campus non trouvé")
 
-        # Vérifier l'unicité du code si modifié
-        if "code" in kwargs and kwargs["code"]:
-            kwargs["code"] = kwargs["code"].upper()
+        # Unicité du code si modifié (le siège unique est garanti par l'index
+        # partiel uq_campuses_single_headquarters)
+        if kwargs.get("code"):
+            # UPDATE Core : @validates ne s'applique pas, normaliser ici
+            kwargs["code"] = Campus.normalize_code(kwargs["code"])
             if kwargs["code"] != campus.code:
-                existing = await self.get_campus_by_code(kwargs["code"])
-                if existing:
-                    raise ConflictException(
-                        f"Un campus avec le code '{kwargs['code']}' existe déjà"
-                    )
-
-        # Vérifier la contrainte du siège unique si modifié
-        if kwargs.get("is_headquarters") and not campus.is_headquarters:
-            result = await self.db.execute(
-                select(Campus).where(
-                    Campus.is_headquarters == True,
-                    Campus.id != campus_id,
-                )
-            )
-            if result.scalar_one_or_none():
-                raise ConflictException("Un siège principal existe déjà")
+                await self._check_code_available(kwargs["code"], exclude_id=campus_id)
 
         # Remplissage auto des traductions EN/AR encore vides (non bloquant).
         await self._autofill_into_kwargs(campus, kwargs, _CAMPUS_TRANSLATABLE)
 
-        await self.db.execute(
-            update(Campus).where(Campus.id == campus_id).values(**kwargs)
-        )
-        await self.db.flush()
-        return await self.get_campus_by_id(campus_id)
+        if not kwargs:
+            return campus
+        try:
+            return await update_returning(self.db, Campus, campus_id, kwargs)
+        except IntegrityError as exc:
+            conflict = _campus_conflict(exc)
+            if conflict is None:
+                raise
+            raise conflict from exc
 
     async def delete_campus(self, campus_id: str) -> None:
         """
@@ -251,26 +317,19 @@ class CampusService:
         Raises:
             NotFoundException: Si le campus n'existe pas.
         """
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
+        if not await delete_by_id(self.db, Campus, campus_id):
             raise NotFoundException("Campus non trouvé")
 
-        await self.db.execute(delete(Campus).where(Campus.id == campus_id))
-        await self.db.flush()
-
     async def toggle_campus_active(self, campus_id: str) -> Campus:
         """Bascule le statut actif d'un campus."""
-        campus = await self.get_campus_by_id(campus_id)
+        # Bascule côté serveur : pas de lecture préalable ni de course
+        # lecture-modification-écriture.
+        campus = await update_returning(
+            self.db, Campus, campus_id, {"active": ~Campus.active}
+        )
         if not campus:
             raise NotFoundException("Campus non trouvé")
-
-        await self.db.execute(
-            update(Campus)
-            .where(Campus.id == campus_id)
-            .values(active=not campus.active)
-        )
-        await self.db.flush()
-        return await self.get_campus_by_id(campus_id)
+        return campus
 
     # =========================================================================
     # CAMPUS TEAM
@@ -291,7 +350,7 @@ class CampusService:
         Returns:
             Requête SQLAlchemy Select.
         """
-        query = select(CampusTeam)
+        query = _TEAM_LIST_QUERY
 
         if campus_id:
             query = query.where(CampusTeam.campus_id == campus_id)
@@ -299,15 +358,11 @@ class CampusService:
         if active is not None:
             query = query.where(CampusTeam.active == active)
 
-        query = query.order_by(CampusTeam.display_order, CampusTeam.position)
         return query
 
     async def get_team_member_by_id(self, team_member_id: str) -> CampusTeam | None:
         """Récupère un membre d'équipe par son ID."""
-        result = await self.db.execute(
-            select(CampusTeam).where(CampusTeam.id == team_member_id)
-        )
-        return result.scalar_one_or_none()
+        return await self.db.get(CampusTeam, team_member_id)
 
     async def create_team_member(
         self,
@@ -332,30 +387,29 @@ class CampusService:
             NotFoundException: Si le campus n'existe pas.
             ConflictException: Si l'utilisateur est déjà dans l'équipe.
         """
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
+        if not await self.campus_exists(campus_id):
             raise NotFoundException("Campus non trouvé")
 
-        # Vérifier que l'utilisateur n'est pas déjà dans l'équipe
+        # L'index unique partiel uq_campus_team_active_user garantit qu'un
+        # utilisateur n'est actif qu'une fois par équipe : pas de SELECT préalable.
         result = await self.db.execute(
-            select(CampusTeam).where(
-                CampusTeam.campus_id == campus_id,
-                CampusTeam.user_external_id == user_external_id,
-                CampusTeam.active == True,
+            pg_insert(CampusTeam)
+            .values(
+                campus_id=campus_id,
+                user_external_id=user_external_id,
+                position=position,
+                **kwargs,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[CampusTeam.campus_id, CampusTeam.user_external_id],
+                index_where=CampusTeam.active,
             )
+            .returning(CampusTeam)
+            .options(lazyload("*"))
         )
-        if result.scalar_one_or_none():
+        team_member = result.scalar_one_or_none()
+        if team_member is None:
             raise ConflictException("Cet utilisateur est déjà dans l'équipe du campus")
-
-        team_member = CampusTeam(
-            id=str(uuid4()),
-            campus_id=campus_id,
-            user_external_id=user_external_id,
-            position=position,
-            **kwargs,
-        )
-        self.db.add(team_member)
-        await self.db.flush()
         return team_member
 
     async def update_team_member(self, team_member_id: str, **kwargs) -> CampusTeam:
@@ -371,16 +425,17 @@ class CampusService:
 
         Raises:
             NotFoundException: Si le membre n'existe pas.
+            ConflictException: Si l'utilisateur est déjà actif dans l'équipe.
         """
-        team_member = await self.get_team_member_by_id(team_member_id)
+        if kwargs:
+            team_member = await self._update_team_member_returning(
+                team_member_id, **kwargs
+            )
+        else:
+            team_member = await self.get_team_member_by_id(team_member_id)
         if not team_member:
             raise NotFoundException("Membre d'équipe non trouvé")
-
-        await self.db.execute(
-            update(CampusTeam).where(CampusTeam.id == team_member_id).values(**kwargs)
-        )
-        await self.db.flush()
-        return await self.get_team_member_by_id(team_member_id)
+        return team_member
 
     async def delete_team_member(self, team_member_id: str) -> None:
         """
@@ -392,28 +447,33 @@ class CampusService:
         Raises:
             NotFoundException: Si le membre n'existe pas.
         """
-        team_member = await self.get_team_member_by_id(team_member_id)
-        if not team_member:
+        if not await delete_by_id(self.db, CampusTeam, team_member_id):
             raise NotFoundException("Membre d'équipe non trouvé")
 
-        await self.db.execute(
-            delete(CampusTeam).where(CampusTeam.id == team_member_id)
-        )
-        await self.db.flush()
-
     async def toggle_team_member_active(self, team_member_id: str) -> CampusTeam:
         """Bascule le statut actif d'un membre d'équipe."""
-        team_member = await self.get_team_member_by_id(team_member_id)
+        team_member = await self._update_team_member_returning(
+            team_member_id, active=~CampusTeam.active
+        )
         if not team_member:
             raise NotFoundException("Membre d'équipe non trouvé")
+        return team_member
 
-        await self.db.execute(
-            update(CampusTeam)
-            .where(CampusTeam.id == team_member_id)
-            .values(active=not team_member.active)
-        )
-        await self.db.flush()
-        return await self.get_team_member_by_id(team_member_id)
+    async def _update_team_member_returning(
+        self, team_member_id: str, **values
+    ) -> CampusTeam | None:
+        """
+        UPDATE ... RETURNING d'un membre d'équipe, la violation de l'index
+        partiel uq_campus_team_active_user (réactivation ou changement
+        d'utilisateur déjà actif dans l'équipe) devenant un conflit.
+        """
+        try:
+            return await update_returning(self.db, CampusTeam, team_member_id, values)
+        except IntegrityError as exc:
+            conflict = _team_member_conflict(exc)
+            if conflict is None:
+                raise
+            raise conflict from exc
 
     async def reorder_team_members(self, team_member_ids: list[str]) -> list[CampusTeam]:
         """
@@ -425,20 +485,25 @@ class CampusService:
         Returns:
             Liste des membres réordonnés.
         """
-        for index, member_id in enumerate(team_member_ids):
-            await self.db.execute(
-                update(CampusTeam)
-                .where(CampusTeam.id == member_id)
-                .values(display_order=index)
+        if not team_member_ids:
+            return []
+
+        # Un seul UPDATE ... CASE pour toute l'équipe au lieu d'un par membre
+        new_order = case(
+            *(
+                (CampusTeam.id == member_id, index)
+                for index, member_id in enumerate(team_member_ids)
             )
-        await self.db.flush()
-
+        )
         result = await self.db.execute(
-            select(CampusTeam)
+            update(CampusTeam)
             .where(CampusTeam.id.in_(team_member_ids))
-            .order_by(CampusTeam.display_order)
+            .values(display_order=new_order)
+            .returning(CampusTeam)
+            .options(lazyload("*")),
+            execution_options={"synchronize_session": False, "populate_existing": True},
         )
-        return list(result.scalars().all())
+        return sorted(result.scalars().all(), key=lambda member: member.display_order)
 
     # =========================================================================
     # CAMPUS PARTNERS
@@ -446,14 +511,15 @@ class CampusService:
 
     async def get_campus_partners(self, campus_id: str) -> list[CampusPartner]:
         """Récupère les partenaires d'un campus."""
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
-            raise NotFoundException("Campus non trouvé")
-
         result = await self.db.execute(
             select(CampusPartner).where(CampusPartner.campus_id == campus_id)
         )
-        return list(result.scalars().all())
+        partners = list(result.scalars().all())
+        # Le campus n'est vérifié que si la liste est vide (aucun partenaire
+        # ou campus inexistant) : un seul aller-retour dans le cas courant.
+        if not partners and not await self.campus_exists(campus_id):
+            raise NotFoundException("Campus non trouvé")
+        return partners
 
     async def add_partner_to_campus(
         self,
@@ -478,28 +544,35 @@ class CampusService:
             NotFoundException: Si le campus n'existe pas.
             ConflictException: Si le partenariat existe déjà.
         """
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
-            raise NotFoundException("Campus non trouvé")
-
-        # Vérifier si le partenariat existe déjà
+        # INSERT ... SELECT FROM campuses : aucune ligne si le campus n'existe
+        # pas ; le doublon est absorbé par la clé primaire (ON CONFLICT).
         result = await self.db.execute(
-            select(CampusPartner).where(
-                CampusPartner.campus_id == campus_id,
-                CampusPartner.partner_external_id == partner_external_id,
+            pg_insert(CampusPartner)
+            .from_select(
+                ["campus_id", "partner_external_id", "start_date", "end_date"],
+                select(
+                    Campus.id,
+                    literal(
+                        partner_external_id, CampusPartner.partner_external_id.type
+                    ),
+                    literal(start_date, Date()),
+                    literal(end_date, Date()),
+                ).where(Campus.id == campus_id),
             )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    CampusPartner.campus_id,
+                    CampusPartner.partner_external_id,
+                ]
+            )
+            .returning(CampusPartner)
         )
-        if result.scalar_one_or_none():
+        partner = result.scalar_one_or_none()
+        if partner is None:
+            # Cas rare : un second aller-retour départage 404 et doublon
+            if not await self.campus_exists(campus_id):
+                raise NotFoundException("Campus non trouvé")
             raise ConflictException("Ce partenaire est déjà associé au campus")
-
-        partner = CampusPartner(
-            campus_id=campus_id,
-            partner_external_id=partner_external_id,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        self.db.add(partner)
-        await self.db.flush()
         return partner
 
     async def update_campus_partner(
@@ -509,33 +582,29 @@ class CampusService:
         **kwargs,
     ) -> CampusPartner:
         """Met à jour les dates d'un partenariat."""
-        result = await self.db.execute(
-            select(CampusPartner).where(
-                CampusPartner.campus_id == campus_id,
-                CampusPartner.partner_external_id == partner_external_id,
-            )
+        condition = (
+            CampusPartner.campus_id == campus_id,
+            CampusPartner.partner_external_id == partner_external_id,
         )
+        if kwargs:
+            # UPDATE ... RETURNING : vérification, écriture et relecture en une fois
+            result = await self.db.execute(
+                update(CampusPartner)
+                .where(*condition)
+                .values(**kwargs)
+                .returning(CampusPartner),
+                execution_options={
+                    "synchronize_session": False,
+                    "populate_existing": True,
+                },
+            )
+        else:
+            result = await self.db.execute(select(CampusPartner).where(*condition))
+
         partner = result.scalar_one_or_none()
         if not partner:
             raise NotFoundException("Partenariat non trouvé")
-
-        await self.db.execute(
-            update(CampusPartner)
-            .where(
-                CampusPartner.campus_id == campus_id,
-                CampusPartner.partner_external_id == partner_external_id,
-            )
-            .values(**kwargs)
-        )
-        await self.db.flush()
-
-        result = await self.db.execute(
-            select(CampusPartner).where(
-                CampusPartner.campus_id == campus_id,
-                CampusPartner.partner_external_id == partner_external_id,
-            )
-        )
-        return result.scalar_one()
+        return partner
 
     async def remove_partner_from_campus(
         self, campus_id: str, partner_external_id: str
@@ -551,38 +620,32 @@ class CampusService:
             NotFoundException: Si le partenariat n'existe pas.
         """
         result = await self.db.execute(
-            select(CampusPartner).where(
+            delete(CampusPartner)
+            .where(
                 CampusPartner.campus_id == campus_id,
                 CampusPartner.partner_external_id == partner_external_id,
             )
+            .returning(CampusPartner.campus_id),
+            execution_options={"synchronize_session": False},
         )
-        if not result.scalar_one_or_none():
+        if result.scalar_one_or_none() is None:
             raise NotFoundException("Partenariat non trouvé")
 
-        await self.db.execute(
-            delete(CampusPartner).where(
-                CampusPartner.campus_id == campus_id,
-                CampusPartner.partner_external_id == partner_external_id,
-            )
-        )
-        await self.db.flush()
-
     # =========================================================================
     # CAMPUS MEDIA LIBRARY
     # =========================================================================
 
     async def get_campus_albums(self, campus_id: str) -> list[str]:
         """Récupère les IDs d'albums associés à un campus."""
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
-            raise NotFoundException("Campus non trouvé")
-
         result = await self.db.execute(
             select(CampusMediaLibrary.album_external_id).where(
                 CampusMediaLibrary.campus_id == campus_id
             )
         )
-        return [row[0] for row in result.all()]
+        album_ids = list(result.scalars().all())
+        if not album_ids and not await self.campus_exists(campus_id):
+            raise NotFoundException("Campus non trouvé")
+        return album_ids
 
     async def add_album_to_campus(
         self, campus_id: str, album_external_id: str
@@ -598,26 +661,78 @@ class CampusService:
             NotFoundException: Si le campus n'existe pas.
             ConflictException: Si l'album est déjà associé.
         """
-        campus = await self.get_campus_by_id(campus_id)
-        if not campus:
-            raise NotFoundException("Campus non trouvé")
-
-        # Vérifier si la liaison existe déjà
+        # Même schéma que add_partner_to_campus : INSERT ... SELECT FROM campuses
         result = await self.db.execute(
-            select(CampusMediaLibrary).where(
-                CampusMediaLibrary.campus_id == campus_id,
-                CampusMediaLibrary.album_external_id == album_external_id,
+            pg_insert(CampusMediaLibrary)
+            .from_select(
+                ["campus_id", "album_external_id"],
+                select(
+                    Campus.id,
+                    literal(
+                        album_external_id, CampusMediaLibrary.album_external_id.type
+                    ),
+                ).where(Campus.id == campus_id),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    CampusMediaLibrary.campus_id,
+                    CampusMediaLibrary.album_external_id,
+                ]
             )
+            .returning(CampusMediaLibrary.campus_id)
         )
-        if result.scalar_one_or_none():
+        if result.scalar_one_or_none() is None:
+            if not await self.campus_exists(campus_id):
+                raise NotFoundException("Campus non trouvé")
             raise ConflictException("Cet album est déjà associé au campus")
 
-        link = CampusMediaLibrary(
-            campus_id=campus_id,
-            album_external_id=album_external_id,
+    async def add_albums_to_campus(
+        self, campus_id: str, album_external_ids: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """
+        Ajoute plusieurs albums à la médiathèque d'un campus.
+
+        Un seul INSERT multi-lignes ``ON CONFLICT DO NOTHING RETURNING`` quel
+        que soit le nombre d'albums ; les albums déjà associés sont ignorés.
+
+        Args:
+            campus_id: ID du campus.
+            album_external_ids: IDs des albums.
+
+        Returns:
+            Tuple (albums ajoutés, albums déjà associés), dans l'ordre reçu.
+
+        Raises:
+            NotFoundException: Si le campus n'existe pas.
+        """
+        if not await self.campus_exists(campus_id):
+            raise NotFoundException("Campus non trouvé")
+
+        # PostgreSQL renvoie les UUID en minuscules : normaliser pour comparer
+        album_ids = list(dict.fromkeys(a.lower() for a in album_external_ids))
+        if not album_ids:
+            return [], []
+
+        result = await self.db.execute(
+            pg_insert(CampusMediaLibrary)
+            .values(
+                [
+                    {"campus_id": campus_id, "album_external_id": album_id}
+                    for album_id in album_ids
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    CampusMediaLibrary.campus_id,
+                    CampusMediaLibrary.album_external_id,
+                ]
+            )
+            .returning(CampusMediaLibrary.album_external_id)
         )
-        self.db.add(link)
-        await self.db.flush()
+        inserted = set(result.scalars().all())
+        added = [album_id for album_id in album_ids if album_id in inserted]
+        duplicates = [album_id for album_id in album_ids if album_id not in inserted]
+        return added, duplicates
 
     async def remove_album_from_campus(
         self, campus_id: str, album_external_id: str
@@ -633,18 +748,13 @@ class CampusService:
             NotFoundException: Si l'association n'existe pas.
         """
         result = await self.db.execute(
-            select(CampusMediaLibrary).where(
+            delete(CampusMediaLibrary)
+            .where(
                 CampusMediaLibrary.campus_id == campus_id,
                 CampusMediaLibrary.album_external_id == album_external_id,
             )
+            .returning(CampusMediaLibrary.campus_id),
+            execution_options={"synchronize_session": False},
         )
-        if not result.scalar_one_or_none():
+        if result.scalar_one_or_none() is None:
             raise NotFoundException("Cette association n'existe pas")
-
-        await self.db.execute(
-            delete(CampusMediaLibrary).where(
-                CampusMediaLibrary.campus_id == campus_id,
-                CampusMediaLibrary.album_external_id == album_external_id,
-            )
-        )
-        await self.db.flush()
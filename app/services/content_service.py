@@ -5,15 +5,49 @@ Service Content
 Logique métier pour la gestion des actualités et événements.
 """
 
-from datetime import datetime
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from operator import attrgetter
 from types import SimpleNamespace
-from uuid import uuid4
 
-from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    String,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import (
+    lazyload,
+    make_transient_to_detached,
+    raiseload,
+    selectinload,
+    with_expression,
+)
 
-from app.core.exceptions import ConflictException, NotFoundException
+from app.core.cache import cache, make_key
+from app.core.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
+from app.database import async_session_maker
 from app.models.base import PublicationStatus
 from app.models.campus import Campus
 from app.models.content import (
@@ -45,6 +79,7 @@ from app.schemas.content import (
     TagTranslateRequest,
     TagTranslateResponse,
 )
+from app.services.row_writes import delete_by_id, update_returning
 from app.services.translation_service import (
     SUPPORTED_TARGETS,
     _lang_attr,
@@ -69,16 +104,351 @@ _EVENT_TRANSLATABLE = [
     ("description", "text"),
 ]
 
+# Relations nécessaires à la sérialisation NewsWithTags (tags + ids externes).
+# raiseload("*") : toute autre relation (media_library…) n'est pas chargée
+# (malgré lazy="selectin") et y accéder lève une erreur au lieu d'émettre un
+# SELECT implicite par ligne.
+_NEWS_LOAD_OPTIONS = (
+    selectinload(News.tags),
+    selectinload(News.news_campuses),
+    selectinload(News.news_services),
+    raiseload("*"),
+)
+_EVENT_LOAD_OPTIONS = (selectinload(Event.registrations), raiseload("*"))
+
+# Lectures par slug, construites une seule fois au chargement du module : le
+# slug est un paramètre lié (:slug), la clé du cache de compilation et le SQL
+# restent identiques d'un appel à l'autre, donc aussi le statement préparé
+# asyncpg réutilisé sur la connexion (prepared_statement_cache_size).
+_TAG_BY_SLUG = select(Tag).where(Tag.slug == bindparam("slug"))
+_EVENT_BY_SLUG = (
+    select(Event).options(*_EVENT_LOAD_OPTIONS).where(Event.slug == bindparam("slug"))
+)
+_NEWS_BY_SLUG = (
+    select(News).options(*_NEWS_LOAD_OPTIONS).where(News.slug == bindparam("slug"))
+)
 
-def add_months(date: datetime, months: int) -> datetime:
-    """Ajoute des mois à une date (sans dateutil)."""
-    month = date.month - 1 + months
-    year = date.year + month // 12
-    month = month % 12 + 1
-    # Gérer les jours qui dépassent le mois
-    day = min(date.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28,
-                         31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1])
-    return date.replace(year=year, month=month, day=day)
+# Colonnes recopiées par duplicate_event / duplicate_news (INSERT ... SELECT) ;
+# titre, slug et statut sont fixés par la duplication.
+_EVENT_COPIED_COLUMNS = (
+    "description",
+    "content_html",
+    "content_md",
+    "title_en",
+    "title_ar",
+    "description_en",
+    "description_ar",
+    "content_en_html",
+    "content_en_md",
+    "content_ar_html",
+    "content_ar_md",
+    "type",
+    "type_other",
+    "start_date",
+    "end_date",
+    "venue",
+    "address",
+    "city",
+    "latitude",
+    "longitude",
+    "is_online",
+    "video_conference_link",
+    "registration_required",
+    "max_attendees",
+    "cover_image_external_id",
+    "country_external_id",
+    "campus_external_id",
+    "service_external_id",
+)
+_NEWS_COPIED_COLUMNS = (
+    "summary",
+    "content_html",
+    "content_md",
+    "title_en",
+    "title_ar",
+    "summary_en",
+    "summary_ar",
+    "content_en_html",
+    "content_en_md",
+    "content_ar_html",
+    "content_ar_md",
+    "video_url",
+    "cover_image_external_id",
+    "sector_external_id",
+    "event_external_id",
+    "project_external_id",
+    "call_external_id",
+    "author_external_id",
+    "highlight_status",
+)
+
+# Champs recopiés tels quels dans les actualités enrichies (NewsPublicEnriched)
+# et dans leurs tags (TagRead) : un attrgetter lit tous les attributs en un
+# appel, dict(zip(...)) construit le dictionnaire sans littéral clé par clé.
+_NEWS_ENRICHED_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "summary",
+    "content_html",
+    "content_md",
+    "title_en",
+    "title_ar",
+    "summary_en",
+    "summary_ar",
+    "content_en_html",
+    "content_en_md",
+    "content_ar_html",
+    "content_ar_md",
+    "video_url",
+    "highlight_status",
+    "cover_image_external_id",
+    "campus_external_ids",
+    "sector_external_id",
+    "service_external_ids",
+    "event_external_id",
+    "project_external_id",
+    "call_external_id",
+    "program_external_id",
+    "author_external_id",
+    "status",
+    "published_at",
+    "visible_from",
+    "created_at",
+    "updated_at",
+)
+_news_values = attrgetter(*_NEWS_ENRICHED_FIELDS)
+_TAG_FIELDS = (
+    "id",
+    "name",
+    "slug",
+    "icon",
+    "description",
+    "name_en",
+    "name_ar",
+    "description_en",
+    "description_ar",
+    "created_at",
+)
+_tag_values = attrgetter(*_TAG_FIELDS)
+
+
+def _enrich_rows(
+    news_list: list[News], names: dict[str, dict[str, str]]
+) -> list[dict]:
+    """Construit les dictionnaires NewsPublicEnriched d'une liste d'actualités.
+
+    Boucle CPU pure (aucune I/O), isolée de ``enrich_news_with_names`` pour
+    être profilée seule ; les ``dict.get`` des tables de noms sont liés une
+    fois hors de la boucle.
+
+    Args:
+        news_list: Actualités (tags en JSON via ``tags_json`` ou chargés)
+        names: Noms résolus ``{kind: {id: nom}}`` (cf. ``_load_names_bulk``)
+    """
+    campus_name = names["campus"].get
+    sector_name = names["sector"].get
+    service_name = names["service"].get
+    project_name = names["project"].get
+    call_name = names["call"].get
+    program_name = names["program"].get
+    event_name = names["event"].get
+    author_name = names["author"].get
+
+    enriched_list: list[dict] = []
+    append = enriched_list.append
+    for news in news_list:
+        # Tags déjà sérialisés par PostgreSQL (get_news(tags_as_json=True)),
+        # sinon conversion des objets ORM en dictionnaires
+        tags_data = news.tags_json
+        if tags_data is None:
+            tags_data = [dict(zip(_TAG_FIELDS, _tag_values(tag))) for tag in news.tags]
+
+        enriched = dict(zip(_NEWS_ENRICHED_FIELDS, _news_values(news)))
+        enriched["tags"] = tags_data
+        # Noms résolus (ids relus dans ``enriched`` : les listes de campus et
+        # services sont des propriétés recalculées à chaque accès)
+        sector_id = enriched["sector_external_id"]
+        project_id = enriched["project_external_id"]
+        call_id = enriched["call_external_id"]
+        program_id = enriched["program_external_id"]
+        event_id = enriched["event_external_id"]
+        author_id = enriched["author_external_id"]
+        enriched["campus_names"] = [
+            campus_name(str(cid), str(cid)) for cid in enriched["campus_external_ids"]
+        ]
+        enriched["sector_name"] = sector_name(str(sector_id)) if sector_id else None
+        enriched["service_names"] = [
+            service_name(str(sid), str(sid)) for sid in enriched["service_external_ids"]
+        ]
+        enriched["project_name"] = project_name(str(project_id)) if project_id else None
+        enriched["call_name"] = call_name(str(call_id)) if call_id else None
+        enriched["program_name"] = program_name(str(program_id)) if program_id else None
+        enriched["event_name"] = event_name(str(event_id)) if event_id else None
+        enriched["author_name"] = author_name(str(author_id)) if author_id else None
+        append(enriched)
+    return enriched_list
+
+
+# Tags d'une actualité agrégés côté base au format TagRead (liste JSON, triée
+# par nom). jsonb et non json : get_news applique un DISTINCT.
+_NEWS_TAGS_JSON = (
+    select(
+        func.coalesce(
+            func.jsonb_agg(
+                aggregate_order_by(
+                    func.jsonb_build_object(
+                        "id", Tag.id,
+                        "name", Tag.name,
+                        "slug", Tag.slug,
+                        "icon", Tag.icon,
+                        "description", Tag.description,
+                        "name_en", Tag.name_en,
+                        "name_ar", Tag.name_ar,
+                        "description_en", Tag.description_en,
+                        "description_ar", Tag.description_ar,
+                        "created_at", Tag.created_at,
+                    ),
+                    Tag.name,
+                )
+            ),
+            literal_column("'[]'::jsonb"),
+            type_=JSONB,
+        )
+    )
+    .select_from(NewsTag)
+    .join(Tag, Tag.id == NewsTag.tag_id)
+    .where(NewsTag.news_id == News.id)
+    .correlate(News)
+    .scalar_subquery()
+)
+
+# Événements publiés par type, agrégés en objet JSONB {type: nombre} pour être
+# lus dans la même requête que les compteurs de statut
+_event_type_counts = (
+    select(Event.type.label("type"), func.count().label("count"))
+    .where(Event.status == PublicationStatus.PUBLISHED)
+    .group_by(Event.type)
+    .subquery("type_counts")
+)
+_EVENT_TYPES_JSON = select(
+    func.coalesce(
+        func.jsonb_object_agg(_event_type_counts.c.type, _event_type_counts.c.count),
+        literal_column("'{}'::jsonb"),
+        type_=JSONB,
+    )
+).scalar_subquery()
+
+
+def _timeline_query(column, *criteria) -> Select:
+    """
+    Comptage par mois de ``column`` entre les paramètres ``:start`` et ``:end``.
+
+    La série des mois est générée côté PostgreSQL (``generate_series``) puis
+    jointe aux comptages : une ligne ``(period 'YYYY-MM', count)`` par mois,
+    mois vides compris, dans l'ordre chronologique.
+    """
+    start = bindparam("start", type_=column.type)
+    end = bindparam("end", type_=column.type)
+    one_month = literal_column("interval '1 month'")
+
+    # Mois tronqués en UTC, comme les bornes (indépendant du fuseau de session)
+    month = func.date_trunc("month", column, "UTC")
+    counts = (
+        select(month.label("month"), func.count().label("count"))
+        .where(column >= start, column < end, *criteria)
+        .group_by(month)
+        .cte("counts")
+    )
+    # Série en horodatages UTC sans fuseau : l'ajout d'un mois ne dépend pas
+    # du fuseau de la session
+    series = (
+        func.generate_series(
+            func.timezone("UTC", start), func.timezone("UTC", end) - one_month, one_month
+        )
+        .table_valued("m")
+        .render_derived(name="months")
+    )
+    return (
+        select(
+            func.to_char(series.c.m, "YYYY-MM").label("period"),
+            func.coalesce(counts.c.count, 0).label("count"),
+        )
+        .select_from(
+            series.outerjoin(counts, counts.c.month == func.timezone("UTC", series.c.m))
+        )
+        .order_by(series.c.m)
+    )
+
+
+# Requêtes des statistiques, construites une seule fois : l'instant de
+# référence et les bornes de la timeline sont des paramètres liés, la clé du
+# cache de compilation reste donc identique d'un appel à l'autre.
+_event_published = Event.status == PublicationStatus.PUBLISHED
+_EVENT_STATS_COUNTS = select(
+    func.count().label("total"),
+    func.count().filter(_event_published).label("published"),
+    func.count().filter(Event.status == PublicationStatus.DRAFT).label("draft"),
+    func.count().filter(Event.status == PublicationStatus.ARCHIVED).label("archived"),
+    func.count()
+    .filter(_event_published, Event.start_date >= bindparam("now"))
+    .label("upcoming"),
+    func.count()
+    .filter(_event_published, Event.start_date < bindparam("now"))
+    .label("past"),
+    _EVENT_TYPES_JSON.label("by_type"),
+)
+_EVENT_TIMELINE = _timeline_query(Event.start_date)
+
+_news_published = News.status == PublicationStatus.PUBLISHED
+_NEWS_STATS_COUNTS = select(
+    func.count().label("total"),
+    func.count().filter(_news_published).label("published"),
+    func.count().filter(News.status == PublicationStatus.DRAFT).label("draft"),
+    func.count().filter(News.status == PublicationStatus.ARCHIVED).label("archived"),
+    func.count()
+    .filter(_news_published, News.highlight_status == NewsHighlightStatus.HEADLINE)
+    .label("headline"),
+    func.count()
+    .filter(_news_published, News.highlight_status == NewsHighlightStatus.FEATURED)
+    .label("featured"),
+)
+_NEWS_TIMELINE = _timeline_query(News.published_at, _news_published)
+
+# Cache des statistiques (espaces de noms, TTL en secondes). Invalidé à chaque
+# écriture sur les événements (resp. actualités).
+_EVENT_STATS_CACHE = "event_stats"
+_NEWS_STATS_CACHE = "news_stats"
+_STATS_TTL = 120
+# Tags par ID / slug (dimension petite et rarement modifiée). Invalidé à chaque
+# écriture sur les tags.
+_TAG_CACHE = "tags"
+_TAG_TTL = 60
+
+
+def _unique_conflict(
+    exc: IntegrityError, messages: dict[str, str]
+) -> ConflictException | None:
+    """Traduit une violation d'unicité connue (nom de contrainte → message)
+    en ConflictException ; None si la contrainte n'est pas listée."""
+    text = str(exc.orig)
+    for constraint, detail in messages.items():
+        if constraint in text:
+            return ConflictException(detail)
+    return None
+
+
+def month_buckets(now: datetime, months: int) -> list[datetime]:
+    """
+    Bornes des ``months`` derniers mois (mois courant inclus) : ``months + 1``
+    débuts de mois consécutifs, le dernier étant le début du mois suivant.
+    """
+    first = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    base = first.year * 12 + first.month - months
+    return [
+        first.replace(year=year, month=month + 1)
+        for year, month in (divmod(base + i, 12) for i in range(months + 1))
+    ]
 
 
 class ContentService:
@@ -86,6 +456,47 @@ class ContentService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Noms déjà résolus par _load_names_bulk : {kind: {id: nom}}
+        self._name_cache: defaultdict[str, dict[str, str]] = defaultdict(dict)
+
+    async def _exists(self, stmt) -> bool:
+        """
+        Teste si une requête renvoie au moins une ligne, sans charger de
+        colonnes (``SELECT 1 ... LIMIT 1``).
+
+        Args:
+            stmt: Requête ``select(...)`` portant les critères (les colonnes
+                sélectionnées sont ignorées).
+        """
+        result = await self.db.execute(stmt.with_only_columns(literal(1)).limit(1))
+        return result.scalar() is not None
+
+    async def _duplicate_row(self, model, source_id: str, columns, **overrides):
+        """
+        Duplique une ligne côté base (``INSERT ... SELECT ... RETURNING``),
+        sans la charger en Python.
+
+        Args:
+            model: Modèle ORM ciblé.
+            source_id: ID de la ligne à copier.
+            columns: Noms des colonnes recopiées telles quelles.
+            overrides: Expressions SQL des colonnes fixées par la copie.
+
+        Returns:
+            La nouvelle instance (relations non chargées), ou None si la ligne
+            source n'existe pas.
+        """
+        table = model.__table__
+        source = select(
+            *(table.c[name] for name in columns), *overrides.values()
+        ).where(table.c.id == source_id)
+        result = await self.db.execute(
+            insert(model)
+            .from_select([*columns, *overrides], source)
+            .returning(model)
+            .options(lazyload("*"))
+        )
+        return result.scalar_one_or_none()
 
     # =========================================================================
     # TRADUCTION AUTO FR → EN/AR (convention additive — voir
@@ -202,8 +613,12 @@ class ContentService:
     # =========================================================================
 
     async def get_tags(self, search: str | None = None) -> select:
-        """Construit une requête pour lister les tags."""
-        query = select(Tag)
+        """Construit une requête pour lister les tags.
+
+        Requête Core sur la table (lignes brutes, sans hydratation ORM) : la
+        liste est sérialisée telle quelle (cf. ``paginate(as_mappings=True)``).
+        """
+        query = select(Tag.__table__)
 
         if search:
             search_filter = f"%{search}%"
@@ -217,72 +632,110 @@ class ContentService:
         query = query.order_by(Tag.name)
         return query
 
+    async def _cached_tag(self, key: str) -> Tag | None:
+        """
+        Rattache à la session un tag lu dans le cache applicatif, sans requête.
+
+        Le cache ne contient que les colonnes : l'instance est reconstruite
+        puis marquée persistante (``make_transient_to_detached``) et
+        ``merge(load=False)`` l'intègre à la carte d'identité de la session.
+        """
+        data = cache.get(key)
+        if data is None:
+            return None
+        tag = Tag(**data)
+        make_transient_to_detached(tag)
+        return await self.db.merge(tag, load=False)
+
+    @staticmethod
+    def _cache_tag(tag: Tag | None) -> None:
+        """Met en cache les colonnes d'un tag, indexées par ID et par slug."""
+        if tag is None:
+            return
+        data = dict(zip(_TAG_FIELDS, _tag_values(tag)))
+        cache.set(make_key(_TAG_CACHE, "id", tag.id), data, _TAG_TTL)
+        cache.set(make_key(_TAG_CACHE, "slug", tag.slug), data, _TAG_TTL)
+
     async def get_tag_by_id(self, tag_id: str) -> Tag | None:
-        """Récupère un tag par son ID."""
-        result = await self.db.execute(select(Tag).where(Tag.id == tag_id))
-        return result.scalar_one_or_none()
+        """Récupère un tag par son ID (cache applicatif, puis session)."""
+        tag = await self._cached_tag(make_key(_TAG_CACHE, "id", tag_id))
+        if tag is None:
+            tag = await self.db.get(Tag, tag_id)
+            self._cache_tag(tag)
+        return tag
 
     async def get_tag_by_slug(self, slug: str) -> Tag | None:
-        """Récupère un tag par son slug."""
-        result = await self.db.execute(select(Tag).where(Tag.slug == slug))
-        return result.scalar_one_or_none()
+        """Récupère un tag par son slug (cache applicatif, puis base)."""
+        tag = await self._cached_tag(make_key(_TAG_CACHE, "slug", slug))
+        if tag is None:
+            result = await self.db.execute(_TAG_BY_SLUG, {"slug": slug})
+            tag = result.scalar_one_or_none()
+            self._cache_tag(tag)
+        return tag
 
     async def create_tag(self, name: str, slug: str, **kwargs) -> Tag:
         """Crée un nouveau tag."""
-        # Vérifier l'unicité
-        existing = await self.get_tag_by_slug(slug)
-        if existing:
-            raise ConflictException(f"Un tag avec le slug '{slug}' existe déjà")
-
-        result = await self.db.execute(select(Tag).where(Tag.name == name))
-        if result.scalar_one_or_none():
-            raise ConflictException(f"Un tag avec le nom '{name}' existe déjà")
-
-        tag = Tag(id=str(uuid4()), name=name, slug=slug, **kwargs)
+        tag = Tag(name=name, slug=slug, **kwargs)
         # Remplissage auto des traductions EN/AR vides (non bloquant).
         await autofill_translations(tag, _TAG_TRANSLATABLE)
         self.db.add(tag)
-        await self.db.flush()
+        # L'unicité du nom et du slug est garantie par les contraintes de la table
+        try:
+            await self.db.flush()
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._tag_conflicts(name, slug))
+            if conflict is None:
+                raise
+            raise conflict from exc
+        cache.invalidate(_TAG_CACHE)
         return tag
 
+    @staticmethod
+    def _tag_conflicts(name: str | None, slug: str | None) -> dict[str, str]:
+        """Messages de conflit des contraintes d'unicité de ``tags``."""
+        return {
+            "tags_slug_key": f"Un tag avec le slug '{slug}' existe déjà",
+            "tags_name_key": f"Un tag avec le nom '{name}' existe déjà",
+        }
+
+    @staticmethod
+    def _event_conflicts(slug: str | None) -> dict[str, str]:
+        """Message de conflit de la contrainte d'unicité du slug d'``events``."""
+        return {"events_slug_key": f"Un événement avec le slug '{slug}' existe déjà"}
+
+    @staticmethod
+    def _news_conflicts(slug: str | None) -> dict[str, str]:
+        """Message de conflit de la contrainte d'unicité du slug de ``news``."""
+        return {"news_slug_key": f"Une actualité avec le slug '{slug}' existe déjà"}
+
     async def update_tag(self, tag_id: str, **kwargs) -> Tag:
         """Met à jour un tag."""
         tag = await self.get_tag_by_id(tag_id)
         if not tag:
             raise NotFoundException("Tag non trouvé")
 
-        # Vérifier l'unicité si modifié
-        if "slug" in kwargs and kwargs["slug"] and kwargs["slug"] != tag.slug:
-            existing = await self.get_tag_by_slug(kwargs["slug"])
-            if existing:
-                raise ConflictException(
-                    f"Un tag avec le slug '{kwargs['slug']}' existe déjà"
-                )
-
-        if "name" in kwargs and kwargs["name"] and kwargs["name"] != tag.name:
-            result = await self.db.execute(
-                select(Tag).where(Tag.name == kwargs["name"])
-            )
-            if result.scalar_one_or_none():
-                raise ConflictException(
-                    f"Un tag avec le nom '{kwargs['name']}' existe déjà"
-                )
-
         # Remplissage auto des traductions EN/AR encore vides (non bloquant).
         await self._autofill_into_kwargs(tag, kwargs, _TAG_TRANSLATABLE)
 
-        await self.db.execute(update(Tag).where(Tag.id == tag_id).values(**kwargs))
-        await self.db.flush()
-        return await self.get_tag_by_id(tag_id)
+        if not kwargs:
+            return tag
+        try:
+            tag = await update_returning(self.db, Tag, tag_id, kwargs)
+        except IntegrityError as exc:
+            conflict = _unique_conflict(
+                exc, self._tag_conflicts(kwargs.get("name"), kwargs.get("slug"))
+            )
+            if conflict is None:
+                raise
+            raise conflict from exc
+        cache.invalidate(_TAG_CACHE)
+        return tag
 
     async def delete_tag(self, tag_id: str) -> None:
-        """Supprime un tag."""
-        tag = await self.get_tag_by_id(tag_id)
-        if not tag:
+        """Supprime un tag (``DELETE ... RETURNING id``)."""
+        if not await delete_by_id(self.db, Tag, tag_id):
             raise NotFoundException("Tag non trouvé")
-
-        await self.db.execute(delete(Tag).where(Tag.id == tag_id))
-        await self.db.flush()
+        cache.invalidate(_TAG_CACHE)
 
     async def merge_tags(self, source_tag_ids: list[str], target_tag_id: str) -> Tag:
         """Fusionne plusieurs tags vers un tag cible."""
@@ -290,36 +743,51 @@ class ContentService:
         if not target_tag:
             raise NotFoundException("Tag cible non trouvé")
 
-        # Transférer les associations
-        for source_id in source_tag_ids:
-            if source_id == target_tag_id:
-                continue
-
-            # Mettre à jour les news_tags
-            await self.db.execute(
-                update(NewsTag)
-                .where(NewsTag.tag_id == source_id)
-                .values(tag_id=target_tag_id)
+        sources = [s for s in source_tag_ids if s != target_tag_id]
+        if not sources:
+            return target_tag
+
+        # Une seule instruction : le CTE recopie les associations des sources
+        # vers la cible (doublons absorbés par la clé (news_id, tag_id)), puis
+        # la suppression des sources emporte leurs associations (ON DELETE
+        # CASCADE). Les deux parties lisent le même instantané.
+        moved = (
+            pg_insert(NewsTag)
+            .from_select(
+                ["news_id", "tag_id"],
+                select(NewsTag.news_id, literal(target_tag_id, NewsTag.tag_id.type)).where(
+                    NewsTag.tag_id.in_(sources)
+                ),
             )
-
-            # Supprimer le tag source
-            await self.db.execute(delete(Tag).where(Tag.id == source_id))
-
-        await self.db.flush()
+            .on_conflict_do_nothing()
+            .cte("moved")
+        )
+        await self.db.execute(
+            delete(Tag).where(Tag.id.in_(sources)).add_cte(moved),
+            execution_options={"synchronize_session": False},
+        )
+        cache.invalidate(_TAG_CACHE)
         return target_tag
 
     async def get_tag_usage(self, tag_id: str) -> dict:
-        """Retourne les statistiques d'utilisation d'un tag."""
-        tag = await self.get_tag_by_id(tag_id)
-        if not tag:
-            raise NotFoundException("Tag non trouvé")
+        """Retourne les statistiques d'utilisation d'un tag.
 
+        Existence du tag et comptage des actualités en un seul aller-retour.
+        """
         result = await self.db.execute(
-            select(func.count(NewsTag.news_id)).where(NewsTag.tag_id == tag_id)
+            select(
+                select(Tag.id).where(Tag.id == tag_id).exists().label("found"),
+                select(func.count())
+                .where(NewsTag.tag_id == tag_id)
+                .scalar_subquery()
+                .label("news_count"),
+            )
         )
-        news_count = result.scalar() or 0
+        usage = result.one()
+        if not usage.found:
+            raise NotFoundException("Tag non trouvé")
 
-        return {"tag_id": tag_id, "news_count": news_count}
+        return {"tag_id": tag_id, "news_count": usage.news_count}
 
     # =========================================================================
     # EVENTS
@@ -333,9 +801,31 @@ class ContentService:
         from_date: datetime | None = None,
         to_date: datetime | None = None,
         campus_id: str | None = None,
+        after: tuple[datetime, str] | None = None,
     ) -> select:
-        """Construit une requête pour lister les événements."""
-        query = select(Event).options(selectinload(Event.registrations))
+        """Construit une requête pour lister les événements.
+
+        Aucune relation n'est chargée (``raiseload("*")``) : seul le nombre
+        d'inscriptions est calculé par une sous-requête corrélée
+        (``Event.registrations_count``).
+
+        ``after`` : curseur keyset (start_date, id) du dernier événement reçu ;
+        seuls les suivants sont renvoyés, par recherche dans l'index
+        ``idx_events_start_date_id`` au lieu d'un OFFSET.
+        """
+        registrations_count = (
+            select(func.count(EventRegistration.id))
+            .where(
+                EventRegistration.event_id == Event.id,
+                EventRegistration.status != RegistrationStatus.CANCELLED,
+            )
+            .correlate(Event)
+            .scalar_subquery()
+        )
+        query = select(Event).options(
+            raiseload("*"),
+            with_expression(Event.registrations_count, registrations_count),
+        )
 
         if search:
             search_filter = f"%{search}%"
@@ -362,145 +852,106 @@ class ContentService:
         if campus_id:
             query = query.where(Event.campus_external_id == campus_id)
 
-        query = query.order_by(Event.start_date.desc())
+        if after:
+            query = query.where(tuple_(Event.start_date, Event.id) < after)
+
+        # id départage les événements simultanés : ordre total, stable d'une page à l'autre
+        query = query.order_by(Event.start_date.desc(), Event.id.desc())
         return query
 
     async def get_event_by_id(self, event_id: str) -> Event | None:
-        """Récupère un événement par son ID."""
-        result = await self.db.execute(
-            select(Event)
-            .options(selectinload(Event.registrations))
-            .where(Event.id == event_id)
-        )
-        return result.scalar_one_or_none()
+        """Récupère un événement par son ID (carte d'identité de la session d'abord)."""
+        return await self.db.get(Event, event_id, options=_EVENT_LOAD_OPTIONS)
 
     async def get_event_by_slug(self, slug: str) -> Event | None:
         """Récupère un événement par son slug."""
-        result = await self.db.execute(
-            select(Event)
-            .options(selectinload(Event.registrations))
-            .where(Event.slug == slug)
-        )
+        result = await self.db.execute(_EVENT_BY_SLUG, {"slug": slug})
         return result.scalar_one_or_none()
 
     async def create_event(self, title: str, slug: str, **kwargs) -> Event:
         """Crée un nouvel événement."""
-        existing = await self.get_event_by_slug(slug)
-        if existing:
-            raise ConflictException(f"Un événement avec le slug '{slug}' existe déjà")
-
-        event = Event(id=str(uuid4()), title=title, slug=slug, **kwargs)
+        event = Event(title=title, slug=slug, **kwargs)
         # Remplissage auto des traductions EN/AR vides (non bloquant).
         await autofill_translations(event, _EVENT_TRANSLATABLE)
         self.db.add(event)
-        await self.db.flush()
+        try:
+            await self.db.flush()
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._event_conflicts(slug))
+            if conflict is None:
+                raise
+            raise conflict from exc
+        cache.invalidate(_EVENT_STATS_CACHE)
         return event
 
     async def update_event(self, event_id: str, **kwargs) -> Event:
         """Met à jour un événement."""
-        event = await self.get_event_by_id(event_id)
+        # Colonnes seules (traductions à compléter) : ni inscriptions ni médias
+        event = await self.db.get(Event, event_id, options=[lazyload("*")])
         if not event:
             raise NotFoundException("Événement non trouvé")
 
-        if "slug" in kwargs and kwargs["slug"] and kwargs["slug"] != event.slug:
-            existing = await self.get_event_by_slug(kwargs["slug"])
-            if existing:
-                raise ConflictException(
-                    f"Un événement avec le slug '{kwargs['slug']}' existe déjà"
-                )
-
         # Remplissage auto des traductions EN/AR encore vides (non bloquant).
         await self._autofill_into_kwargs(event, kwargs, _EVENT_TRANSLATABLE)
 
-        await self.db.execute(
-            update(Event).where(Event.id == event_id).values(**kwargs)
-        )
-        await self.db.flush()
-        return await self.get_event_by_id(event_id)
+        if not kwargs:
+            return event
+        # L'unicité du slug est garantie par la contrainte de la table
+        try:
+            event = await update_returning(self.db, Event, event_id, kwargs)
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._event_conflicts(kwargs.get("slug")))
+            if conflict is None:
+                raise
+            raise conflict from exc
+        cache.invalidate(_EVENT_STATS_CACHE)
+        return event
 
     async def delete_event(self, event_id: str) -> None:
-        """Supprime un événement."""
-        event = await self.get_event_by_id(event_id)
-        if not event:
+        """Supprime un événement (``DELETE ... RETURNING id``)."""
+        if not await delete_by_id(self.db, Event, event_id):
             raise NotFoundException("Événement non trouvé")
-
-        await self.db.execute(delete(Event).where(Event.id == event_id))
-        await self.db.flush()
+        cache.invalidate(_EVENT_STATS_CACHE)
 
     async def publish_event(self, event_id: str) -> Event:
         """Publie un événement."""
-        event = await self.get_event_by_id(event_id)
+        event = await update_returning(
+            self.db, Event, event_id, {"status": PublicationStatus.PUBLISHED}
+        )
         if not event:
             raise NotFoundException("Événement non trouvé")
-
-        await self.db.execute(
-            update(Event)
-            .where(Event.id == event_id)
-            .values(status=PublicationStatus.PUBLISHED)
-        )
-        await self.db.flush()
-        return await self.get_event_by_id(event_id)
+        cache.invalidate(_EVENT_STATS_CACHE)
+        return event
 
     async def cancel_event(self, event_id: str) -> Event:
         """Annule un événement (archive)."""
-        event = await self.get_event_by_id(event_id)
+        event = await update_returning(
+            self.db, Event, event_id, {"status": PublicationStatus.ARCHIVED}
+        )
         if not event:
             raise NotFoundException("Événement non trouvé")
-
-        await self.db.execute(
-            update(Event)
-            .where(Event.id == event_id)
-            .values(status=PublicationStatus.ARCHIVED)
-        )
-        await self.db.flush()
-        return await self.get_event_by_id(event_id)
+        cache.invalidate(_EVENT_STATS_CACHE)
+        return event
 
     async def duplicate_event(self, event_id: str, new_slug: str) -> Event:
-        """Duplique un événement."""
-        event = await self.get_event_by_id(event_id)
-        if not event:
+        """Duplique un événement (copie en brouillon, sans les inscriptions)."""
+        try:
+            new_event = await self._duplicate_row(
+                Event,
+                event_id,
+                _EVENT_COPIED_COLUMNS,
+                title=Event.title + " (copie)",
+                slug=literal(new_slug, Event.slug.type),
+                status=literal(PublicationStatus.DRAFT, Event.status.type),
+            )
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._event_conflicts(new_slug))
+            if conflict is None:
+                raise
+            raise conflict from exc
+        if not new_event:
             raise NotFoundException("Événement non trouvé")
-
-        existing = await self.get_event_by_slug(new_slug)
-        if existing:
-            raise ConflictException(f"Un événement avec le slug '{new_slug}' existe déjà")
-
-        new_event = Event(
-            id=str(uuid4()),
-            title=f"{event.title} (copie)",
-            slug=new_slug,
-            description=event.description,
-            content_html=event.content_html,
-            content_md=event.content_md,
-            title_en=event.title_en,
-            title_ar=event.title_ar,
-            description_en=event.description_en,
-            description_ar=event.description_ar,
-            content_en_html=event.content_en_html,
-            content_en_md=event.content_en_md,
-            content_ar_html=event.content_ar_html,
-            content_ar_md=event.content_ar_md,
-            type=event.type,
-            type_other=event.type_other,
-            start_date=event.start_date,
-            end_date=event.end_date,
-            venue=event.venue,
-            address=event.address,
-            city=event.city,
-            latitude=event.latitude,
-            longitude=event.longitude,
-            is_online=event.is_online,
-            video_conference_link=event.video_conference_link,
-            registration_required=event.registration_required,
-            max_attendees=event.max_attendees,
-            cover_image_external_id=event.cover_image_external_id,
-            country_external_id=event.country_external_id,
-            campus_external_id=event.campus_external_id,
-            service_external_id=event.service_external_id,
-            status=PublicationStatus.DRAFT,
-        )
-        self.db.add(new_event)
-        await self.db.flush()
+        cache.invalidate(_EVENT_STATS_CACHE)
         return new_event
 
     # =========================================================================
@@ -509,13 +960,17 @@ class ContentService:
 
     async def get_event_registrations(
         self, event_id: str | None = None, status: RegistrationStatus | None = None
-    ) -> list[EventRegistration]:
-        """Récupère les inscriptions, optionnellement filtrées par événement."""
-        query = select(EventRegistration)
+    ) -> list[RowMapping]:
+        """Récupère les inscriptions, optionnellement filtrées par événement.
+
+        Requête Core sur la table (colonnes de ``EventRegistrationRead``) : les
+        lignes, lues par lots côté driver (``yield_per``), ne sont ni hydratées
+        en objets ORM ni ajoutées à la carte d'identité de la session.
+        """
+        query = select(EventRegistration.__table__)
 
         if event_id:
-            event = await self.get_event_by_id(event_id)
-            if not event:
+            if not await self._exists(select(Event).where(Event.id == event_id)):
                 raise NotFoundException("Événement non trouvé")
             query = query.where(EventRegistration.event_id == event_id)
 
@@ -523,86 +978,99 @@ class ContentService:
             query = query.where(EventRegistration.status == status)
 
         query = query.order_by(EventRegistration.registered_at.desc())
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self.db.stream(query.execution_options(yield_per=500))
+        return [row async for row in result.mappings()]
 
     async def register_to_event(
-        self, event_id: str, email: str, **kwargs
+        self, event_id: str, email: str, public: bool = False, **kwargs
     ) -> EventRegistration:
-        """Inscrit quelqu'un à un événement."""
-        event = await self.get_event_by_id(event_id)
-        if not event:
-            raise NotFoundException("Événement non trouvé")
+        """Inscrit quelqu'un à un événement.
+
+        Le verrou ``FOR NO KEY UPDATE`` sur l'événement sérialise les
+        inscriptions concurrentes : le comptage de l'INSERT ... SELECT qui
+        suit voit donc les inscriptions validées entre-temps et la capacité
+        ne peut pas être dépassée. Le doublon d'email est absorbé par la
+        contrainte ``UNIQUE (event_id, email)``.
 
-        # Vérifier si déjà inscrit
+        Avec ``public``, l'événement doit en plus être publié et ouvert aux
+        inscriptions (vérifié sur la même ligne verrouillée, sans charger
+        l'événement ni ses inscriptions).
+        """
         result = await self.db.execute(
-            select(EventRegistration).where(
-                EventRegistration.event_id == event_id,
-                EventRegistration.email == email,
-            )
+            select(Event.max_attendees, Event.status, Event.registration_required)
+            .where(Event.id == event_id)
+            .with_for_update(key_share=True)
         )
-        if result.scalar_one_or_none():
-            raise ConflictException("Cette adresse email est déjà inscrite")
-
-        # Vérifier la capacité
-        if event.max_attendees:
-            count_result = await self.db.execute(
-                select(func.count(EventRegistration.id)).where(
+        event_row = result.one_or_none()
+        if event_row is None or (
+            public and event_row.status != PublicationStatus.PUBLISHED
+        ):
+            raise NotFoundException("Événement non trouvé")
+        if public and not event_row.registration_required:
+            raise ValidationException("Cet événement n'accepte pas les inscriptions")
+        max_attendees = event_row.max_attendees
+
+        values = {
+            "event_id": event_id,
+            "email": email,
+            "status": RegistrationStatus.REGISTERED,
+            **kwargs,
+        }
+        columns = EventRegistration.__table__.c
+        source = select(
+            *(literal(value, columns[key].type) for key, value in values.items())
+        )
+        if max_attendees:
+            source = source.where(
+                select(func.count(EventRegistration.id))
+                .where(
                     EventRegistration.event_id == event_id,
                     EventRegistration.status != RegistrationStatus.CANCELLED,
                 )
+                .scalar_subquery()
+                < max_attendees
             )
-            current_count = count_result.scalar() or 0
-            if current_count >= event.max_attendees:
-                raise ConflictException("Capacité maximale atteinte")
-
-        registration = EventRegistration(
-            id=str(uuid4()),
-            event_id=event_id,
-            email=email,
-            status=RegistrationStatus.REGISTERED,
-            **kwargs,
+
+        result = await self.db.execute(
+            pg_insert(EventRegistration)
+            .from_select(list(values), source)
+            .on_conflict_do_nothing(
+                index_elements=[EventRegistration.event_id, EventRegistration.email]
+            )
+            .returning(EventRegistration)
         )
-        self.db.add(registration)
-        await self.db.flush()
+        registration = result.scalar_one_or_none()
+        if registration is None:
+            # Cas rare : un second aller-retour départage doublon et capacité
+            if await self._exists(
+                select(EventRegistration).where(
+                    EventRegistration.event_id == event_id,
+                    EventRegistration.email == email,
+                )
+            ):
+                raise ConflictException("Cette adresse email est déjà inscrite")
+            raise ConflictException("Capacité maximale atteinte")
         return registration
 
     async def update_registration(
         self, registration_id: str, **kwargs
     ) -> EventRegistration:
         """Met à jour une inscription."""
-        result = await self.db.execute(
-            select(EventRegistration).where(EventRegistration.id == registration_id)
-        )
-        registration = result.scalar_one_or_none()
+        if kwargs:
+            registration = await update_returning(
+                self.db, EventRegistration, registration_id, kwargs
+            )
+        else:
+            registration = await self.db.get(EventRegistration, registration_id)
         if not registration:
             raise NotFoundException("Inscription non trouvée")
-
-        await self.db.execute(
-            update(EventRegistration)
-            .where(EventRegistration.id == registration_id)
-            .values(**kwargs)
-        )
-        await self.db.flush()
-
-        result = await self.db.execute(
-            select(EventRegistration).where(EventRegistration.id == registration_id)
-        )
-        return result.scalar_one()
+        return registration
 
     async def delete_registration(self, registration_id: str) -> None:
-        """Supprime une inscription."""
-        result = await self.db.execute(
-            select(EventRegistration).where(EventRegistration.id == registration_id)
-        )
-        if not result.scalar_one_or_none():
+        """Supprime une inscription (``DELETE ... RETURNING id``)."""
+        if not await delete_by_id(self.db, EventRegistration, registration_id):
             raise NotFoundException("Inscription non trouvée")
 
-        await self.db.execute(
-            delete(EventRegistration).where(EventRegistration.id == registration_id)
-        )
-        await self.db.flush()
-
     async def confirm_registration(self, registration_id: str) -> EventRegistration:
         """Confirme une inscription."""
         return await self.update_registration(
@@ -626,13 +1094,25 @@ class ContentService:
         else:
             raise ValueError(f"Action inconnue: {action}")
 
+        # Un seul paramètre tableau (= ANY) : le SQL ne dépend pas du nombre
+        # d'ids, et le RETURNING donne le nombre exact de lignes modifiées.
         result = await self.db.execute(
             update(EventRegistration)
-            .where(EventRegistration.id.in_(registration_ids))
+            .where(
+                EventRegistration.id
+                == any_(
+                    bindparam(
+                        "registration_ids",
+                        registration_ids,
+                        type_=ARRAY(UUID(as_uuid=False)),
+                    )
+                )
+            )
             .values(status=new_status)
+            .returning(EventRegistration.id),
+            execution_options={"synchronize_session": False},
         )
-        await self.db.flush()
-        return result.rowcount
+        return len(result.all())
 
     # =========================================================================
     # NEWS
@@ -653,9 +1133,29 @@ class ContentService:
         program_id: str | None = None,
         from_date: datetime | None = None,
         to_date: datetime | None = None,
+        tags_as_json: bool = False,
+        after: tuple[datetime | None, datetime, str] | None = None,
     ) -> select:
-        """Construit une requête pour lister les actualités."""
-        query = select(News).options(selectinload(News.tags))
+        """Construit une requête pour lister les actualités.
+
+        Avec ``tags_as_json``, les tags ne sont pas chargés en objets ORM :
+        PostgreSQL les renvoie déjà sérialisés dans ``News.tags_json`` (même
+        aller-retour), tels que les consomme ``enrich_news_with_names``.
+
+        ``after`` : curseur keyset (published_at, created_at, id) de la
+        dernière actualité reçue (published_at None si non publiée) ; seules
+        les suivantes sont renvoyées, par recherche dans l'index
+        ``idx_news_published_created_id`` au lieu d'un OFFSET.
+        """
+        if tags_as_json:
+            query = select(News).options(
+                with_expression(News.tags_json, _NEWS_TAGS_JSON),
+                selectinload(News.news_campuses),
+                selectinload(News.news_services),
+                raiseload("*"),
+            )
+        else:
+            query = select(News).options(*_NEWS_LOAD_OPTIONS)
 
         if search:
             search_filter = f"%{search}%"
@@ -702,9 +1202,77 @@ class ContentService:
         if to_date:
             query = query.where(News.published_at <= to_date)
 
-        query = query.distinct().order_by(News.published_at.desc().nullslast(), News.created_at.desc())
+        if after:
+            # Les actualités sans date de publication sont triées en dernier
+            if after[0] is None:
+                query = query.where(
+                    News.published_at.is_(None),
+                    tuple_(News.created_at, News.id) < after[1:],
+                )
+            else:
+                query = query.where(
+                    or_(
+                        News.published_at.is_(None),
+                        tuple_(News.published_at, News.created_at, News.id) < after,
+                    )
+                )
+
+        query = query.distinct().order_by(
+            News.published_at.desc().nullslast(), News.created_at.desc(), News.id.desc()
+        )
         return query
 
+    async def _load_names_bulk(self, **ids_by_kind: set[str]) -> dict[str, dict[str, str]]:
+        """Résout les noms de plusieurs entités en un seul aller-retour.
+
+        Chaque type d'entité contribue un SELECT ``(kind, id, name)`` ; les
+        SELECT sont combinés en UNION ALL puis répartis par ``kind``. Les noms
+        déjà résolus par ce service (même requête HTTP) sont lus dans
+        ``self._name_cache`` : seuls les ids manquants sont interrogés, et les
+        ensembles vides ne génèrent aucune branche.
+
+        Args:
+            ids_by_kind: Identifiants à résoudre, par type (campus, sector,
+                service, project, call, program, event, author)
+
+        Returns:
+            Dictionnaire ``{kind: {id: nom}}`` (une entrée par type demandé,
+            pouvant contenir d'autres ids déjà en cache)
+        """
+        sources = {
+            "campus": (Campus.id, Campus.name),
+            "sector": (Sector.id, Sector.name),
+            "service": (Service.id, Service.name),
+            "project": (Project.id, Project.title),
+            "call": (ApplicationCall.id, ApplicationCall.title),
+            "program": (Program.id, Program.title),
+            "event": (Event.id, Event.title),
+            "author": (
+                User.id,
+                func.trim(func.concat(User.first_name, " ", User.last_name)),
+            ),
+        }
+        cache = self._name_cache
+        names = {kind: cache[kind] for kind in ids_by_kind}
+        missing = {kind: ids - names[kind].keys() for kind, ids in ids_by_kind.items()}
+        branches = [
+            select(
+                literal(kind, String).label("kind"),
+                cast(id_col, String).label("id"),
+                cast(name_col, String).label("name"),
+            ).where(id_col.in_(ids))
+            for kind, ids in missing.items()
+            if ids
+            for id_col, name_col in (sources[kind],)
+        ]
+        if not branches:
+            return names
+
+        result = await self.db.execute(union_all(*branches))
+        for row in result:
+            cache[row.kind][row.id] = row.name
+        return names
+
     async def enrich_news_with_names(self, news_list: list[News]) -> list[dict]:
         """Enrichit une liste d'actualités avec les noms des entités associées.
 
@@ -733,153 +1301,27 @@ class ContentService:
         event_ids = {n.event_external_id for n in news_list if n.event_external_id}
         author_ids = {n.author_external_id for n in news_list if n.author_external_id}
 
-        # 2. Charger les entités en batch (éviter N+1 queries)
-        campus_map: dict[str, str] = {}
-        sector_map: dict[str, str] = {}
-        service_map: dict[str, str] = {}
-        project_map: dict[str, str] = {}
-        call_map: dict[str, str] = {}
-        program_map: dict[str, str] = {}
-        event_map: dict[str, str] = {}
-        author_map: dict[str, str] = {}
-
-        if campus_ids:
-            result = await self.db.execute(
-                select(Campus.id, Campus.name).where(Campus.id.in_(campus_ids))
-            )
-            campus_map = {str(row.id): row.name for row in result.fetchall()}
-
-        if sector_ids:
-            result = await self.db.execute(
-                select(Sector.id, Sector.name).where(Sector.id.in_(sector_ids))
-            )
-            sector_map = {str(row.id): row.name for row in result.fetchall()}
-
-        if service_ids:
-            result = await self.db.execute(
-                select(Service.id, Service.name).where(Service.id.in_(service_ids))
-            )
-            service_map = {str(row.id): row.name for row in result.fetchall()}
-
-        if project_ids:
-            result = await self.db.execute(
-                select(Project.id, Project.title).where(Project.id.in_(project_ids))
-            )
-            project_map = {str(row.id): row.title for row in result.fetchall()}
-
-        if call_ids:
-            result = await self.db.execute(
-                select(ApplicationCall.id, ApplicationCall.title).where(ApplicationCall.id.in_(call_ids))
-            )
-            call_map = {str(row.id): row.title for row in result.fetchall()}
-
-        if program_ids:
-            result = await self.db.execute(
-                select(Program.id, Program.title).where(Program.id.in_(program_ids))
-            )
-            program_map = {str(row.id): row.title for row in result.fetchall()}
-
-        if event_ids:
-            result = await self.db.execute(
-                select(Event.id, Event.title).where(Event.id.in_(event_ids))
-            )
-            event_map = {str(row.id): row.title for row in result.fetchall()}
-
-        if author_ids:
-            result = await self.db.execute(
-                select(User.id, User.first_name, User.last_name).where(User.id.in_(author_ids))
-            )
-            author_map = {
-                str(row.id): f"{row.first_name} {row.last_name}".strip()
-                for row in result.fetchall()
-            }
-
+        # 2. Charger tous les noms en une seule requête (éviter N+1 queries)
+        names = await self._load_names_bulk(
+            campus=campus_ids,
+            sector=sector_ids,
+            service=service_ids,
+            project=project_ids,
+            call=call_ids,
+            program=program_ids,
+            event=event_ids,
+            author=author_ids,
+        )
         # 3. Mapper les noms sur les actualités
-        enriched_list = []
-        for news in news_list:
-            # Convertir les tags en dictionnaires
-            tags_data = [
-                {
-                    "id": tag.id,
-                    "name": tag.name,
-                    "slug": tag.slug,
-                    "icon": tag.icon,
-                    "description": tag.description,
-                    "name_en": tag.name_en,
-                    "name_ar": tag.name_ar,
-                    "description_en": tag.description_en,
-                    "description_ar": tag.description_ar,
-                    "created_at": tag.created_at,
-                }
-                for tag in news.tags
-            ]
-
-            enriched = {
-                "id": news.id,
-                "title": news.title,
-                "slug": news.slug,
-                "summary": news.summary,
-                "content_html": news.content_html,
-                "content_md": news.content_md,
-                "title_en": news.title_en,
-                "title_ar": news.title_ar,
-                "summary_en": news.summary_en,
-                "summary_ar": news.summary_ar,
-                "content_en_html": news.content_en_html,
-                "content_en_md": news.content_en_md,
-                "content_ar_html": news.content_ar_html,
-                "content_ar_md": news.content_ar_md,
-                "video_url": news.video_url,
-                "highlight_status": news.highlight_status,
-                "cover_image_external_id": news.cover_image_external_id,
-                "campus_external_ids": news.campus_external_ids,
-                "sector_external_id": news.sector_external_id,
-                "service_external_ids": news.service_external_ids,
-                "event_external_id": news.event_external_id,
-                "project_external_id": news.project_external_id,
-                "call_external_id": news.call_external_id,
-                "program_external_id": news.program_external_id,
-                "author_external_id": news.author_external_id,
-                "status": news.status,
-                "published_at": news.published_at,
-                "visible_from": news.visible_from,
-                "created_at": news.created_at,
-                "updated_at": news.updated_at,
-                "tags": tags_data,
-                # Noms résolus
-                "campus_names": [campus_map.get(str(cid), str(cid)) for cid in news.campus_external_ids],
-                "sector_name": sector_map.get(str(news.sector_external_id)) if news.sector_external_id else None,
-                "service_names": [service_map.get(str(sid), str(sid)) for sid in news.service_external_ids],
-                "project_name": project_map.get(str(news.project_external_id)) if news.project_external_id else None,
-                "call_name": call_map.get(str(news.call_external_id)) if news.call_external_id else None,
-                "program_name": program_map.get(str(news.program_external_id)) if news.program_external_id else None,
-                "event_name": event_map.get(str(news.event_external_id)) if news.event_external_id else None,
-                "author_name": author_map.get(str(news.author_external_id)) if news.author_external_id else None,
-            }
-            enriched_list.append(enriched)
-
-        return enriched_list
+        return _enrich_rows(news_list, names)
 
     async def get_news_by_id(self, news_id: str) -> News | None:
-        """Récupère une actualité par son ID."""
-        result = await self.db.execute(
-            select(News)
-            .options(selectinload(News.tags))
-            .options(selectinload(News.news_campuses))
-            .options(selectinload(News.news_services))
-            .where(News.id == news_id)
-        )
-        return result.scalar_one_or_none()
+        """Récupère une actualité par son ID (carte d'identité de la session d'abord)."""
+        return await self.db.get(News, news_id, options=_NEWS_LOAD_OPTIONS)
 
     async def get_news_by_slug(self, slug: str) -> News | None:
         """Récupère une actualité par son slug."""
-        result = await self.db.execute(
-            select(News)
-            .options(selectinload(News.tags))
-            .options(selectinload(News.news_campuses))
-            .options(selectinload(News.news_services))
-            .where(News.slug == slug)
-        )
+        result = await self.db.execute(_NEWS_BY_SLUG, {"slug": slug})
         return result.scalar_one_or_none()
 
     async def create_news(
@@ -892,36 +1334,52 @@ class ContentService:
         **kwargs,
     ) -> News:
         """Crée une nouvelle actualité."""
-        existing = await self.get_news_by_slug(slug)
-        if existing:
-            raise ConflictException(f"Une actualité avec le slug '{slug}' existe déjà")
-
-        news = News(id=str(uuid4()), title=title, slug=slug, **kwargs)
+        news = News(title=title, slug=slug, **kwargs)
         # Remplissage auto des traductions EN/AR vides (non bloquant).
         await autofill_translations(news, _NEWS_TRANSLATABLE)
         self.db.add(news)
-        await self.db.flush()
-
-        # Ajouter les tags
-        if tag_ids:
-            for tag_id in tag_ids:
-                news_tag = NewsTag(news_id=news.id, tag_id=tag_id)
-                self.db.add(news_tag)
+        try:
             await self.db.flush()
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._news_conflicts(slug))
+            if conflict is None:
+                raise
+            raise conflict from exc
+
+        # Ajouter les tags, campus et services
+        await self._insert_news_links(news.id, NewsTag, "tag_id", tag_ids)
+        await self._insert_news_links(
+            news.id, NewsCampus, "campus_external_id", campus_external_ids
+        )
+        await self._insert_news_links(
+            news.id, NewsService, "service_external_id", service_external_ids
+        )
 
-        # Ajouter les campus
-        if campus_external_ids:
-            for campus_id in campus_external_ids:
-                self.db.add(NewsCampus(news_id=news.id, campus_external_id=campus_id))
-            await self.db.flush()
+        cache.invalidate(_NEWS_STATS_CACHE)
+        # L'actualité est déjà dans la session : seules ses relations sont relues
+        await self.db.refresh(news, ["tags", "news_campuses", "news_services"])
+        return news
 
-        # Ajouter les services
-        if service_external_ids:
-            for service_id in service_external_ids:
-                self.db.add(NewsService(news_id=news.id, service_external_id=service_id))
-            await self.db.flush()
+    async def _insert_news_links(
+        self, news_id: str, model, column: str, ids: list[str] | None
+    ) -> None:
+        """
+        Lie une actualité à des tags / campus / services en un seul INSERT
+        multi-lignes (``executemany`` regroupé par le driver) ; les doublons
+        de ``ids`` sont ignorés (``ON CONFLICT DO NOTHING``).
 
-        return await self.get_news_by_id(news.id)
+        Args:
+            news_id: ID de l'actualité.
+            model: Table de liaison (NewsTag, NewsCampus, NewsService).
+            column: Colonne de la cible dans la table de liaison.
+            ids: IDs à lier (rien n'est fait si vide ou None).
+        """
+        if not ids:
+            return
+        await self.db.execute(
+            pg_insert(model).on_conflict_do_nothing(),
+            [{"news_id": news_id, column: value} for value in ids],
+        )
 
     async def update_news(
         self,
@@ -936,140 +1394,112 @@ class ContentService:
         if not news:
             raise NotFoundException("Actualité non trouvée")
 
-        if "slug" in kwargs and kwargs["slug"] and kwargs["slug"] != news.slug:
-            existing = await self.get_news_by_slug(kwargs["slug"])
-            if existing:
-                raise ConflictException(
-                    f"Une actualité avec le slug '{kwargs['slug']}' existe déjà"
-                )
-
         # Remplissage auto des traductions EN/AR encore vides (non bloquant).
         await self._autofill_into_kwargs(news, kwargs, _NEWS_TRANSLATABLE)
 
+        # Remplacer les tags, campus et services fournis
+        for model, column, ids in (
+            (NewsTag, "tag_id", tag_ids),
+            (NewsCampus, "campus_external_id", campus_external_ids),
+            (NewsService, "service_external_id", service_external_ids),
+        ):
+            if ids is not None:
+                await self.db.execute(delete(model).where(model.news_id == news_id))
+                await self._insert_news_links(news_id, model, column, ids)
+
+        # Les liens sont écrits avant l'UPDATE : le RETURNING recharge les
+        # relations dans leur nouvel état.
         if kwargs:
-            await self.db.execute(
-                update(News).where(News.id == news_id).values(**kwargs)
-            )
-
-        # Mettre à jour les tags si fournis
-        if tag_ids is not None:
-            await self.db.execute(delete(NewsTag).where(NewsTag.news_id == news_id))
-            for tag_id in tag_ids:
-                news_tag = NewsTag(news_id=news_id, tag_id=tag_id)
-                self.db.add(news_tag)
-
-        # Mettre à jour les campus si fournis
-        if campus_external_ids is not None:
-            await self.db.execute(delete(NewsCampus).where(NewsCampus.news_id == news_id))
-            for campus_id in campus_external_ids:
-                self.db.add(NewsCampus(news_id=news_id, campus_external_id=campus_id))
-
-        # Mettre à jour les services si fournis
-        if service_external_ids is not None:
-            await self.db.execute(delete(NewsService).where(NewsService.news_id == news_id))
-            for service_id in service_external_ids:
-                self.db.add(NewsService(news_id=news_id, service_external_id=service_id))
-
-        await self.db.flush()
-        return await self.get_news_by_id(news_id)
+            try:
+                news = await update_returning(
+                    self.db, News, news_id, kwargs, *_NEWS_LOAD_OPTIONS
+                )
+            except IntegrityError as exc:
+                conflict = _unique_conflict(
+                    exc, self._news_conflicts(kwargs.get("slug"))
+                )
+                if conflict is None:
+                    raise
+                raise conflict from exc
+            cache.invalidate(_NEWS_STATS_CACHE)
+            return news
+        if tag_ids is not None or campus_external_ids is not None or (
+            service_external_ids is not None
+        ):
+            await self.db.refresh(news, ["tags", "news_campuses", "news_services"])
+        return news
 
     async def delete_news(self, news_id: str) -> None:
-        """Supprime une actualité."""
-        news = await self.get_news_by_id(news_id)
-        if not news:
+        """Supprime une actualité (``DELETE ... RETURNING id``)."""
+        if not await delete_by_id(self.db, News, news_id):
             raise NotFoundException("Actualité non trouvée")
-
-        await self.db.execute(delete(News).where(News.id == news_id))
-        await self.db.flush()
+        cache.invalidate(_NEWS_STATS_CACHE)
 
     async def publish_news(
         self, news_id: str, published_at: datetime | None = None
     ) -> News:
         """Publie une actualité."""
-        news = await self.get_news_by_id(news_id)
+        news = await update_returning(
+            self.db,
+            News,
+            news_id,
+            {
+                "status": PublicationStatus.PUBLISHED,
+                "published_at": published_at or datetime.now(timezone.utc),
+            },
+            *_NEWS_LOAD_OPTIONS,
+        )
         if not news:
             raise NotFoundException("Actualité non trouvée")
-
-        await self.db.execute(
-            update(News)
-            .where(News.id == news_id)
-            .values(
-                status=PublicationStatus.PUBLISHED,
-                published_at=published_at or datetime.now(),
-            )
-        )
-        await self.db.flush()
-        return await self.get_news_by_id(news_id)
+        cache.invalidate(_NEWS_STATS_CACHE)
+        return news
 
     async def unpublish_news(self, news_id: str) -> News:
         """Dépublie une actualité."""
-        news = await self.get_news_by_id(news_id)
+        news = await update_returning(
+            self.db, News, news_id, {"status": PublicationStatus.DRAFT}, *_NEWS_LOAD_OPTIONS
+        )
         if not news:
             raise NotFoundException("Actualité non trouvée")
-
-        await self.db.execute(
-            update(News)
-            .where(News.id == news_id)
-            .values(status=PublicationStatus.DRAFT)
-        )
-        await self.db.flush()
-        return await self.get_news_by_id(news_id)
+        cache.invalidate(_NEWS_STATS_CACHE)
+        return news
 
     async def duplicate_news(self, news_id: str, new_slug: str) -> News:
-        """Duplique une actualité."""
-        news = await self.get_news_by_id(news_id)
-        if not news:
+        """Duplique une actualité (copie en brouillon, avec tags, campus et
+        services)."""
+        try:
+            new_news = await self._duplicate_row(
+                News,
+                news_id,
+                _NEWS_COPIED_COLUMNS,
+                title=News.title + " (copie)",
+                slug=literal(new_slug, News.slug.type),
+                status=literal(PublicationStatus.DRAFT, News.status.type),
+            )
+        except IntegrityError as exc:
+            conflict = _unique_conflict(exc, self._news_conflicts(new_slug))
+            if conflict is None:
+                raise
+            raise conflict from exc
+        if not new_news:
             raise NotFoundException("Actualité non trouvée")
 
-        existing = await self.get_news_by_slug(new_slug)
-        if existing:
-            raise ConflictException(
-                f"Une actualité avec le slug '{new_slug}' existe déjà"
+        # Copier les tags, campus et services sans les charger
+        for link, column in (
+            (NewsTag, NewsTag.tag_id),
+            (NewsCampus, NewsCampus.campus_external_id),
+            (NewsService, NewsService.service_external_id),
+        ):
+            await self.db.execute(
+                insert(link).from_select(
+                    ["news_id", column.key],
+                    select(literal(new_news.id, link.news_id.type), column).where(
+                        link.news_id == news_id
+                    ),
+                )
             )
-
-        new_news = News(
-            id=str(uuid4()),
-            title=f"{news.title} (copie)",
-            slug=new_slug,
-            summary=news.summary,
-            content_html=news.content_html,
-            content_md=news.content_md,
-            title_en=news.title_en,
-            title_ar=news.title_ar,
-            summary_en=news.summary_en,
-            summary_ar=news.summary_ar,
-            content_en_html=news.content_en_html,
-            content_en_md=news.content_en_md,
-            content_ar_html=news.content_ar_html,
-            content_ar_md=news.content_ar_md,
-            video_url=news.video_url,
-            cover_image_external_id=news.cover_image_external_id,
-            sector_external_id=news.sector_external_id,
-            event_external_id=news.event_external_id,
-            project_external_id=news.project_external_id,
-            call_external_id=news.call_external_id,
-            author_external_id=news.author_external_id,
-            highlight_status=news.highlight_status,
-            status=PublicationStatus.DRAFT,
-        )
-        self.db.add(new_news)
-        await self.db.flush()
-
-        # Copier les tags
-        for tag in news.tags:
-            news_tag = NewsTag(news_id=new_news.id, tag_id=tag.id)
-            self.db.add(news_tag)
-
-        # Copier les campus
-        for nc in news.news_campuses:
-            self.db.add(NewsCampus(news_id=new_news.id, campus_external_id=nc.campus_external_id))
-
-        # Copier les services
-        for ns in news.news_services:
-            self.db.add(NewsService(news_id=new_news.id, service_external_id=ns.service_external_id))
-
-        await self.db.flush()
-        return await self.get_news_by_id(new_news.id)
+        cache.invalidate(_NEWS_STATS_CACHE)
+        return new_news
 
     # =========================================================================
     # NEWS MEDIA
@@ -1078,49 +1508,48 @@ class ContentService:
     async def add_media_to_news(
         self, news_id: str, media_external_id: str, display_order: int = 0
     ) -> None:
-        """Ajoute un média à une actualité."""
-        news = await self.get_news_by_id(news_id)
-        if not news:
-            raise NotFoundException("Actualité non trouvée")
+        """Ajoute un média à une actualité.
 
+        Un seul ``INSERT ... SELECT`` : la sélection sur ``news`` ne produit
+        aucune ligne si l'actualité n'existe pas, et le doublon est absorbé par
+        la clé primaire ``(news_id, media_external_id)``.
+        """
         result = await self.db.execute(
-            select(NewsMedia).where(
-                NewsMedia.news_id == news_id,
-                NewsMedia.media_external_id == media_external_id,
+            pg_insert(NewsMedia)
+            .from_select(
+                ["news_id", "media_external_id", "display_order"],
+                select(
+                    News.id,
+                    literal(media_external_id, NewsMedia.media_external_id.type),
+                    literal(display_order, NewsMedia.display_order.type),
+                ).where(News.id == news_id),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[NewsMedia.news_id, NewsMedia.media_external_id]
             )
+            .returning(NewsMedia.news_id)
         )
-        if result.scalar_one_or_none():
+        if result.first() is None:
+            # Cas rare : un second aller-retour départage absence et doublon
+            if not await self._exists(select(News).where(News.id == news_id)):
+                raise NotFoundException("Actualité non trouvée")
             raise ConflictException("Ce média est déjà associé à l'actualité")
 
-        link = NewsMedia(
-            news_id=news_id,
-            media_external_id=media_external_id,
-            display_order=display_order,
-        )
-        self.db.add(link)
-        await self.db.flush()
-
     async def remove_media_from_news(
         self, news_id: str, media_external_id: str
     ) -> None:
-        """Retire un média d'une actualité."""
+        """Retire un média d'une actualité (``DELETE ... RETURNING``)."""
         result = await self.db.execute(
-            select(NewsMedia).where(
+            delete(NewsMedia)
+            .where(
                 NewsMedia.news_id == news_id,
                 NewsMedia.media_external_id == media_external_id,
             )
+            .returning(NewsMedia.news_id)
         )
-        if not result.scalar_one_or_none():
+        if result.first() is None:
             raise NotFoundException("Cette association n'existe pas")
 
-        await self.db.execute(
-            delete(NewsMedia).where(
-                NewsMedia.news_id == news_id,
-                NewsMedia.media_external_id == media_external_id,
-            )
-        )
-        await self.db.flush()
-
     # =========================================================================
     # EVENT ↔ ALBUMS (médiathèque)
     # =========================================================================
@@ -1160,8 +1589,7 @@ class ContentService:
 
     async def add_albums_to_event(self, event_id: str, album_ids: list[str]) -> list[dict]:
         """Associe des albums à un événement."""
-        event = await self.get_event_by_id(event_id)
-        if not event:
+        if not await self._exists(select(Event).where(Event.id == event_id)):
             raise NotFoundException("Événement non trouvé")
 
         # Récupérer l'ordre max actuel
@@ -1286,8 +1714,7 @@ class ContentService:
 
     async def reorder_event_albums(self, event_id: str, album_ids: list[str]) -> list[dict]:
         """Réordonne les albums d'un événement."""
-        event = await self.get_event_by_id(event_id)
-        if not event:
+        if not await self._exists(select(Event).where(Event.id == event_id)):
             raise NotFoundException("Événement non trouvé")
 
         for i, album_id in enumerate(album_ids):
@@ -1308,8 +1735,7 @@ class ContentService:
 
     async def add_albums_to_news(self, news_id: str, album_ids: list[str]) -> list[dict]:
         """Associe des albums à une actualité."""
-        news = await self.get_news_by_id(news_id)
-        if not news:
+        if not await self._exists(select(News).where(News.id == news_id)):
             raise NotFoundException("Actualité non trouvée")
 
         result = await self.db.execute(
@@ -1431,8 +1857,7 @@ class ContentService:
 
     async def reorder_news_albums(self, news_id: str, album_ids: list[str]) -> list[dict]:
         """Réordonne les albums d'une actualité."""
-        news = await self.get_news_by_id(news_id)
-        if not news:
+        if not await self._exists(select(News).where(News.id == news_id)):
             raise NotFoundException("Actualité non trouvée")
 
         for i, album_id in enumerate(album_ids):
@@ -1451,154 +1876,74 @@ class ContentService:
     # STATISTICS
     # =========================================================================
 
-    async def get_events_statistics(self, months: int = 12) -> dict:
-        """Calcule les statistiques des événements."""
-        now = datetime.now()
-
-        # Comptage par statut
-        total_result = await self.db.execute(select(func.count(Event.id)))
-        total = total_result.scalar() or 0
+    @staticmethod
+    async def _row_in_own_session(stmt, params: dict | None = None) -> dict:
+        """
+        Exécute une requête à une ligne sur une session dédiée.
 
-        published_result = await self.db.execute(
-            select(func.count(Event.id)).where(Event.status == PublicationStatus.PUBLISHED)
-        )
-        published = published_result.scalar() or 0
+        Une AsyncSession ne supporte pas deux requêtes simultanées : la session
+        dédiée occupe sa propre connexion du pool, ce qui permet de lancer la
+        requête en parallèle d'une lecture sur ``self.db`` (``asyncio.gather``).
+        """
+        async with async_session_maker() as session:
+            return dict((await session.execute(stmt, params)).mappings().one())
 
-        draft_result = await self.db.execute(
-            select(func.count(Event.id)).where(Event.status == PublicationStatus.DRAFT)
-        )
-        draft = draft_result.scalar() or 0
+    async def _monthly_timeline(self, stmt, now: datetime, months: int) -> list[dict]:
+        """
+        Comptage mensuel sur les ``months`` derniers mois (mois courant inclus).
 
-        archived_result = await self.db.execute(
-            select(func.count(Event.id)).where(Event.status == PublicationStatus.ARCHIVED)
-        )
-        archived = archived_result.scalar() or 0
+        Un seul aller-retour : la requête renvoie directement une ligne par
+        mois (mois vides compris, à 0).
 
-        # Événements à venir vs passés
-        upcoming_result = await self.db.execute(
-            select(func.count(Event.id)).where(
-                Event.start_date >= now,
-                Event.status == PublicationStatus.PUBLISHED,
-            )
-        )
-        upcoming = upcoming_result.scalar() or 0
+        Args:
+            stmt: Requête de timeline (cf. ``_timeline_query``), bornée par
+                les paramètres ``:start`` / ``:end``.
+            now: Instant de référence en UTC (fin de la période).
+            months: Nombre de mois de la timeline.
 
-        past_result = await self.db.execute(
-            select(func.count(Event.id)).where(
-                Event.start_date < now,
-                Event.status == PublicationStatus.PUBLISHED,
-            )
-        )
-        past = past_result.scalar() or 0
+        Returns:
+            Liste ``[{"period": "YYYY-MM", "count": n}, ...]`` chronologique.
+        """
+        buckets = month_buckets(now, months)
+        result = await self.db.execute(stmt, {"start": buckets[0], "end": buckets[-1]})
+        return [dict(row) for row in result.mappings()]
 
-        # Comptage par type
-        type_results = await self.db.execute(
-            select(Event.type, func.count(Event.id))
-            .where(Event.status == PublicationStatus.PUBLISHED)
-            .group_by(Event.type)
+    async def get_events_statistics(self, months: int = 12) -> dict:
+        """Calcule les statistiques des événements (mises en cache)."""
+        key = make_key(_EVENT_STATS_CACHE, months)
+        stats = cache.get(key)
+        if stats is not None:
+            return stats
+
+        now = datetime.now(timezone.utc)
+
+        # Compteurs (statut, à venir / passés, par type) en un seul aller-retour,
+        # en parallèle de la timeline par mois de début (sessions distinctes)
+        counts, timeline = await asyncio.gather(
+            self._row_in_own_session(_EVENT_STATS_COUNTS, {"now": now}),
+            self._monthly_timeline(_EVENT_TIMELINE, now, months),
         )
-        by_type = {row[0]: row[1] for row in type_results.all()}
 
-        # Timeline - événements créés par mois (derniers N mois)
-        timeline = []
-        start_date = add_months(now, -(months - 1))
-        start_date = start_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        for i in range(months):
-            period_start = add_months(start_date, i)
-            period_end = add_months(period_start, 1)
-
-            count_result = await self.db.execute(
-                select(func.count(Event.id)).where(
-                    Event.start_date >= period_start,
-                    Event.start_date < period_end,
-                )
-            )
-            count = count_result.scalar() or 0
-            timeline.append({
-                "period": period_start.strftime("%Y-%m"),
-                "count": count,
-            })
-
-        return {
-            "total": total,
-            "published": published,
-            "draft": draft,
-            "archived": archived,
-            "upcoming": upcoming,
-            "past": past,
-            "by_type": by_type,
-            "timeline": timeline,
-        }
+        stats = {**counts, "timeline": timeline}
+        cache.set(key, stats, _STATS_TTL)
+        return stats
 
     async def get_news_statistics(self, months: int = 6) -> dict:
-        """Calcule les statistiques des actualités."""
-        now = datetime.now()
-
-        # Comptage par statut
-        total_result = await self.db.execute(select(func.count(News.id)))
-        total = total_result.scalar() or 0
-
-        published_result = await self.db.execute(
-            select(func.count(News.id)).where(News.status == PublicationStatus.PUBLISHED)
-        )
-        published = published_result.scalar() or 0
-
-        draft_result = await self.db.execute(
-            select(func.count(News.id)).where(News.status == PublicationStatus.DRAFT)
-        )
-        draft = draft_result.scalar() or 0
-
-        archived_result = await self.db.execute(
-            select(func.count(News.id)).where(News.status == PublicationStatus.ARCHIVED)
-        )
-        archived = archived_result.scalar() or 0
-
-        # Comptage par highlight status
-        headline_result = await self.db.execute(
-            select(func.count(News.id)).where(
-                News.status == PublicationStatus.PUBLISHED,
-                News.highlight_status == NewsHighlightStatus.HEADLINE,
-            )
-        )
-        headline = headline_result.scalar() or 0
-
-        featured_result = await self.db.execute(
-            select(func.count(News.id)).where(
-                News.status == PublicationStatus.PUBLISHED,
-                News.highlight_status == NewsHighlightStatus.FEATURED,
-            )
+        """Calcule les statistiques des actualités (mises en cache)."""
+        key = make_key(_NEWS_STATS_CACHE, months)
+        stats = cache.get(key)
+        if stats is not None:
+            return stats
+
+        now = datetime.now(timezone.utc)
+
+        # Compteurs (statut, mise en avant) en un seul parcours de la table,
+        # en parallèle de la timeline des publications (sessions distinctes)
+        counts, timeline = await asyncio.gather(
+            self._row_in_own_session(_NEWS_STATS_COUNTS),
+            self._monthly_timeline(_NEWS_TIMELINE, now, months),
         )
-        featured = featured_result.scalar() or 0
-
-        # Timeline - publications par mois (derniers N mois)
-        timeline = []
-        start_date = add_months(now, -(months - 1))
-        start_date = start_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        for i in range(months):
-            period_start = add_months(start_date, i)
-            period_end = add_months(period_start, 1)
-
-            count_result = await self.db.execute(
-                select(func.count(News.id)).where(
-                    News.published_at >= period_start,
-                    News.published_at < period_end,
-                    News.status == PublicationStatus.PUBLISHED,
-                )
-            )
-            count = count_result.scalar() or 0
-            timeline.append({
-                "period": period_start.strftime("%Y-%m"),
-                "count": count,
-            })
 
-        return {
-            "total": total,
-            "published": published,
-            "draft": draft,
-            "archived": archived,
-            "headline": headline,
-            "featured": featured,
-            "timeline": timeline,
-        }
+        stats = {**counts, "timeline": timeline}
+        cache.set(key, stats, _STATS_TTL)
+        return stats
@@ -0,0 +1,77 @@
+"""
+Écritures par clé primaire
+==========================
+
+``UPDATE ... RETURNING`` et ``DELETE ... RETURNING`` communs aux services :
+un seul aller-retour, sans chargement ORM préalable de la ligne.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import delete, inspect, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from app.core.exceptions import ValidationException
+
+
+@lru_cache(maxsize=None)
+def column_keys(model: type) -> frozenset[str]:
+    """Attributs colonnes d'un modèle, calculés une fois par classe."""
+    return frozenset(attr.key for attr in inspect(model).column_attrs)
+
+
+async def update_returning(
+    db: AsyncSession, model: type, pk: str, values: dict, *options
+):
+    """
+    Met à jour une ligne par son ID et la relit en un seul aller-retour
+    (``UPDATE ... RETURNING``).
+
+    Args:
+        db: Session de base de données.
+        model: Modèle ORM ciblé.
+        pk: ID de la ligne.
+        values: Colonnes à mettre à jour (valeurs ou expressions SQL).
+        options: Options de chargement des relations (par défaut aucune
+            relation n'est chargée).
+
+    Returns:
+        L'instance à jour, ou None si la ligne n'existe pas.
+
+    Raises:
+        ValidationException: Si une clé n'est pas une colonne du modèle.
+    """
+    unknown = values.keys() - column_keys(model)
+    if unknown:
+        raise ValidationException(f"Champs inconnus : {', '.join(sorted(unknown))}")
+    options = options or (lazyload("*"),)
+    if not values:
+        return await db.get(model, pk, options=options)
+
+    result = await db.execute(
+        update(model)
+        .where(model.id == pk)
+        .values(**values)
+        .returning(model)
+        .options(*options),
+        execution_options={"synchronize_session": False, "populate_existing": True},
+    )
+    return result.scalar_one_or_none()
+
+
+async def delete_by_id(db: AsyncSession, model: type, pk: str) -> bool:
+    """
+    Supprime une ligne par son ID (``DELETE ... RETURNING id``).
+
+    Les lignes dépendantes sont gérées par les clés étrangères
+    (ON DELETE CASCADE / SET NULL), sans chargement ORM préalable.
+
+    Returns:
+        True si une ligne a été supprimée, False si elle n'existait pas.
+    """
+    result = await db.execute(
+        delete(model).where(model.id == pk).returning(model.id),
+        execution_options={"synchronize_session": False},
+    )
+    return result.scalar_one_or_none() is not None
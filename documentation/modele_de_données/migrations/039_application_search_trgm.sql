@@ -0,0 +1,39 @@
+-- =============================================================================
+-- Migration 039 : Index trigrammes pour la recherche appels / candidatures
+-- =============================================================================
+-- Contexte :
+--   - get_calls / get_applications filtrent en ILIKE '%terme%' : un B-tree
+--     classique ne sert pas ces recherches (scan séquentiel à chaque requête).
+--   - pg_trgm + GIN (gin_trgm_ops) sert directement ILIKE '%…%' (ne pas
+--     envelopper la colonne dans lower() côté service : l'index serait ignoré).
+--   - reference_number est aussi recherché par préfixe ('APP-2025-%') :
+--     index B-tree text_pattern_ops dédié.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/00_extensions.sql, services/08_application.sql.
+-- =============================================================================
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Appels à candidature : titre / description
+CREATE INDEX IF NOT EXISTS idx_application_calls_title_trgm
+    ON application_calls USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_application_calls_description_trgm
+    ON application_calls USING gin (description_html gin_trgm_ops);
+
+-- Candidatures : référence, nom, prénom, email
+CREATE INDEX IF NOT EXISTS idx_applications_reference_trgm
+    ON applications USING gin (reference_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_applications_last_name_trgm
+    ON applications USING gin (last_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_applications_first_name_trgm
+    ON applications USING gin (first_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_applications_email_trgm
+    ON applications USING gin (email gin_trgm_ops);
+
+-- Recherche par préfixe sur la référence
+CREATE INDEX IF NOT EXISTS idx_applications_reference_pattern
+    ON applications (reference_number text_pattern_ops);
+
+COMMIT;
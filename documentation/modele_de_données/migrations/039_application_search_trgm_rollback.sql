@@ -0,0 +1,17 @@
+-- =============================================================================
+-- ROLLBACK Migration 039 : Index trigrammes appels / candidatures
+-- =============================================================================
+-- Supprime les index de recherche. Conserve l'extension pg_trgm (partagée).
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_application_calls_title_trgm;
+DROP INDEX IF EXISTS idx_application_calls_description_trgm;
+DROP INDEX IF EXISTS idx_applications_reference_trgm;
+DROP INDEX IF EXISTS idx_applications_last_name_trgm;
+DROP INDEX IF EXISTS idx_applications_first_name_trgm;
+DROP INDEX IF EXISTS idx_applications_email_trgm;
+DROP INDEX IF EXISTS idx_applications_reference_pattern;
+
+COMMIT;
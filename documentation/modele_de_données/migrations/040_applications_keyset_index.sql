@@ -0,0 +1,20 @@
+-- =============================================================================
+-- Migration 040 : Index keyset pour la liste des candidatures
+-- =============================================================================
+-- Contexte :
+--   - get_applications trie par (submitted_at DESC, id DESC) et accepte un
+--     curseur (submitted_at, id) : WHERE (submitted_at, id) < (:ts, :id).
+--   - L'index composite dans le même ordre sert à la fois le tri et la
+--     recherche du curseur (seek en O(log N) au lieu d'un OFFSET qui parcourt
+--     et jette K lignes).
+--   - Les appels à candidature (tri par statut puis deadline, volumes faibles)
+--     restent en pagination par page.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- =============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_applications_submitted_keyset
+    ON applications (submitted_at DESC, id DESC);
+
+COMMIT;
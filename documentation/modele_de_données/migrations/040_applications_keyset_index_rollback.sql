@@ -0,0 +1,9 @@
+-- =============================================================================
+-- ROLLBACK Migration 040 : Index keyset pour la liste des candidatures
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_applications_submitted_keyset;
+
+COMMIT;
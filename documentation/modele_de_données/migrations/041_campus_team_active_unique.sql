@@ -0,0 +1,37 @@
+-- =============================================================================
+-- Migration 041 : Unicité des membres actifs d'une équipe de campus
+-- =============================================================================
+-- Contexte :
+--   - create_team_member vérifiait par un SELECT préalable qu'un utilisateur
+--     n'était pas déjà membre actif de l'équipe, puis insérait : deux
+--     allers-retours et une fenêtre de concurrence entre les deux.
+--   - L'index unique partiel ci-dessous porte la règle en base ; le service
+--     utilise INSERT ... ON CONFLICT DO NOTHING RETURNING.
+--   - Seuls les membres actifs sont concernés : un ancien membre désactivé
+--     peut être réintégré.
+--   - Les doublons actifs éventuels sont d'abord désactivés (on conserve le
+--     plus ancien) pour que la création de l'index n'échoue pas.
+--   - campus_partners et campus_media_library ont déjà leur clé primaire
+--     composite (campus_id, <external_id>) : rien à ajouter.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- =============================================================================
+
+BEGIN;
+
+UPDATE campus_team t
+SET active = FALSE
+WHERE t.active
+  AND EXISTS (
+      SELECT 1
+      FROM campus_team older
+      WHERE older.active
+        AND older.campus_id = t.campus_id
+        AND older.user_external_id = t.user_external_id
+        AND (older.created_at, older.id) < (t.created_at, t.id)
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_campus_team_active_user
+    ON campus_team (campus_id, user_external_id)
+    WHERE active;
+
+COMMIT;
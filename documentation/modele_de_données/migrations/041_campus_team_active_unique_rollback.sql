@@ -0,0 +1,11 @@
+-- =============================================================================
+-- ROLLBACK Migration 041 : Unicité des membres actifs d'une équipe de campus
+-- =============================================================================
+-- Note : les doublons désactivés par la migration ne sont pas réactivés.
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS uq_campus_team_active_user;
+
+COMMIT;
@@ -0,0 +1,29 @@
+-- =============================================================================
+-- Migration 042 : Index trigrammes pour la recherche des campus
+-- =============================================================================
+-- Contexte :
+--   - get_campuses filtre en ILIKE '%terme%' sur code, name, city et
+--     description (OR) : aucun B-tree ne sert ces prédicats, d'où un scan
+--     séquentiel à chaque recherche.
+--   - Un index GIN gin_trgm_ops par colonne permet à PostgreSQL de combiner
+--     les quatre prédicats en BitmapOr, sans changer la sémantique ILIKE
+--     (pas de seuil de similarité comme avec l'opérateur %).
+--   - pg_trgm est déjà installée par la migration 039.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/05_campus.sql.
+-- =============================================================================
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_campuses_code_trgm
+    ON campuses USING gin (code gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_campuses_name_trgm
+    ON campuses USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_campuses_city_trgm
+    ON campuses USING gin (city gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_campuses_description_trgm
+    ON campuses USING gin (description gin_trgm_ops);
+
+COMMIT;
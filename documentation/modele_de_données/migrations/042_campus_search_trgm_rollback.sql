@@ -0,0 +1,14 @@
+-- =============================================================================
+-- ROLLBACK Migration 042 : Index trigrammes pour la recherche des campus
+-- =============================================================================
+-- Note : l'extension pg_trgm est conservée (utilisée par la migration 039).
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_campuses_description_trgm;
+DROP INDEX IF EXISTS idx_campuses_city_trgm;
+DROP INDEX IF EXISTS idx_campuses_name_trgm;
+DROP INDEX IF EXISTS idx_campuses_code_trgm;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Migration 043 : Unicité insensible à la casse du code campus
+-- =============================================================================
+-- Contexte :
+--   - Le service met le code en majuscules avant d'écrire, mais seule la
+--     contrainte UNIQUE(code) (sensible à la casse) protégeait la base : une
+--     écriture hors service ('dakar' vs 'DAKAR') passait.
+--   - L'index unique fonctionnel sur upper(code) porte la règle en base et
+--     sert les recherches get_campus_by_code / contrôle d'unicité, qui
+--     comparent désormais upper(code).
+--   - Les codes existants sont d'abord normalisés en majuscules (échoue
+--     explicitement si deux codes ne diffèrent que par la casse).
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/05_campus.sql.
+-- =============================================================================
+
+BEGIN;
+
+UPDATE campuses SET code = upper(code) WHERE code <> upper(code);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_campuses_code_upper
+    ON campuses (upper(code));
+
+COMMIT;
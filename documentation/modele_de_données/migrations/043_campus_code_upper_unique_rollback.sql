@@ -0,0 +1,11 @@
+-- =============================================================================
+-- ROLLBACK Migration 043 : Unicité insensible à la casse du code campus
+-- =============================================================================
+-- Note : les codes normalisés en majuscules le restent.
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS uq_campuses_code_upper;
+
+COMMIT;
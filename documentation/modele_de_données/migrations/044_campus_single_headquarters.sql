@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Migration 044 : Un seul siège principal parmi les campus
+-- =============================================================================
+-- Contexte :
+--   - La règle « un seul campus siège » n'était vérifiée que par le service
+--     (SELECT préalable puis INSERT/UPDATE) : deux requêtes concurrentes
+--     pouvaient créer deux sièges.
+--   - L'index unique partiel ci-dessous ne porte que sur les lignes
+--     is_headquarters = TRUE : au plus une ligne peut y figurer. Le service
+--     traduit la violation (IntegrityError) en 409.
+--   - Si plusieurs sièges existent déjà, la création échoue : corriger les
+--     données (UPDATE campuses SET is_headquarters = FALSE WHERE ...) puis
+--     relancer.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/05_campus.sql.
+-- =============================================================================
+
+BEGIN;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_campuses_single_headquarters
+    ON campuses (is_headquarters)
+    WHERE is_headquarters;
+
+COMMIT;
@@ -0,0 +1,9 @@
+-- =============================================================================
+-- ROLLBACK Migration 044 : Un seul siège principal parmi les campus
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS uq_campuses_single_headquarters;
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- =============================================================================
+-- Migration 045 : Index trigrammes pour la recherche des actualités et événements
+-- =============================================================================
+-- Contexte :
+--   - get_news filtre en ILIKE '%terme%' sur title et summary, get_events sur
+--     title, description et venue (OR) : aucun B-tree ne sert ces prédicats,
+--     d'où un scan séquentiel de la table à chaque recherche.
+--   - Un index GIN gin_trgm_ops par colonne permet à PostgreSQL de combiner
+--     les prédicats en BitmapOr, sans changer la sémantique ILIKE (même
+--     approche que la migration 042 pour les campus). Une recherche plein
+--     texte (tsvector) changerait les résultats (racinisation, mots vides).
+--   - pg_trgm est déjà installée par la migration 039.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/09_content.sql.
+-- =============================================================================
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_news_title_trgm
+    ON news USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_news_summary_trgm
+    ON news USING gin (summary gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_events_title_trgm
+    ON events USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_events_description_trgm
+    ON events USING gin (description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_events_venue_trgm
+    ON events USING gin (venue gin_trgm_ops);
+
+COMMIT;
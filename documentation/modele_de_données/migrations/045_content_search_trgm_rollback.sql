@@ -0,0 +1,16 @@
+-- =============================================================================
+-- ROLLBACK Migration 045 : Index trigrammes pour la recherche des actualités et événements
+-- =============================================================================
+-- Note : l'extension pg_trgm est conservée (utilisée par la migration 039).
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_events_venue_trgm;
+DROP INDEX IF EXISTS idx_events_description_trgm;
+DROP INDEX IF EXISTS idx_events_title_trgm;
+
+DROP INDEX IF EXISTS idx_news_summary_trgm;
+DROP INDEX IF EXISTS idx_news_title_trgm;
+
+COMMIT;
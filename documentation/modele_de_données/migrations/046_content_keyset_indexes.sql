@@ -0,0 +1,26 @@
+-- =============================================================================
+-- Migration 046 : Index de tri pour la pagination par curseur des actualités et événements
+-- =============================================================================
+-- Contexte :
+--   - get_events trie par start_date DESC, get_news par published_at DESC
+--     NULLS LAST puis created_at DESC : idx_events_date et
+--     idx_news_published_at ne couvrent pas l'ordre complet, d'où un tri de
+--     toute la table filtrée avant le LIMIT, puis un OFFSET de plus en plus
+--     coûteux au fil des pages.
+--   - L'ordre inclut désormais id comme départage (ordre total stable), et
+--     get_events / get_news acceptent un curseur (dernière ligne de la page
+--     précédente) comparé en valeur de ligne : ces index composites dans le
+--     même sens servent le tri et le curseur par un simple parcours d'index.
+-- Idempotente : peut être exécutée plusieurs fois sans effet de bord.
+-- Source de vérité : services/09_content.sql.
+-- =============================================================================
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_events_start_date_id
+    ON events (start_date DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_news_published_created_id
+    ON news (published_at DESC NULLS LAST, created_at DESC, id DESC);
+
+COMMIT;
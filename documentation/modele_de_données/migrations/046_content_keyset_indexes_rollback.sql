@@ -0,0 +1,10 @@
+-- =============================================================================
+-- ROLLBACK Migration 046 : Index de tri pour la pagination par curseur des actualités et événements
+-- =============================================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_news_published_created_id;
+DROP INDEX IF EXISTS idx_events_start_date_id;
+
+COMMIT;
@@ -11,6 +11,7 @@
 -- ============================================================================
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- recherche ILIKE '%…%' indexée (GIN)
 
 -- ============================================================================
 -- TYPES ENUM PARTAGÉS
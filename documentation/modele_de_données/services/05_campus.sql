@@ -49,6 +49,15 @@ CREATE TABLE campuses (
 
 CREATE INDEX idx_campuses_country ON campuses(country_external_id);
 CREATE INDEX idx_campuses_code ON campuses(code);
+-- Unicité du code insensible à la casse (migration 043)
+CREATE UNIQUE INDEX uq_campuses_code_upper ON campuses (upper(code));
+-- Un seul siège principal (migration 044)
+CREATE UNIQUE INDEX uq_campuses_single_headquarters ON campuses (is_headquarters) WHERE is_headquarters;
+-- Recherche ILIKE '%…%' (get_campuses) : trigrammes, migration 042
+CREATE INDEX idx_campuses_code_trgm ON campuses USING gin (code gin_trgm_ops);
+CREATE INDEX idx_campuses_name_trgm ON campuses USING gin (name gin_trgm_ops);
+CREATE INDEX idx_campuses_city_trgm ON campuses USING gin (city gin_trgm_ops);
+CREATE INDEX idx_campuses_description_trgm ON campuses USING gin (description gin_trgm_ops);
 
 -- Relation campus <-> partenaires
 CREATE TABLE campus_partners (
@@ -73,6 +82,8 @@ CREATE TABLE campus_team (
 );
 
 CREATE INDEX idx_campus_team_user ON campus_team(user_external_id);
+-- Un utilisateur n'est actif qu'une fois par équipe (migration 041)
+CREATE UNIQUE INDEX uq_campus_team_active_user ON campus_team(campus_id, user_external_id) WHERE active;
 
 -- Médiathèque d'un campus (plusieurs albums possibles)
 CREATE TABLE campus_media_library (
@@ -75,6 +75,9 @@ CREATE INDEX idx_application_calls_slug ON application_calls(slug);
 CREATE INDEX idx_application_calls_program ON application_calls(program_external_id);
 CREATE INDEX idx_application_calls_country ON application_calls(country_external_id);
 CREATE INDEX idx_application_calls_project ON application_calls(project_external_id);
+-- Recherche ILIKE '%terme%' (get_calls) : index trigrammes
+CREATE INDEX idx_application_calls_title_trgm ON application_calls USING gin (title gin_trgm_ops);
+CREATE INDEX idx_application_calls_description_trgm ON application_calls USING gin (description_html gin_trgm_ops);
 
 -- Critères d'éligibilité d'un appel
 CREATE TABLE call_eligibility_criteria (
@@ -210,6 +213,15 @@ CREATE INDEX idx_applications_reference ON applications(reference_number);
 CREATE INDEX idx_applications_call ON applications(call_id);
 CREATE INDEX idx_applications_status ON applications(status);
 CREATE INDEX idx_applications_user ON applications(user_external_id);
+-- Recherche ILIKE '%terme%' (get_applications) : index trigrammes
+CREATE INDEX idx_applications_reference_trgm ON applications USING gin (reference_number gin_trgm_ops);
+CREATE INDEX idx_applications_last_name_trgm ON applications USING gin (last_name gin_trgm_ops);
+CREATE INDEX idx_applications_first_name_trgm ON applications USING gin (first_name gin_trgm_ops);
+CREATE INDEX idx_applications_email_trgm ON applications USING gin (email gin_trgm_ops);
+-- Recherche par préfixe sur la référence
+CREATE INDEX idx_applications_reference_pattern ON applications(reference_number text_pattern_ops);
+-- Liste triée + pagination keyset (submitted_at, id)
+CREATE INDEX idx_applications_submitted_keyset ON applications(submitted_at DESC, id DESC);
 
 -- Diplômes du candidat
 CREATE TABLE application_degrees (
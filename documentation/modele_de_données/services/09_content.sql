@@ -70,6 +70,12 @@ CREATE INDEX idx_events_type ON events(type);
 CREATE INDEX idx_events_slug ON events(slug);
 CREATE INDEX idx_events_campus ON events(campus_external_id);
 CREATE INDEX idx_events_service ON events(service_external_id);
+-- Recherche ILIKE '%…%' (get_events) : trigrammes, migration 045
+CREATE INDEX idx_events_title_trgm ON events USING gin (title gin_trgm_ops);
+CREATE INDEX idx_events_description_trgm ON events USING gin (description gin_trgm_ops);
+CREATE INDEX idx_events_venue_trgm ON events USING gin (venue gin_trgm_ops);
+-- Tri (start_date, id) DESC et pagination par curseur (get_events), migration 046
+CREATE INDEX idx_events_start_date_id ON events(start_date DESC, id DESC);
 
 -- Partenaires d'un événement
 CREATE TABLE event_partners (
@@ -161,6 +167,11 @@ CREATE INDEX idx_news_slug ON news(slug);
 CREATE INDEX idx_news_project ON news(project_external_id);
 CREATE INDEX idx_news_call ON news(call_external_id);
 CREATE INDEX idx_news_program ON news(program_external_id);
+-- Recherche ILIKE '%…%' (get_news) : trigrammes, migration 045
+CREATE INDEX idx_news_title_trgm ON news USING gin (title gin_trgm_ops);
+CREATE INDEX idx_news_summary_trgm ON news USING gin (summary gin_trgm_ops);
+-- Tri (published_at NULLS LAST, created_at, id) DESC et pagination par curseur (get_news), migration 046
+CREATE INDEX idx_news_published_created_id ON news(published_at DESC NULLS LAST, created_at DESC, id DESC);
 
 -- Photos d'une actualité
 CREATE TABLE news_media (
@@ -0,0 +1,90 @@
+"""
+Tests unitaires - Statistiques et cache des appels à candidature
+================================================================
+
+Exécute les requêtes (timeline generate_series, TTL du cache) sur PostgreSQL.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application import ApplicationCall, CallStatus, CallType
+from app.services.application_service import _PUBLISHED_CALLS_TTL, ApplicationService
+
+
+class TestExtendedStatisticsTimeline:
+    """La timeline est dense entre les bornes, pour chaque granularité."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("granularity", "date_from", "date_to", "periods"),
+        [
+            (
+                "month",
+                datetime(2026, 1, 10, 12, tzinfo=timezone.utc),
+                datetime(2026, 3, 5, 12, tzinfo=timezone.utc),
+                ["2026-01", "2026-02", "2026-03"],
+            ),
+            (
+                "week",
+                datetime(2026, 1, 6, 12, tzinfo=timezone.utc),
+                datetime(2026, 1, 20, 12, tzinfo=timezone.utc),
+                ["2026-01-05", "2026-01-12", "2026-01-19"],
+            ),
+            (
+                "day",
+                datetime(2026, 1, 10, 12, tzinfo=timezone.utc),
+                datetime(2026, 1, 12, 12, tzinfo=timezone.utc),
+                ["2026-01-10", "2026-01-11", "2026-01-12"],
+            ),
+        ],
+    )
+    async def test_timeline_is_dense(
+        self,
+        db_session: AsyncSession,
+        granularity: str,
+        date_from: datetime,
+        date_to: datetime,
+        periods: list[str],
+    ):
+        """Chaque période entre les bornes est renvoyée, à 0 sans candidature."""
+        service = ApplicationService(db_session)
+
+        stats = await service.get_extended_statistics(
+            date_from=date_from, date_to=date_to, granularity=granularity
+        )
+
+        assert stats["total"] == 0
+        assert stats["timeline"] == [{"period": p, "count": 0} for p in periods]
+
+
+class TestPublishedCallsCacheTtl:
+    """Le cache des appels publiés expire à la prochaine deadline."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_without_deadline_is_default(self, db_session: AsyncSession):
+        """Sans appel ouvert à échéance, le TTL par défaut s'applique."""
+        service = ApplicationService(db_session)
+
+        assert await service._published_calls_ttl() == _PUBLISHED_CALLS_TTL
+
+    @pytest.mark.asyncio
+    async def test_ttl_capped_by_next_deadline(self, db_session: AsyncSession):
+        """Un appel ouvert dont la deadline approche raccourcit le TTL."""
+        db_session.add(
+            ApplicationCall(
+                title="Bourse",
+                slug="bourse",
+                type=CallType.SCHOLARSHIP,
+                status=CallStatus.ONGOING,
+                deadline=datetime.now(timezone.utc) + timedelta(seconds=30),
+            )
+        )
+        await db_session.flush()
+        service = ApplicationService(db_session)
+
+        ttl = await service._published_calls_ttl()
+
+        assert 1 <= ttl <= 30
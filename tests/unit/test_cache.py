@@ -0,0 +1,57 @@
+"""
+Tests unitaires — Cache applicatif TTL
+======================================
+"""
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache, make_key
+
+
+@pytest.mark.unit
+def test_get_returns_value_before_expiry():
+    cache = TTLCache()
+    cache.set("stats:a", {"total": 3}, ttl=60)
+    assert cache.get("stats:a") == {"total": 3}
+
+
+@pytest.mark.unit
+def test_get_drops_expired_entry(monkeypatch):
+    cache = TTLCache()
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache.set("stats:a", 1, ttl=10)
+
+    now = 1011.0
+    assert cache.get("stats:a") is None
+
+
+@pytest.mark.unit
+def test_set_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a:1", 1, ttl=60)
+    cache.set("a:2", 2, ttl=60)
+    cache.get("a:1")
+    cache.set("a:3", 3, ttl=60)
+
+    assert cache.get("a:2") is None
+    assert cache.get("a:1") == 1
+    assert cache.get("a:3") == 3
+
+
+@pytest.mark.unit
+def test_invalidate_only_targets_namespace():
+    cache = TTLCache()
+    cache.set(make_key("published_calls", {"call_type": "training"}), [1], ttl=60)
+    cache.set(make_key("app_stats", None), {"total": 0}, ttl=60)
+
+    cache.invalidate("published_calls")
+
+    assert cache.get(make_key("published_calls", {"call_type": "training"})) is None
+    assert cache.get(make_key("app_stats", None)) == {"total": 0}
+
+
+@pytest.mark.unit
+def test_make_key_ignores_dict_order():
+    assert make_key("ns", {"a": 1, "b": 2}) == make_key("ns", {"b": 2, "a": 1})
@@ -0,0 +1,69 @@
+"""
+Tests unitaires — Normalisation et unicité du code campus
+==========================================================
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.exceptions import ConflictException
+from app.models.campus import Campus
+from app.services import campus_service
+from app.services.campus_service import CampusService, _campus_conflict
+
+
+@pytest.mark.unit
+def test_code_is_uppercased_on_construction():
+    assert Campus(code="dkr", name="Dakar").code == "DKR"
+
+
+@pytest.mark.unit
+def test_code_is_uppercased_on_assignment():
+    campus = Campus(code="DKR", name="Dakar")
+    campus.code = "abj"
+    assert campus.code == "ABJ"
+
+
+@pytest.mark.unit
+def test_headquarters_violation_becomes_conflict():
+    exc = IntegrityError(
+        "INSERT INTO campuses ...",
+        {},
+        Exception(
+            'duplicate key value violates unique constraint '
+            '"uq_campuses_single_headquarters"'
+        ),
+    )
+    conflict = _campus_conflict(exc)
+    assert conflict is not None
+    assert conflict.detail == "Un siège principal existe déjà"
+
+
+@pytest.mark.unit
+def test_unrelated_violation_is_not_translated():
+    exc = IntegrityError(
+        "INSERT INTO campuses ...",
+        {},
+        Exception('violates foreign key constraint "campus_team_campus_id_fkey"'),
+    )
+    assert _campus_conflict(exc) is None
+
+
+@pytest.mark.unit
+async def test_team_member_reactivation_conflict(monkeypatch):
+    update_returning = AsyncMock(
+        side_effect=IntegrityError(
+            "UPDATE campus_team ...",
+            {},
+            Exception(
+                'duplicate key value violates unique constraint '
+                '"uq_campus_team_active_user"'
+            ),
+        )
+    )
+    monkeypatch.setattr(campus_service, "update_returning", update_returning)
+    with pytest.raises(ConflictException) as exc_info:
+        await CampusService(MagicMock()).toggle_team_member_active("member-id")
+    assert exc_info.value.detail == "Cet utilisateur est déjà dans l'équipe du campus"
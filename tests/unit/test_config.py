@@ -0,0 +1,23 @@
+"""
+Tests unitaires — URL de connexion asyncpg
+==========================================
+"""
+
+import pytest
+
+from app.config import Settings
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgresql://u:p@db:5432/usenghor",
+        "postgres://u:p@db:5432/usenghor",
+        "postgresql+psycopg2://u:p@db:5432/usenghor",
+        "postgresql+asyncpg://u:p@db:5432/usenghor",
+    ],
+)
+def test_database_url_is_forced_to_asyncpg(url):
+    settings = Settings(database_url=url)
+    assert settings.database_url_async == "postgresql+asyncpg://u:p@db:5432/usenghor"
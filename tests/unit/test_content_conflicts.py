@@ -0,0 +1,33 @@
+"""
+Tests unitaires — Traduction des violations d'unicité (tags, événements, actualités)
+===================================================================================
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.content_service import ContentService, _unique_conflict
+
+
+def _violation(constraint: str) -> IntegrityError:
+    return IntegrityError(
+        "INSERT INTO tags ...",
+        {},
+        Exception(f'duplicate key value violates unique constraint "{constraint}"'),
+    )
+
+
+@pytest.mark.unit
+def test_tag_name_violation_names_the_offending_value():
+    conflict = _unique_conflict(
+        _violation("tags_name_key"), ContentService._tag_conflicts("Climat", "climat")
+    )
+    assert conflict is not None
+    assert conflict.detail == "Un tag avec le nom 'Climat' existe déjà"
+
+
+@pytest.mark.unit
+def test_unlisted_constraint_is_not_translated():
+    assert _unique_conflict(
+        _violation("news_tags_tag_id_fkey"), ContentService._tag_conflicts("a", "a")
+    ) is None
@@ -0,0 +1,90 @@
+"""
+Tests unitaires — Bornes mensuelles des statistiques de contenu
+===============================================================
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import PublicationStatus
+from app.models.content import Event, EventType, News
+from app.services.content_service import (
+    _EVENT_TIMELINE,
+    _NEWS_TIMELINE,
+    ContentService,
+    month_buckets,
+)
+
+
+@pytest.mark.unit
+def test_buckets_cover_current_month_and_cross_year():
+    assert month_buckets(datetime(2026, 1, 31, 13, 5), 3) == [
+        datetime(2025, 11, 1),
+        datetime(2025, 12, 1),
+        datetime(2026, 1, 1),
+        datetime(2026, 2, 1),
+    ]
+
+
+@pytest.mark.unit
+def test_single_month_bounds_current_month():
+    assert month_buckets(datetime(2026, 12, 15), 1) == [
+        datetime(2026, 12, 1),
+        datetime(2027, 1, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_event_timeline_runs_and_fills_empty_months(db_session: AsyncSession):
+    db_session.add(
+        Event(
+            title="Conférence",
+            slug="conference",
+            type=EventType.CONFERENCE,
+            start_date=datetime(2026, 2, 10, tzinfo=timezone.utc),
+        )
+    )
+    await db_session.flush()
+
+    timeline = await ContentService(db_session)._monthly_timeline(
+        _EVENT_TIMELINE, datetime(2026, 3, 15, tzinfo=timezone.utc), 3
+    )
+
+    assert timeline == [
+        {"period": "2026-01", "count": 0},
+        {"period": "2026-02", "count": 1},
+        {"period": "2026-03", "count": 0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_news_timeline_counts_published_only(db_session: AsyncSession):
+    published_at = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    db_session.add_all(
+        [
+            News(
+                title="Publiée",
+                slug="publiee",
+                status=PublicationStatus.PUBLISHED,
+                published_at=published_at,
+            ),
+            News(
+                title="Brouillon",
+                slug="brouillon",
+                status=PublicationStatus.DRAFT,
+                published_at=published_at,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    timeline = await ContentService(db_session)._monthly_timeline(
+        _NEWS_TIMELINE, datetime(2026, 3, 15, tzinfo=timezone.utc), 2
+    )
+
+    assert timeline == [
+        {"period": "2026-02", "count": 0},
+        {"period": "2026-03", "count": 1},
+    ]
@@ -0,0 +1,22 @@
+"""
+Tests unitaires — Écritures par clé primaire
+============================================
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.models.content import Tag
+from app.services.row_writes import update_returning
+
+
+@pytest.mark.unit
+async def test_update_rejects_unknown_columns():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    with pytest.raises(ValidationException) as exc_info:
+        await update_returning(db, Tag, "tag-id", {"name": "x", "news_items": []})
+    assert exc_info.value.detail == "Champs inconnus : news_items"
+    db.execute.assert_not_called()